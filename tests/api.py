@@ -0,0 +1,186 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import valorant
+
+from . import payloads
+
+# A stand-in for valorant-api.com and its media CDN, served on a local port.
+
+# The locales the stand-in translates into. Text in a locale is the en-US text suffixed with it.
+LOCALES: Tuple[str, ...] = ('en-US', 'ja-JP')
+_LOCALIZED_KEYS: Tuple[str, ...] = ('displayName', 'description')
+
+Handler = Callable[[web.Request], Awaitable[Optional[web.StreamResponse]]]
+
+
+def _localize(value: Any, language: str) -> Any:
+    # Rewrites the localized fields of a payload and the payloads nested in it.
+    if isinstance(value, list):
+        return [_localize(item, language) for item in value]
+    if not isinstance(value, dict):
+        return value
+    
+    result = {}
+    for key, item in value.items():
+        if key in _LOCALIZED_KEYS and isinstance(item, str):
+            if language == 'all':
+                result[key] = {locale: f'{item}-{locale}' for locale in LOCALES}
+            else:
+                result[key] = f'{item}-{language}'
+        else:
+            result[key] = _localize(item, language)
+            
+    return result
+
+
+class FakeAPI:
+    """
+    Serves the catalogue of :mod:`tests.payloads` under ``/v1`` and media under ``/media``.
+    
+    Every request is recorded in ``requests`` as ``(path, query)``. A request can be
+    answered differently by setting ``hook``, which returns a response or ``None`` to
+    fall through to the catalogue. Media bodies are sent ``media_chunk`` bytes at a time,
+    with an ETag, and honour ``Range`` and ``If-Range``. Past ``media_pause`` bytes, each
+    chunk waits for ``media_gate`` to be set, and ``media_paused`` is set while one does.
+    """
+    
+    def __init__(self, *, agents: int = 4, buddies: int = 4, levels: int = 2, ceremonies: int = 2) -> None:
+        buddy_payloads = [payloads.buddy(index, levels) for index in range(buddies)]
+        self.collections: Dict[str, List[Dict[str, Any]]] = {
+            'agents': [payloads.agent(index) for index in range(agents)],
+            'buddies': buddy_payloads,
+            'buddies/levels': [level for buddy in buddy_payloads for level in buddy['levels']],
+            'ceremonies': [payloads.ceremony(index) for index in range(ceremonies)],
+        }
+        self.version: Dict[str, Any] = payloads.version('M1')
+        self.media: Dict[str, bytes] = {}
+        self.media_chunk: int = 1024
+        self.media_pause: int = 0
+        self.media_paused: asyncio.Event = asyncio.Event()
+        self.media_gate: asyncio.Event = asyncio.Event()
+        self.media_gate.set()
+        self.hook: Optional[Handler] = None
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        
+        app = web.Application()
+        app.router.add_get('/v1/{path:.*}', self._api)
+        app.router.add_get('/media/{path:.*}', self._media)
+        self.server: TestServer = TestServer(app)
+        
+    async def __aenter__(self) -> FakeAPI:
+        await self.server.start_server()
+        return self
+    
+    async def __aexit__(self, *args: Any) -> None:
+        self.media_gate.set()
+        await self.server.close()
+        
+    @property
+    def base(self) -> str:
+        return str(self.server.make_url('/v1'))
+    
+    @property
+    def media_base(self) -> str:
+        return str(self.server.make_url('/media'))
+    
+    def paths(self) -> List[str]:
+        return [path for path, _ in self.requests]
+        
+    async def _api(self, request: web.Request) -> web.StreamResponse:
+        path = request.match_info['path'].strip('/')
+        self.requests.append((path, dict(request.query)))
+        if self.hook is not None:
+            response = await self.hook(request)
+            if response is not None:
+                return response
+        
+        if path == 'version':
+            return web.json_response({'status': 200, 'data': self.version})
+        
+        language = request.query.get('language')
+        for kind, items in self.collections.items():
+            if path == kind:
+                data: Any = items
+            elif path.startswith(f'{kind}/') and path.count('/') == kind.count('/') + 1:
+                uuid = path.rsplit('/', 1)[1]
+                data = next((item for item in items if item['uuid'] == uuid), None)
+                if data is None:
+                    return web.json_response({'status': 404, 'error': f'{uuid} not found'}, status=404)
+            else:
+                continue
+            
+            data = _localize(data, language) if language else copy.deepcopy(data)
+            return web.json_response({'status': 200, 'data': data})
+        
+        return web.json_response({'status': 404, 'error': 'not found'}, status=404)
+    
+    async def _media(self, request: web.Request) -> web.StreamResponse:
+        path = request.match_info['path']
+        self.requests.append((f'media/{path}', {key: request.headers[key] for key in ('Range', 'If-Range') if key in request.headers}))
+        body = self.media.get(path)
+        if body is None:
+            raise web.HTTPNotFound()
+        
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        offset = 0
+        ranged = request.headers.get('Range', '').startswith('bytes=')
+        if ranged and request.headers.get('If-Range', etag) == etag:
+            offset = int(request.headers['Range'][len('bytes='):].partition('-')[0])
+            
+        response = web.StreamResponse(status=206 if offset else 200, headers={'ETag': etag})
+        response.content_length = len(body) - offset
+        await response.prepare(request)
+        for start in range(offset, len(body), self.media_chunk):
+            if start >= self.media_pause and not self.media_gate.is_set():
+                self.media_paused.set()
+                await self.media_gate.wait()
+            await response.write(body[start:start + self.media_chunk])
+            
+        await response.write_eof()
+        return response
+
+
+@asynccontextmanager
+async def client_for(*apis: FakeAPI, **kwargs: Any) -> AsyncIterator[valorant.ValorantClient]:
+    # A client sending every request to the stand-ins, in the order given.
+    kwargs.setdefault('api_bases', [api.base for api in apis])
+    kwargs.setdefault('media_bases', [api.media_base for api in apis])
+    async with aiohttp.ClientSession() as session:
+        client = valorant.ValorantClient('token', session=session, **kwargs)
+        try:
+            yield client
+        finally:
+            await client.close()
@@ -0,0 +1,50 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, List, Optional, Tuple
+
+# Measurements reported at the end of the run, as (name, value, budget, unit).
+FOOTPRINT: List[Tuple[str, float, int, str]] = []
+
+
+def pytest_pyfunc_call(pyfuncitem: Any) -> Optional[bool]:
+    # Coroutine tests each run in a fresh event loop.
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    asyncio.run(asyncio.wait_for(pyfuncitem.obj(**arguments), 30))
+    return True
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if not FOOTPRINT:
+        return
+    
+    terminalreporter.section('footprint')
+    for name, value, budget, unit in FOOTPRINT:
+        terminalreporter.write_line(f'{name:<40} {value:>12,.0f} {unit} (budget {budget:,})')
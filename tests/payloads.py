@@ -0,0 +1,120 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict
+
+# Payloads shaped like the API's, with predictable uuids.
+
+MEDIA = 'https://media.valorant-api.com/'
+
+
+def agent(index: int = 0) -> Dict[str, Any]:
+    key = str(uuid.UUID(int=index + 1000))
+    role = '1b47567f-8f7b-444b-aae3-b0c634622d10'
+    return {
+        'uuid': key,
+        'displayName': f'Agent{index}',
+        'description': 'An agent.',
+        'developerName': f'Developer{index}',
+        'characterTags': None,
+        'displayIcon': f'{MEDIA}agents/{key}/displayicon.png',
+        'displayIconSmall': f'{MEDIA}agents/{key}/displayiconsmall.png',
+        'bustPortrait': f'{MEDIA}agents/{key}/bustportrait.png',
+        'fullPortrait': f'{MEDIA}agents/{key}/fullportrait.png',
+        'killfeedPortrait': f'{MEDIA}agents/{key}/killfeedportrait.png',
+        'background': f'{MEDIA}agents/{key}/background.png',
+        'assetPath': 'ShooterGame/Content/Characters/Agent',
+        'isFullPortraitRightFacing': False,
+        'isPlayableCharacter': True,
+        'isAvailableForTest': True,
+        'isBaseContent': False,
+        'role': {
+            'uuid': role,
+            'displayName': 'Initiator',
+            'description': 'A role.',
+            'displayIcon': f'{MEDIA}agents/roles/{role}/displayicon.png',
+            'assetPath': 'ShooterGame/Content/Characters/Role',
+        },
+        'abilities': [
+            {
+                'slot': f'Ability{slot}',
+                'displayName': f'Ability{slot}',
+                'description': 'An ability.',
+                'displayIcon': f'{MEDIA}agents/{key}/abilities/ability{slot}/displayicon.png',
+            }
+            for slot in range(4)
+        ],
+        'voiceLine': {
+            'minDuration': 1.0,
+            'maxDuration': 2.0,
+            'mediaList': [{'id': 1, 'wwise': f'{MEDIA}sounds/1.wem', 'wave': f'{MEDIA}sounds/1.wav'}],
+        },
+    }
+
+
+def buddy(index: int = 0, levels: int = 1) -> Dict[str, Any]:
+    key = str(uuid.UUID(int=index + 50000))
+    return {
+        'uuid': key,
+        'displayName': f'Buddy{index}',
+        'isHiddenIfNotOwned': False,
+        'themeUuid': None,
+        'displayIcon': f'{MEDIA}buddies/{key}/displayicon.png',
+        'assetPath': 'ShooterGame/Content/Equippables/Buddies',
+        'levels': [buddy_level(index * 10 + level) for level in range(levels)],
+    }
+
+
+def buddy_level(index: int = 0) -> Dict[str, Any]:
+    key = str(uuid.UUID(int=index + 900000))
+    return {
+        'uuid': key,
+        'charmLevel': 1,
+        'displayName': f'Level{index}',
+        'displayIcon': f'{MEDIA}buddylevels/{key}/displayicon.png',
+        'assetPath': 'ShooterGame/Content/Equippables/Buddies/Levels',
+    }
+
+
+def ceremony(index: int = 0) -> Dict[str, Any]:
+    return {
+        'uuid': str(uuid.UUID(int=index + 7000)),
+        'displayName': f'Ceremony{index}',
+        'assetPath': 'ShooterGame/Content/Ceremonies',
+    }
+
+
+def version(manifest_id: str) -> Dict[str, Any]:
+    return {
+        'manifestId': manifest_id,
+        'branch': 'release-05.00',
+        'version': '05.00.00.1',
+        'buildVersion': '1',
+        'engineVersion': '4.26',
+        'riotClientVersion': 'release-05.00-shipping-1',
+        'riotClientBuild': '1',
+        'buildDate': '2022-07-12T00:00:00Z',
+    }
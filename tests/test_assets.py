@@ -0,0 +1,90 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import os
+import asyncio
+import contextlib
+
+import pytest
+
+from valorant import AssetDownloader, AssetStore
+
+from . import payloads
+from .api import FakeAPI, client_for
+
+URL = f'{payloads.MEDIA}icon.png'
+
+
+async def _interrupt(downloader: AssetDownloader, api: FakeAPI, at: int) -> str:
+    # Starts downloading URL and cancels it once ``at`` bytes have been sent.
+    partial = downloader.store._partial_path(URL)
+    api.media_pause = at
+    api.media_gate.clear()
+    api.media_paused.clear()
+    task = asyncio.ensure_future(downloader.fetch(URL))
+    await api.media_paused.wait()
+    await asyncio.sleep(0.1)
+        
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+        
+    api.media_gate.set()
+    assert os.path.getsize(partial) == at
+    return partial
+
+
+@pytest.mark.parametrize('changed', [False, True], ids=['same', 'changed'])
+async def test_resume_only_appends_to_the_same_file(tmp_path: str, changed: bool) -> None:
+    old, new = os.urandom(8192), os.urandom(8192)
+    async with FakeAPI() as api:
+        api.media['icon.png'] = old
+        async with client_for(api) as client:
+            downloader = AssetDownloader(client.http, AssetStore(tmp_path), chunk_size=1024)
+            await _interrupt(downloader, api, 2048)
+            if changed:
+                api.media['icon.png'] = new
+                
+            path = await downloader.fetch(URL)
+            
+    with open(path, 'rb') as fp:
+        assert fp.read() == (new if changed else old)
+        
+    headers = api.requests[-1][1]
+    assert headers['Range'].startswith('bytes=')
+    assert 'If-Range' in headers
+
+
+async def test_stamping_a_new_version_discards_partial_files(tmp_path: str) -> None:
+    async with FakeAPI() as api:
+        api.media['icon.png'] = os.urandom(8192)
+        async with client_for(api) as client:
+            store = AssetStore(tmp_path)
+            store.stamp('M1')
+            partial = await _interrupt(AssetDownloader(client.http, store, chunk_size=1024), api, 2048)
+            
+    assert os.path.exists(partial)
+    assert store.stamp('M2')
+    assert os.listdir(os.path.join(tmp_path, 'partial')) == []
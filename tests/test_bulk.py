@@ -0,0 +1,104 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from valorant import Language, NotFound
+
+from . import payloads
+from .api import FakeAPI, client_for
+
+
+async def test_bulk_fetch_treats_other_languages_as_misses() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api) as client:
+            uuids = [item['uuid'] for item in api.collections['agents'][:2]]
+            await client.fetch_agents()
+            
+            api.requests.clear()
+            cached = await client.fetch_agents_by_uuids(uuids)
+            assert [agent.display_name for agent in cached] == ['Agent0', 'Agent1']
+            assert not api.requests
+            
+            japanese = await client.fetch_agents_by_uuids(uuids, language=Language.jaJP)
+            assert [agent.display_name for agent in japanese] == ['Agent0-ja-JP', 'Agent1-ja-JP']
+            assert sorted(api.paths()) == sorted(f'agents/{uuid}' for uuid in uuids)
+            
+            api.requests.clear()
+            everything = await client.fetch_agents_by_uuids(uuids, language=Language.all, threshold=1)
+            assert everything.items[1].display_name_for(Language.jaJP) == 'Agent1-ja-JP'
+            assert api.requests == [('agents', {'language': 'all'})]
+
+
+async def test_prefetch_of_many_languages_fetches_every_locale_once() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api) as client:
+            summary = await client.prefetch(kinds=['agents', 'ceremonies'], languages=iter([None, Language.jaJP]))
+            assert sorted(summary.counts) == [('agents', Language.all), ('ceremonies', Language.all)]
+            assert sorted(api.requests) == [('agents', {'language': 'all'}), ('ceremonies', {'language': 'all'})]
+            
+            agent = client._connection._get_agent(api.collections['agents'][0]['uuid'])
+            assert agent.display_name == 'Agent0-en-US'
+            assert agent.display_name_for(Language.jaJP) == 'Agent0-ja-JP'
+
+
+async def test_concurrent_fetches_are_batched_into_one_request() -> None:
+    async with FakeAPI(agents=6) as api:
+        async with client_for(api, batch_window=0.05) as client:
+            uuids = [item['uuid'] for item in api.collections['agents'][:5]]
+            agents = await asyncio.gather(*(client.fetch_agent(uuid) for uuid in uuids), client.fetch_agent(uuids[0]))
+            assert [agent.uuid for agent in agents] == uuids + [uuids[0]]
+            assert api.requests == [('agents', {})]
+            
+            # Cached now, so answered without a request.
+            api.requests.clear()
+            await asyncio.gather(*(client.fetch_agent(uuid) for uuid in uuids))
+            assert not api.requests
+
+
+async def test_small_batches_are_fetched_one_by_one() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api, batch_window=0.05) as client:
+            uuids = [item['uuid'] for item in api.collections['agents'][:2]]
+            agents = await asyncio.gather(*(client.fetch_agent(uuid) for uuid in uuids))
+            assert [agent.uuid for agent in agents] == uuids
+            assert sorted(api.paths()) == sorted(f'agents/{uuid}' for uuid in uuids)
+
+
+async def test_batched_fetch_of_a_missing_uuid_raises_not_found() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api, batch_window=0.05) as client:
+            uuids = [item['uuid'] for item in api.collections['agents']]
+            missing = payloads.agent(99)['uuid']
+            results = await asyncio.gather(*(client.fetch_agent(uuid) for uuid in uuids + [missing]), return_exceptions=True)
+            
+            assert [agent.uuid for agent in results[:-1]] == uuids
+            assert isinstance(results[-1], NotFound)
+            assert api.paths() == ['agents', f'agents/{missing}']
+            
+            with pytest.raises(NotFound):
+                await client.fetch_agent(missing)
@@ -0,0 +1,68 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List
+
+from valorant import EventQueue, OverflowPolicy
+
+from .api import FakeAPI, client_for
+
+
+async def test_handlers_on_a_full_queue_can_make_requests() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api, event_queue_size=1, event_workers=1, event_overflow=OverflowPolicy.block) as client:
+            done = asyncio.Event()
+            calls = 0
+            
+            async def on_request(*args: Any) -> None:
+                nonlocal calls
+                calls += 1
+                if calls == 1:
+                    # The first request's event fills the queue, the second must not wait for room.
+                    await client.fetch_version()
+                    await client.fetch_version()
+                    done.set()
+                    
+            client.add_listener(on_request)
+            await client.fetch_agents()
+            await asyncio.wait_for(done.wait(), 2)
+
+
+async def test_closed_queue_drops_events() -> None:
+    handled: List[str] = []
+    
+    async def run(coro: Any, name: str, *args: Any, **kwargs: Any) -> None:
+        handled.append(name)
+        
+    queue = EventQueue(run, maxsize=4, workers=1, overflow=OverflowPolicy.block)
+    assert queue.put((run, 'first', (), {}))
+    await queue.join()
+    
+    queue.close()
+    assert not queue.put((run, 'second', (), {}))
+    await asyncio.sleep(0)
+    assert handled == ['first']
+    assert queue.metrics.dropped == 1
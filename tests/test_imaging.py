@@ -0,0 +1,48 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from valorant import ImagePipeline, ImageSpec
+
+Image = pytest.importorskip('PIL.Image')
+
+
+@pytest.mark.parametrize('fmt, expected', [('jpg', 'JPEG'), ('JPEG', 'JPEG'), ('webp', 'WEBP'), ('png', 'PNG')])
+async def test_render_derivative(tmp_path: str, fmt: str, expected: str) -> None:
+    source = os.path.join(tmp_path, 'icon.png')
+    Image.new('RGBA', (256, 128), (255, 0, 0, 128)).save(source)
+    
+    with ThreadPoolExecutor(1) as executor:
+        async with ImagePipeline(os.path.join(tmp_path, 'derivatives'), executor=executor) as pipeline:
+            path = await pipeline.render(source, ImageSpec(64, 64, fmt))
+            
+    assert path.endswith(f'.{fmt.lower()}')
+    with Image.open(path) as image:
+        assert image.format == expected
+        assert image.size == (64, 32)
@@ -0,0 +1,91 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import subprocess
+from typing import Dict, Set
+
+from .conftest import FOOTPRINT
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A bare import only loads the package's __init__, whatever a submodule pulls in.
+IMPORT_BUDGET_US = 100_000
+# ...and stays a small fraction of loading the client and everything it needs.
+IMPORT_FRACTION = 0.25
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    # Cumulative microseconds per module, as reported by -X importtime.
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+        
+    return times
+
+
+def _loaded(statement: str) -> Set[str]:
+    result = subprocess.run(
+        [sys.executable, '-c', f'{statement}; import sys; print(" ".join(sys.modules))'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_bare_import_is_lazy() -> None:
+    loaded = _loaded('import valorant')
+    for module in ('aiohttp', 'numpy', 'valorant.client', 'valorant.http', 'valorant.state'):
+        assert module not in loaded, f'import valorant loads {module}'
+        
+        
+def test_models_load_without_aiohttp() -> None:
+    loaded = _loaded('import valorant.agent, valorant.buddy, valorant.ceremony')
+    assert 'aiohttp' not in loaded
+    assert 'numpy' not in loaded
+    
+
+def test_import_time() -> None:
+    # The fastest of a few runs, to keep a busy machine from failing the test.
+    bare = min(_import_times('import valorant')['valorant'] for _ in range(3))
+    full = min(_import_times('import valorant.client')['valorant.client'] for _ in range(3))
+    
+    FOOTPRINT.append(('import valorant', bare, IMPORT_BUDGET_US, 'us'))
+    assert bare <= IMPORT_BUDGET_US, f'import valorant took {bare}us, the budget is {IMPORT_BUDGET_US}us'
+    assert bare <= full * IMPORT_FRACTION, f'import valorant took {bare}us, importing the client takes {full}us'
@@ -0,0 +1,79 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+from valorant import Language
+
+from . import payloads
+from .api import FakeAPI, client_for
+
+
+async def test_single_language_fetch_is_not_answered_by_every_locale() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api) as client:
+            everything = await client.fetch_agents(language=Language.all)
+            assert everything[0].display_name == 'Agent0-en-US'
+            
+            japanese = await client.fetch_agents(language=Language.jaJP)
+            assert japanese[0].display_name == 'Agent0-ja-JP'
+            assert japanese[0].display_name_for(Language.enUS) is None
+            
+            # The default language is en-US, which a model with every locale does answer for.
+            await client.fetch_agents(language=Language.all)
+            default = await client.fetch_agents()
+            assert default[0].display_name_for(Language.jaJP) == 'Agent0-ja-JP'
+
+
+async def test_refresh_reloads_in_the_cached_languages() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api) as client:
+            assert await client.refresh()
+            await client.fetch_agents(language=Language.all)
+            await client.fetch_buddies(language=Language.jaJP)
+            agent_uuid = api.collections['agents'][0]['uuid']
+            buddy_uuid = api.collections['buddies'][0]['uuid']
+            
+            api.version = payloads.version('M2')
+            api.requests.clear()
+            assert await client.refresh()
+            
+            assert ('agents', {'language': 'all'}) in api.requests
+            assert ('buddies', {'language': 'ja-JP'}) in api.requests
+            assert client._connection._get_agent(agent_uuid).display_name_for(Language.jaJP) == 'Agent0-ja-JP'
+            assert client._connection._get_buddy(buddy_uuid).display_name == 'Buddy0-ja-JP'
+
+
+async def test_nested_models_are_tagged_without_touching_the_payload() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api) as client:
+            agent = await client.fetch_agent(api.collections['agents'][0]['uuid'], language=Language.jaJP)
+            for model in (agent, agent.role, agent.abilities[0]):
+                assert model.description_for(Language.jaJP) is not None
+                assert model.description_for(Language.enUS) is None
+            
+    data = payloads.agent(9)
+    data['_locale'] = 'ja-JP'
+    agent = client._connection._store_agent(data)
+    assert agent.role.display_name_for(Language.jaJP) == 'Initiator'
+    assert '_locale' not in data['role'] and all('_locale' not in ability for ability in data['abilities'])
@@ -0,0 +1,162 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from typing import Any, Callable, List, Sequence
+
+import pytest
+
+from valorant.abc import Hashable
+from valorant.media import Icon
+from valorant.state import ConnectionState
+
+from . import payloads
+from .conftest import FOOTPRINT
+
+# Bytes allocated per stored model, payloads excluded. Raise a budget only
+# together with the change that needs it.
+BUDGETS = {
+    'agent': 4400,
+    'buddy': 2750,  # with 4 levels and their icons
+    'buddy_level': 540,
+    'ceremony': 200,
+}
+LAZY_BUDGETS = {
+    'agent': 400,
+    'buddy': 270,
+    'buddy_level': 240,
+    'ceremony': 200,
+}
+# 25 agents, 500 buddies with 4 levels each and 20 ceremonies.
+CATALOGUE_BUDGET = 1_500_000
+
+PAYLOADS = {
+    'agent': lambda: [payloads.agent(index) for index in range(200)],
+    'buddy': lambda: [payloads.buddy(index, 4) for index in range(1000)],
+    'buddy_level': lambda: [payloads.buddy_level(index) for index in range(1000)],
+    'ceremony': lambda: [payloads.ceremony(index) for index in range(1000)],
+}
+
+
+def _state(lazy: bool = False) -> ConnectionState:
+    return ConnectionState(dispatch=lambda *args: None, http=None, lazy=lazy)  # type: ignore
+
+
+def _allocated(build: Callable[[], Any]) -> int:
+    # Icons are interned across states, start from an empty pool so every run measures the same.
+    Icon._pool.clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+        
+    del kept
+    return used
+
+
+def _store_all(state: ConnectionState, kind: str, data: Sequence[Any]) -> List[Any]:
+    store = getattr(state, f'_store_{kind}')
+    return [store(payload) for payload in data]
+
+
+def _models(state: ConnectionState) -> List[Any]:
+    agent = state._store_agent(payloads.agent())
+    buddy = state._store_buddy(payloads.buddy(levels=2))
+    ceremony = state._store_ceremony(payloads.ceremony())
+    return [
+        agent,
+        agent.role,
+        agent.abilities[0],
+        agent.voice_line,
+        agent.voice_line.media[0],
+        agent.display_icon,
+        buddy,
+        buddy.levels[0],
+        ceremony,
+    ]
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_models_have_no_instance_dict(lazy: bool) -> None:
+    for model in _models(_state(lazy)):
+        assert not hasattr(model, '__dict__'), type(model).__name__
+
+
+def test_raw_payload_is_only_kept_while_lazy() -> None:
+    for model in _models(_state()):
+        assert not hasattr(model, '_data'), type(model).__name__
+        
+    agent = _state(lazy=True)._store_agent(payloads.agent())
+    assert hasattr(agent, '_data')
+    for name in ('display_icon', 'display_icon_small', 'bust_portrait', 'full_portrait', 'kill_feed_portrait', 'background', 'role', 'abilities'):
+        getattr(agent, name)
+        assert hasattr(agent, '_data')
+        
+    agent.voice_line
+    assert not hasattr(agent, '_data')
+
+
+def test_models_compare_and_hash_by_uuid() -> None:
+    first, second = _state(), _state()
+    for one, other in zip(_models(first), _models(second)):
+        if not isinstance(one, Hashable):
+            continue
+        
+        assert one is not other or isinstance(one, Icon)
+        assert one == other
+        assert hash(one) == hash(other)
+        
+    assert first._store_ceremony(payloads.ceremony(1)) != first._store_ceremony(payloads.ceremony(2))
+
+
+@pytest.mark.parametrize('lazy', [False, True], ids=['eager', 'lazy'])
+@pytest.mark.parametrize('kind', list(BUDGETS))
+def test_bytes_per_object(kind: str, lazy: bool) -> None:
+    data = PAYLOADS[kind]()
+    state = _state(lazy)
+    used = _allocated(lambda: _store_all(state, kind, data)) / len(data)
+    budget = (LAZY_BUDGETS if lazy else BUDGETS)[kind]
+    
+    FOOTPRINT.append((f'{kind} ({"lazy" if lazy else "eager"})', used, budget, 'bytes'))
+    assert used <= budget, f'{kind} uses {used:.0f} bytes per object, the budget is {budget}'
+    
+
+def test_catalogue_footprint() -> None:
+    agents = [payloads.agent(index) for index in range(25)]
+    buddies = [payloads.buddy(index, 4) for index in range(500)]
+    ceremonies = [payloads.ceremony(index) for index in range(20)]
+    state = _state()
+    
+    def build() -> List[Any]:
+        return _store_all(state, 'agent', agents) + _store_all(state, 'buddy', buddies) + _store_all(state, 'ceremony', ceremonies)
+    
+    used = _allocated(build)
+    FOOTPRINT.append(('catalogue', used, CATALOGUE_BUDGET, 'bytes'))
+    assert used <= CATALOGUE_BUDGET, f'the catalogue uses {used} bytes, the budget is {CATALOGUE_BUDGET}'
@@ -0,0 +1,96 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from valorant import InternalServerError, RetryPolicy
+
+from .api import FakeAPI, client_for
+
+
+async def _unavailable(request: web.Request) -> web.StreamResponse:
+    return web.json_response({'status': 503, 'error': 'unavailable'}, status=503)
+
+
+async def test_failing_mirror_is_skipped_until_it_recovers() -> None:
+    async with FakeAPI() as first, FakeAPI() as second:
+        async with client_for(first, second, retry_policy=RetryPolicy(base=0.01)) as client:
+            pool = client.http.api_mirrors
+            assert pool is not None
+            pool.cooldown = 0.2
+            uuids = [item['uuid'] for item in first.collections['agents']]
+            
+            first.hook = _unavailable
+            agent = await client.fetch_agent(uuids[0])
+            assert agent.uuid == uuids[0]
+            assert first.paths() == [f'agents/{uuids[0]}']
+            assert second.paths() == [f'agents/{uuids[0]}']
+            assert not pool.mirrors[0].healthy
+            assert [mirror.base for mirror in pool.candidates()] == [second.base, first.base]
+            
+            # Skipped while cooling down, even though it would answer now.
+            first.hook = None
+            await client.fetch_agent(uuids[1])
+            assert first.paths() == [f'agents/{uuids[0]}']
+            assert second.paths()[-1] == f'agents/{uuids[1]}'
+            
+            await asyncio.sleep(0.25)
+            assert pool.mirrors[0].healthy
+            await client.fetch_agent(uuids[2])
+            assert first.paths()[-1] == f'agents/{uuids[2]}'
+            assert pool.mirrors[0].failures == 0
+
+
+async def test_unreachable_mirror_fails_over() -> None:
+    # Nothing listens on a closed stand-in's port any more.
+    async with FakeAPI() as dead:
+        base = dead.base
+    
+    async with FakeAPI() as api:
+        async with client_for(api, api_bases=[base, api.base], retry_policy=RetryPolicy(base=0.01)) as client:
+            uuid = api.collections['agents'][0]['uuid']
+            agent = await client.fetch_agent(uuid)
+            assert agent.uuid == uuid
+            assert api.paths() == [f'agents/{uuid}']
+            
+            pool = client.http.api_mirrors
+            assert pool is not None
+            assert pool.mirrors[0].failures == 1
+            assert pool.candidates()[0].base == api.base
+
+
+async def test_every_mirror_failing_raises_after_the_policy_attempts() -> None:
+    async with FakeAPI() as first, FakeAPI() as second:
+        first.hook = second.hook = _unavailable
+        async with client_for(first, second, retry_policy=RetryPolicy(attempts=3, base=0.01)) as client:
+            uuid = first.collections['agents'][0]['uuid']
+            with pytest.raises(InternalServerError):
+                await client.fetch_agent(uuid)
+            
+            assert len(first.requests) + len(second.requests) == 3
+            assert first.requests and second.requests
@@ -0,0 +1,127 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional
+
+import pytest
+from aiohttp import web
+
+from valorant import HTTPException, InternalServerError, RetryBudget, RetryPolicy
+
+from .api import FakeAPI, Handler, client_for
+
+
+def _failing(times: int, status: int, *, headers: Optional[Dict[str, str]] = None, retry_after: Optional[float] = None) -> Handler:
+    # Answers the first ``times`` requests with ``status``, then lets the catalogue answer.
+    remaining = [times]
+    
+    async def hook(request: web.Request) -> Optional[web.StreamResponse]:
+        if remaining[0] == 0:
+            return None
+        
+        remaining[0] -= 1
+        body = {'status': status, 'error': 'try again'}
+        if retry_after is not None:
+            body['retry_after'] = retry_after
+        return web.json_response(body, status=status, headers=headers)
+    
+    return hook
+
+
+async def test_rate_limited_request_waits_for_retry_after() -> None:
+    async with FakeAPI() as api:
+        api.hook = _failing(2, 429, headers={'Via': '1.1 proxy'}, retry_after=0.1)
+        async with client_for(api, retry_policy=RetryPolicy(base=10.0)) as client:
+            uuid = api.collections['agents'][0]['uuid']
+            started = time.monotonic()
+            agent = await client.fetch_agent(uuid)
+            
+            assert agent.uuid == uuid
+            assert api.paths() == [f'agents/{uuid}'] * 3
+            assert 0.2 <= time.monotonic() - started < 5.0
+
+
+async def test_rate_limit_falls_back_to_the_retry_after_header() -> None:
+    async with FakeAPI() as api:
+        api.hook = _failing(1, 429, headers={'Via': '1.1 proxy', 'Retry-After': '0.05'})
+        async with client_for(api, retry_policy=RetryPolicy(base=10.0)) as client:
+            uuid = api.collections['agents'][0]['uuid']
+            agent = await client.fetch_agent(uuid)
+            assert agent.uuid == uuid
+            assert len(api.requests) == 2
+
+
+async def test_rate_limit_without_via_is_not_retried() -> None:
+    async with FakeAPI() as api:
+        api.hook = _failing(1, 429, retry_after=0.01)
+        async with client_for(api) as client:
+            with pytest.raises(HTTPException) as info:
+                await client.fetch_agent(api.collections['agents'][0]['uuid'])
+            
+            assert info.value.response is not None and info.value.response.status == 429
+            assert len(api.requests) == 1
+
+
+async def test_exhausted_budget_stops_retries() -> None:
+    budget = RetryBudget(0.0, min_per_second=0.0, capacity=1.0)
+    policy = RetryPolicy(attempts=5, base=0.01, budget=budget)
+    async with FakeAPI() as api:
+        api.hook = _failing(10, 503)
+        async with client_for(api, retry_policy=policy) as client:
+            uuids = [item['uuid'] for item in api.collections['agents']]
+            
+            # The one token pays for a single retry.
+            with pytest.raises(InternalServerError):
+                await client.fetch_agent(uuids[0])
+            assert len(api.requests) == 2
+            assert budget.tokens < 1.0
+            
+            with pytest.raises(InternalServerError):
+                await client.fetch_agent(uuids[1])
+            assert len(api.requests) == 3
+            
+            # Rate limits are paid for from the same budget.
+            api.hook = _failing(1, 429, headers={'Via': '1.1 proxy'}, retry_after=0.01)
+            with pytest.raises(HTTPException) as info:
+                await client.fetch_agent(uuids[2])
+            assert info.value.response is not None and info.value.response.status == 429
+            assert len(api.requests) == 4
+
+
+async def test_retries_stop_at_the_policy_attempts() -> None:
+    async with FakeAPI() as api:
+        api.hook = _failing(10, 502)
+        async with client_for(api, retry_policy=RetryPolicy(attempts=3, base=0.01)) as client:
+            with pytest.raises(InternalServerError):
+                await client.fetch_agent(api.collections['agents'][0]['uuid'])
+            assert len(api.requests) == 3
+            
+            # Statuses outside the policy fail at once.
+            api.requests.clear()
+            api.hook = _failing(1, 400)
+            with pytest.raises(HTTPException):
+                await client.fetch_agent(api.collections['agents'][1]['uuid'])
+            assert len(api.requests) == 1
@@ -0,0 +1,152 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+from aiohttp import web
+
+from valorant import RequestPriority, RequestScheduler
+
+from .api import FakeAPI, client_for
+
+
+async def _queue(scheduler: RequestScheduler, order: List[str], name: str, priority: RequestPriority) -> asyncio.Task:
+    # Starts a task that waits for a slot, notes when it gets one and gives it back.
+    async def run() -> None:
+        await scheduler.acquire(priority)
+        order.append(name)
+        scheduler.release()
+        
+    task = asyncio.ensure_future(run())
+    await asyncio.sleep(0)
+    return task
+
+
+async def test_waiting_requests_go_by_priority() -> None:
+    scheduler = RequestScheduler(1, aging=10.0)
+    await scheduler.acquire(RequestPriority.normal)
+    
+    order: List[str] = []
+    tasks = [
+        await _queue(scheduler, order, 'background', RequestPriority.background),
+        await _queue(scheduler, order, 'normal', RequestPriority.normal),
+        await _queue(scheduler, order, 'interactive', RequestPriority.interactive),
+        await _queue(scheduler, order, 'normal later', RequestPriority.normal),
+    ]
+    assert scheduler.queued == 4
+    
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    assert order == ['interactive', 'normal', 'normal later', 'background']
+    assert scheduler.active == 0
+
+
+async def test_aging_lets_old_requests_go_first() -> None:
+    scheduler = RequestScheduler(1, aging=0.05)
+    await scheduler.acquire(RequestPriority.normal)
+    
+    order: List[str] = []
+    tasks = [await _queue(scheduler, order, 'background', RequestPriority.background)]
+    # Past two levels of aging, so the background request outranks a new interactive one.
+    await asyncio.sleep(0.15)
+    tasks.append(await _queue(scheduler, order, 'interactive', RequestPriority.interactive))
+    tasks.append(await _queue(scheduler, order, 'normal', RequestPriority.normal))
+    
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    assert order == ['background', 'interactive', 'normal']
+
+
+async def test_reserved_slots_only_go_to_interactive_requests() -> None:
+    scheduler = RequestScheduler(2, reserved=1)
+    await scheduler.acquire(RequestPriority.background)
+    
+    order: List[str] = []
+    waiting = await _queue(scheduler, order, 'normal', RequestPriority.normal)
+    assert order == [] and scheduler.queued == 1
+    
+    await scheduler.acquire(RequestPriority.interactive)
+    assert scheduler.active == 2
+    
+    # One free slot is still the reserved one.
+    scheduler.release()
+    await asyncio.sleep(0)
+    assert order == []
+    
+    scheduler.release()
+    await waiting
+    assert order == ['normal']
+
+
+async def test_client_requests_are_sent_by_priority() -> None:
+    async with FakeAPI() as api:
+        gate = asyncio.Event()
+        
+        async def hold(request: web.Request) -> Optional[web.StreamResponse]:
+            if request.match_info['path'] == 'version':
+                await gate.wait()
+            return None
+        
+        api.hook = hold
+        async with client_for(api, request_concurrency=1, priority_aging=10.0) as client:
+            uuids = [item['uuid'] for item in api.collections['agents']]
+            blocker = asyncio.ensure_future(client.fetch_version())
+            await asyncio.sleep(0.1)
+            
+            tasks = []
+            for uuid, priority in zip(uuids, (RequestPriority.background, RequestPriority.normal, RequestPriority.interactive)):
+                with client.priority(priority):
+                    tasks.append(asyncio.ensure_future(client.fetch_agent(uuid)))
+                await asyncio.sleep(0.05)
+            
+            assert client.scheduler.queued == 3
+            gate.set()
+            await asyncio.gather(blocker, *tasks)
+            assert api.paths() == ['version', f'agents/{uuids[2]}', f'agents/{uuids[1]}', f'agents/{uuids[0]}']
+
+
+async def test_open_media_streams_do_not_hold_slots() -> None:
+    async with FakeAPI() as api:
+        api.media['sounds/1.wav'] = b'x' * 4096
+        async with client_for(api, request_concurrency=4) as client:
+            agent = await client.fetch_agent(api.collections['agents'][0]['uuid'])
+            media = agent.voice_line.media[0]
+            
+            # Every stream gets its headers, then waits for a body that does not come yet.
+            api.media_gate.clear()
+            streams = [media.stream(chunk_size=1024) for _ in range(4)]
+            reads = [asyncio.ensure_future(stream.__anext__()) for stream in streams]
+            await asyncio.sleep(0.2)
+            
+            other = api.collections['agents'][1]['uuid']
+            fetched = await asyncio.wait_for(client.fetch_agent(other), 2)
+            assert fetched.uuid == other
+            assert client.scheduler.active == 0
+            
+            api.media_gate.set()
+            assert all(len(chunk) == 1024 for chunk in await asyncio.gather(*reads))
+            for stream in streams:
+                await stream.aclose()
@@ -0,0 +1,130 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+import pytest
+from aiohttp import web
+
+from valorant import InternalServerError, NotFound, RetryPolicy
+
+from . import payloads
+from .api import FakeAPI, client_for
+
+
+async def test_not_found_is_remembered_for_the_ttl() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api, negative_cache_ttl=0.2) as client:
+            missing = payloads.agent(99)['uuid']
+            for _ in range(3):
+                with pytest.raises(NotFound):
+                    await client.fetch_agent(missing)
+            assert api.paths() == [f'agents/{missing}']
+            
+            # Only that kind is remembered as missing.
+            with pytest.raises(NotFound):
+                await client.fetch_ceremony(missing)
+            assert len(api.requests) == 2
+            
+            await asyncio.sleep(0.25)
+            with pytest.raises(NotFound):
+                await client.fetch_agent(missing)
+            assert len(api.requests) == 3
+
+
+async def test_not_found_is_not_remembered_by_default() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api) as client:
+            missing = payloads.agent(99)['uuid']
+            for _ in range(2):
+                with pytest.raises(NotFound):
+                    await client.fetch_agent(missing)
+            assert len(api.requests) == 2
+
+
+async def test_known_uuid_filter_answers_from_the_collection() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api, known_uuid_filter=True) as client:
+            await client.fetch_agents()
+            api.requests.clear()
+            
+            with pytest.raises(NotFound):
+                await client.fetch_agent(payloads.agent(99)['uuid'])
+            assert not api.requests
+            
+            uuid = api.collections['agents'][0]['uuid']
+            assert (await client.fetch_agent(uuid)).uuid == uuid
+
+
+async def test_refresh_reloads_only_when_the_version_changes() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api) as client:
+            await client.fetch_agents()
+            uuid = api.collections['agents'][0]['uuid']
+            
+            api.requests.clear()
+            assert await client.refresh() is True
+            assert client.version is not None and client.version.manifest_id == 'M1'
+            assert sorted(api.paths()) == ['agents', 'version']
+            
+            api.requests.clear()
+            assert await client.refresh() is False
+            assert api.paths() == ['version']
+            
+            api.requests.clear()
+            api.version = payloads.version('M2')
+            api.collections['agents'][0]['displayName'] = 'Renamed'
+            waiter = client.wait_for('version_update', timeout=2)
+            assert await client.refresh() is True
+            previous, current = await waiter
+            assert (previous.manifest_id, current.manifest_id) == ('M1', 'M2')
+            assert sorted(api.paths()) == ['agents', 'version']
+            assert client._connection._get_agent(uuid).display_name == 'Renamed'
+
+
+async def test_failed_refresh_keeps_the_cache_and_tries_again() -> None:
+    async with FakeAPI() as api:
+        async with client_for(api, retry_policy=RetryPolicy(attempts=1)) as client:
+            await client.fetch_agents()
+            assert await client.refresh() is True
+            uuid = api.collections['agents'][0]['uuid']
+            
+            async def unavailable(request: web.Request) -> Optional[web.StreamResponse]:
+                if request.match_info['path'] == 'agents':
+                    return web.json_response({'status': 503, 'error': 'unavailable'}, status=503)
+                return None
+            
+            api.hook = unavailable
+            api.version = payloads.version('M2')
+            api.collections['agents'][0]['displayName'] = 'Renamed'
+            with pytest.raises(InternalServerError):
+                await client.refresh()
+            assert client.version.manifest_id == 'M1'
+            assert client._connection._get_agent(uuid).display_name == 'Agent0'
+            
+            api.hook = None
+            assert await client.refresh() is True
+            assert client._connection._get_agent(uuid).display_name == 'Renamed'
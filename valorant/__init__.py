@@ -26,13 +26,100 @@ from __future__ import annotations
 __version__ = '1.0.0'
 __author__ = 'NextChai'
 
-from .abc import *
-from .agent import *
-from .buddy import *
-from .client import *
-from .enums import *
-from .errors import *
-from .http import *
-from .media import *
-from .state import *
-from .utils import *
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Submodules, and the dependencies they pull in such as aiohttp and numpy, are only
+# imported when one of their names is first used, so ``import valorant`` stays cheap.
+if TYPE_CHECKING:
+    from .abc import *
+    from .agent import *
+    from .assets import *
+    from .buddy import *
+    from .bulk import *
+    from .ceremony import *
+    from .client import *
+    from .enums import *
+    from .errors import *
+    from .events import *
+    from .http import *
+    from .imaging import *
+    from .media import *
+    from .mirrors import *
+    from .profiling import *
+    from .retry import *
+    from .runtime import *
+    from .scheduler import *
+    from .state import *
+    from .table import *
+    from .utils import *
+    from .version import *
+    from .watchdog import *
+
+_SUBMODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    'abc': ('Hashable', 'Localizable'),
+    'agent': ('AgentMedia', 'AgentVoiceLine', 'AgentAbility', 'AgentRole', 'Agent'),
+    'assets': ('AssetStore', 'AssetDownloader'),
+    'buddy': ('BuddyLevel', 'Buddy'),
+    'bulk': ('BulkFetchResult', 'PrefetchSummary'),
+    'ceremony': ('Ceremony',),
+    'client': ('ValorantClient',),
+    'enums': ('Language', 'OverflowPolicy', 'DecodeStrategy', 'RequestPriority'),
+    'errors': (
+        'ValorantError',
+        'HTTPException',
+        'BadRequest',
+        'Unauthorized',
+        'Forbidden',
+        'NotFound',
+        'UnsupportedMediaType',
+        'InternalServerError',
+        'ServiceUnavailable',
+        'AssetDownloadError',
+    ),
+    'events': ('EventQueueMetrics', 'EventQueue'),
+    'http': ('Route', 'MaybeUnlock'),
+    'imaging': ('ImageSpec', 'ImagePipeline'),
+    'media': ('Icon',),
+    'mirrors': ('Mirror', 'MirrorPool'),
+    'profiling': ('Histogram', 'SampledProfile', 'enable_timers', 'disable_timers', 'timers', 'reset_timers', 'timed'),
+    'retry': ('RetryBudget', 'RetryPolicy'),
+    'runtime': ('ValorantRuntime',),
+    'scheduler': ('RequestScheduler',),
+    'state': ('ConnectionState', 'cache_management_for'),
+    'table': ('StringColumn', 'CatalogueTable'),
+    'utils': (
+        '_to_json',
+        '_from_json',
+        'MISSING',
+        '_mis_if_not',
+        'CachedSlotProperty',
+        'cached_slot_property',
+        'add_logging',
+        'json_or_text',
+    ),
+    'version': ('Version',),
+    'watchdog': ('LoopStall', 'LoopWatchdog'),
+}
+
+_EXPORTS: Dict[str, str] = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__: Tuple[str, ...] = tuple(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    elif name in _SUBMODULE_EXPORTS:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    
+    # Cache it so the next lookup does not come back here.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULE_EXPORTS))
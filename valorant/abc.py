@@ -23,26 +23,170 @@ SOFTWARE.
 """
 from __future__ import annotations
 
-from functools import cached_property
-from typing import Tuple
+import sys
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple, Union
+
+from .enums import Language
 
 __all__: Tuple[str, ...] = (
     'Hashable',
+    'Localizable',
 )
+
+# The locales a Localizable model keeps strings for, in storage order.
+_LOCALES: Tuple[Language, ...] = tuple(language for language in Language if language is not Language.all)
+_LOCALE_INDEX: Dict[Language, int] = {language: index for index, language in enumerate(_LOCALES)}
+_DEFAULT_LOCALE: str = Language.enUS.value
+
+# The key HTTPClient adds to single language payloads with the locale they were
+# fetched in. Payloads without it are in the API's default language.
+_LOCALE_KEY: str = '_locale'
+
+
+def _locale_of(model: Localizable) -> Optional[str]:
+    # The locale code of a model fetched in one language, None for one with every locale.
+    locales = model._locales
+    return locales if isinstance(locales, str) else None
+
+
+def _answers_for(model: Localizable, locale: Optional[str]) -> bool:
+    # Whether a cached model can answer a fetch in ``locale``, None meaning every locale.
+    # A model with every locale has en-US plain attributes, so it answers for en-US too,
+    # but never for another single language.
+    own = _locale_of(model)
+    if own is None:
+        return locale is None or locale == _DEFAULT_LOCALE
+    return own == locale
+
+
+def _in_default_locale(value: Any) -> Any:
+    # With Language.all, localized fields are mappings of locale code to value.
+    if isinstance(value, dict):
+        return value.get(_DEFAULT_LOCALE)
+    return value
+
+
+def _locale_table(value: Optional[Mapping[str, Optional[str]]]) -> Tuple[Optional[str], ...]:
+    # Translations repeat a lot between locales (names especially), interning
+    # lets every table share a single copy of each distinct string.
+    value = value or {}
+    return tuple(
+        sys.intern(text) if (text := value.get(language.value)) is not None else None
+        for language in _LOCALES
+    )
  
 
 class Hashable:
+    """
+    A mixin for models that compare and hash by their ``uuid``.
+    
+    Subclasses set ``_key`` to the integer form of their uuid once, when they are
+    created, so equality and hashing never touch the uuid string. A uuid that is
+    not in the canonical form is used as its own key. Subclasses that
+    declare ``__slots__`` stay free of a per-instance ``__dict__``.
+    """
+    __slots__: Tuple[str, ...] = ('_key',)
     
-    @cached_property
+    _key: Union[int, str]
+    
+    @property
     def id(self) -> str:
         return getattr(self, 'uuid')
     
     def __eq__(self, _o: object) -> bool:
-        return isinstance(_o, self.__class__) and self.id == _o.id
+        return isinstance(_o, self.__class__) and self._key == _o._key
     
     def __ne__(self, _o: object) -> bool:
         return not self.__eq__(_o)
     
     def __hash__(self) -> int:
-        return hash(self.id)
-    
\ No newline at end of file
+        return hash(self._key)
+
+
+class Localizable:
+    """
+    A mixin for models with text that can be fetched in every language at once.
+    
+    When a model is fetched with :attr:`Language.all` its localized fields are kept in
+    one compact table per field, indexed by locale, and its plain attributes such as
+    ``display_name`` hold the ``en-US`` text. Models fetched in a single language have
+    no tables, they only know the text of the language they were fetched in.
+    
+    Subclasses list their localized fields in ``_localized_fields`` as
+    ``(attribute, payload key)`` pairs and declare a ``_locales`` slot, which holds
+    the tables or the locale code of the one language the model was fetched in.
+    """
+    __slots__: Tuple[str, ...] = ()
+    
+    _localized_fields: ClassVar[Tuple[Tuple[str, str], ...]] = (('display_name', 'displayName'),)
+    _locales: Union[str, Tuple[Tuple[Optional[str], ...], ...]]
+    
+    def _load_locales(self, data: Mapping[str, Any]) -> None:
+        if isinstance(data.get(self._localized_fields[0][1]), dict):
+            self._locales = tuple(_locale_table(data.get(key)) for _, key in self._localized_fields)
+        else:
+            self._locales = data.get(_LOCALE_KEY, _DEFAULT_LOCALE)
+            
+    def _nested(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Used to pass the locale of a single language payload on to a payload nested in it.
+        # The payload is the caller's, so a copy is tagged.
+        locales = self._locales
+        if isinstance(locales, str) and locales != _DEFAULT_LOCALE:
+            return {**data, _LOCALE_KEY: locales}
+        return data
+    
+    def _text_for(self, attribute: str, language: Language) -> Optional[str]:
+        if language is Language.all:
+            raise ValueError('Language.all does not name a single language')
+        
+        for index, (name, _) in enumerate(self._localized_fields):
+            if name == attribute:
+                break
+        else:
+            raise AttributeError(f'{self.__class__.__name__}.{attribute} is not localized')
+        
+        locales = self._locales
+        if isinstance(locales, str):
+            # Only the language the model was fetched in is known.
+            return getattr(self, attribute) if locales == language.value else None
+        
+        return locales[index][_LOCALE_INDEX[language]]
+    
+    def display_name_for(self, language: Language) -> Optional[str]:
+        """
+        Used to get the display name in a given language.
+        
+        Parameters
+        ----------
+        language: :class:`Language`
+            The language to get the display name in.
+            
+        Returns
+        -------
+        Optional[:class:`str`]
+            The display name, or ``None`` if it has no translation in that language or
+            the model was fetched in another language.
+        """
+        return self._text_for('display_name', language)
+
+
+class _Described(Localizable):
+    # Localizable models that also have a localized description.
+    __slots__: Tuple[str, ...] = ()
+    
+    def description_for(self, language: Language) -> Optional[str]:
+        """
+        Used to get the description in a given language.
+        
+        Parameters
+        ----------
+        language: :class:`Language`
+            The language to get the description in.
+            
+        Returns
+        -------
+        Optional[:class:`str`]
+            The description, or ``None`` if it has no translation in that language or
+            the model was fetched in another language.
+        """
+        return self._text_for('description', language)
@@ -23,10 +23,11 @@ SOFTWARE.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, AsyncIterator, List, Literal, Optional, Tuple
 
-from .abc import Hashable
+from .abc import Hashable, _Described, _DEFAULT_LOCALE, _in_default_locale
 from .media import Icon
+from .utils import cached_slot_property, _materialize, _uuid_key
 
 if TYPE_CHECKING:
     from .types.agent import (
@@ -36,6 +37,7 @@ if TYPE_CHECKING:
         AgentVoiceLine as AgentVoiceLinePayload,
         AgentMedia as AgentMediaPayload
     )
+    from .assets import AssetStore
     from .state import ConnectionState
     
 __all__: Tuple[str, ...] = (
@@ -63,13 +65,63 @@ class AgentMedia(Hashable):
     __slots__: Tuple[str, ...] = (
         'id',
         'wwise',
-        'wave'
+        'wave',
+        '_state'
     )
     
     def __init__(self, *, data: AgentMediaPayload, state: ConnectionState) -> None:
+        self._state: ConnectionState = state
         self.id: int = data['id']
+        self._key: int = self.id
         self.wwise: str = data['wwise']
         self.wave: str = data['wave']
+        
+    async def stream(
+        self,
+        *,
+        format: Literal['wave', 'wwise'] = 'wave',
+        chunk_size: int = 65536,
+        start: int = 0,
+        end: Optional[int] = None,
+        cache: Optional[AssetStore] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Used to stream the voice line's audio as it arrives, without buffering the whole file.
+        
+        .. code-block:: python3
+
+            async for chunk in media.stream(start=44, chunk_size=16384):
+                await response.write(chunk)
+        
+        Parameters
+        ----------
+        format: :class:`str`
+            Which file to stream, ``wave`` or ``wwise``. Defaults to ``wave``.
+        chunk_size: :class:`int`
+            The maximum number of bytes per chunk. Defaults to ``65536``.
+        start: :class:`int`
+            The first byte to stream. Defaults to ``0``.
+        end: Optional[:class:`int`]
+            The last byte to stream, inclusive. Streams to the end of the file if not given.
+        cache: Optional[:class:`AssetStore`]
+            A store to serve the file from if it's there. When the whole file is streamed
+            from the network it is written to the store as well.
+            
+        Yields
+        ------
+        :class:`bytes`
+            The audio data.
+        """
+        from .assets import _stream_asset
+        
+        url = self.wave if format == 'wave' else self.wwise
+        stream = _stream_asset(self._state.http, url, chunk_size=chunk_size, start=start, end=end, cache=cache)
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            # Close the inner stream now so its connection and any partial cache file are released.
+            await stream.aclose()
 
 
 class AgentVoiceLine:
@@ -88,16 +140,26 @@ class AgentVoiceLine:
     __slots__: Tuple[str, ...] = (
         'min_duration', 
         'max_duration', 
-        'media'
+        '_data',
+        '_state',
+        '_cs_media'
     )
     
     def __init__(self, *, data: AgentVoiceLinePayload, state: ConnectionState) -> None:
+        self._data: AgentVoiceLinePayload = data
+        self._state: ConnectionState = state
         self.min_duration: float = data['minDuration']
         self.max_duration: float = data['maxDuration']
-        self.media: List[AgentMedia] = [AgentMedia(data=m, state=state) for m in data['mediaList']]
+        
+        if not state.lazy:
+            _materialize(self)
+        
+    @cached_slot_property('_cs_media')
+    def media(self) -> List[AgentMedia]:
+        return [AgentMedia(data=m, state=self._state) for m in self._data['mediaList']]
 
 
-class AgentAbility:
+class AgentAbility(_Described):
     """
     Represents an ability of an :class:`Agent`.
     
@@ -116,17 +178,29 @@ class AgentAbility:
         'slot', 
         'display_name', 
         'description', 
-        'display_icon'
+        '_data',
+        '_locales',
+        '_cs_display_icon'
     )
     
+    _localized_fields = (('display_name', 'displayName'), ('description', 'description'))
+    
     def __init__(self, *, data: AgentAbilityPayload, state: ConnectionState) -> None:
+        self._data: AgentAbilityPayload = data
         self.slot: str = data['slot']
-        self.display_name: str = data['displayName']
-        self.description: str = data['description']
-        self.display_icon: Optional[Icon] = Icon._from_url(icon) if (icon := data['displayIcon']) else None
+        self.display_name: str = _in_default_locale(data['displayName'])
+        self.description: str = _in_default_locale(data['description'])
+        self._load_locales(data)
+        
+        if not state.lazy:
+            _materialize(self)
+        
+    @cached_slot_property('_cs_display_icon')
+    def display_icon(self) -> Optional[Icon]:
+        return Icon._from_url(icon) if (icon := self._data['displayIcon']) else None
 
 
-class AgentRole(Hashable):
+class AgentRole(Hashable, _Described):
     """
     Represents the role an :class:`Agent` plays in the game.
     
@@ -147,19 +221,32 @@ class AgentRole(Hashable):
         'uuid',
         'display_name',
         'description',
-        'display_icon',
-        'asset_path'
+        'asset_path',
+        '_data',
+        '_locales',
+        '_cs_display_icon'
     )
     
+    _localized_fields = (('display_name', 'displayName'), ('description', 'description'))
+    
     def __init__(self, *, data: AgentRolePayload, state: ConnectionState) -> None:
+        self._data: AgentRolePayload = data
         self.uuid: str = data['uuid']
-        self.display_name: str = data['displayName']
-        self.description: str = data['description']
-        self.display_icon: Optional[Icon] = Icon._from_url(icon) if (icon := data['displayIcon']) else None
+        self._key = _uuid_key(self.uuid)
+        self.display_name: str = _in_default_locale(data['displayName'])
+        self.description: str = _in_default_locale(data['description'])
         self.asset_path: str = data['assetPath']
+        self._load_locales(data)
+        
+        if not state.lazy:
+            _materialize(self)
         
+    @cached_slot_property('_cs_display_icon')
+    def display_icon(self) -> Optional[Icon]:
+        return Icon._from_url(icon) if (icon := self._data['displayIcon']) else None
         
-class Agent(Hashable):
+        
+class Agent(Hashable, _Described):
     """
     Represents an agent with Valorant.
     
@@ -210,40 +297,83 @@ class Agent(Hashable):
         'description', 
         'developer_name',
         'character_tags',
-        'display_icon', 
-        'display_icon_small', 
-        'bust_portrait',
-        'full_portrait', 
-        'kill_feed_portrait',
-        'background',
         'asset_path',
         'is_full_portrait_right_facing',
         'is_playable_character',
         'is_available_for_test',
         'is_base_content',
-        'role',
-        'abilities',
-        'voice_line'
+        '_data',
+        '_state',
+        '_locales',
+        '_cs_display_icon', 
+        '_cs_display_icon_small', 
+        '_cs_bust_portrait',
+        '_cs_full_portrait', 
+        '_cs_kill_feed_portrait',
+        '_cs_background',
+        '_cs_role',
+        '_cs_abilities',
+        '_cs_voice_line'
     )
     
+    _localized_fields = (('display_name', 'displayName'), ('description', 'description'))
+    
     def __init__(self, *, data: AgentPayload, state: ConnectionState) -> None:
+        self._data: AgentPayload = data
+        self._state: ConnectionState = state
         self.uuid: str = data['uuid']
-        self.display_name: str = data['displayName']
-        self.description: str = data['description']
+        self._key = _uuid_key(self.uuid)
+        self.display_name: str = _in_default_locale(data['displayName'])
+        self.description: str = _in_default_locale(data['description'])
         self.developer_name: str = data['developerName']
-        self.character_tags: List[str] = data['characterTags']
-        self.display_icon: Optional[Icon] = Icon._from_url(icon) if (icon := data['displayIcon']) else None
-        self.display_icon_small: Optional[Icon] = Icon._from_url(small_icon) if (small_icon := data['displayIconSmall']) else None
-        self.bust_portrait: Optional[Icon] = Icon._from_url(bust) if (bust := data['bustPortrait']) else None
-        self.full_portrait: Optional[Icon] = Icon._from_url(full) if (full := data['fullPortrait']) else None
-        self.kill_feed_portrait: Optional[Icon] = Icon._from_url(kill_feed) if (kill_feed := data['killfeedPortrait']) else None
-        self.background: Optional[Icon] = Icon._from_url(backgroud) if (backgroud := data['background']) else None
+        self.character_tags: List[str] = _in_default_locale(data['characterTags'])
         self.asset_path: str = data['assetPath']
         self.is_full_portrait_right_facing: bool = data['isFullPortraitRightFacing']
         self.is_playable_character: bool = data['isPlayableCharacter']
         self.is_available_for_test: bool = data['isAvailableForTest']
         self.is_base_content: bool = data['isBaseContent']
-        self.role: Optional[AgentRole] = AgentRole(data=role, state=state) if (role := data['role']) else None
-        self.abilities: List[AgentAbility] = [AgentAbility(data=a, state=state) for a in data['abilities']]
-        self.voice_line: AgentVoiceLine = AgentVoiceLine(data=data['voiceLine'], state=state)
-        
\ No newline at end of file
+        self._load_locales(data)
+        
+        if not state.lazy:
+            _materialize(self)
+        
+    @cached_slot_property('_cs_display_icon')
+    def display_icon(self) -> Optional[Icon]:
+        return Icon._from_url(icon) if (icon := self._data['displayIcon']) else None
+    
+    @cached_slot_property('_cs_display_icon_small')
+    def display_icon_small(self) -> Optional[Icon]:
+        return Icon._from_url(small_icon) if (small_icon := self._data['displayIconSmall']) else None
+    
+    @cached_slot_property('_cs_bust_portrait')
+    def bust_portrait(self) -> Optional[Icon]:
+        return Icon._from_url(bust) if (bust := self._data['bustPortrait']) else None
+    
+    @cached_slot_property('_cs_full_portrait')
+    def full_portrait(self) -> Optional[Icon]:
+        return Icon._from_url(full) if (full := self._data['fullPortrait']) else None
+    
+    @cached_slot_property('_cs_kill_feed_portrait')
+    def kill_feed_portrait(self) -> Optional[Icon]:
+        return Icon._from_url(kill_feed) if (kill_feed := self._data['killfeedPortrait']) else None
+    
+    @cached_slot_property('_cs_background')
+    def background(self) -> Optional[Icon]:
+        return Icon._from_url(background) if (background := self._data['background']) else None
+    
+    @cached_slot_property('_cs_role')
+    def role(self) -> Optional[AgentRole]:
+        return AgentRole(data=self._nested(role), state=self._state) if (role := self._data['role']) else None
+    
+    @cached_slot_property('_cs_abilities')
+    def abilities(self) -> List[AgentAbility]:
+        return [AgentAbility(data=self._nested(a), state=self._state) for a in self._data['abilities']]
+    
+    @cached_slot_property('_cs_voice_line')
+    def voice_line(self) -> AgentVoiceLine:
+        voice_line = self._data['voiceLine']
+        if 'mediaList' not in voice_line:
+            # Fetched with Language.all, each locale has its own recordings.
+            voice_line = voice_line[_DEFAULT_LOCALE]  # type: ignore
+            
+        return AgentVoiceLine(data=voice_line, state=self._state)
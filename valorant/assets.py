@@ -0,0 +1,501 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import os
+import asyncio
+import hashlib
+import logging
+import tempfile
+import weakref
+from typing import IO, TYPE_CHECKING, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .agent import AgentMedia
+from .errors import AssetDownloadError, HTTPException
+from .media import Icon
+
+if TYPE_CHECKING:
+    import aiohttp
+    
+    from .http import HTTPClient
+    
+    Asset = Union[Icon, AgentMedia, str]
+
+log = logging.getLogger('valorant.assets')
+
+__all__: Tuple[str, ...] = (
+    'AssetStore',
+    'AssetDownloader',
+)
+
+_READ_SIZE: int = 1 << 20
+
+
+def _asset_urls(asset: Asset) -> Tuple[str, ...]:
+    if isinstance(asset, Icon):
+        return (asset.url,)
+    if isinstance(asset, AgentMedia):
+        return (asset.wave, asset.wwise)
+    
+    return (asset,)
+
+
+def _hash_file(path: str) -> Tuple[hashlib._Hash, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as fp:
+        while chunk := fp.read(_READ_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+            
+    return digest, size
+
+
+def _write_chunk(fp: IO[bytes], digest: hashlib._Hash, chunk: bytes) -> None:
+    fp.write(chunk)
+    digest.update(chunk)
+    
+    
+def _validator(response: aiohttp.ClientResponse) -> Optional[str]:
+    # What a resumed download sends as If-Range. Weak ETags can not be used for it.
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('Last-Modified')
+
+
+class AssetStore:
+    """
+    A content addressed store of downloaded media on the local disk.
+    
+    Opening a store reads its index from disk, so in a coroutine it is best
+    created with :meth:`asyncio.loop.run_in_executor`. Files are stored under their SHA-256 digest, so identical assets served from
+    different URLs are only kept once. The mapping of URL to digest is kept in an
+    append-only index next to the objects and reloaded when the store is opened again.
+    
+    .. code-block:: text
+
+        root/
+            index               "<digest> <url>" per line
+            version             the game data version the index belongs to
+            objects/ab/abcd...  the files
+            partial/...         downloads that have not completed yet
+    
+    .. container:: operations
+
+        .. describe:: url in x
+
+            Returns whether the asset at ``url`` has been stored.
+            
+        .. describe:: len(x)
+        
+            Returns the number of URLs in the store.
+    
+    Attributes
+    ----------
+    root: :class:`str`
+        The directory the store lives in.
+    """
+    __slots__: Tuple[str, ...] = (
+        'root',
+        'version',
+        '_index',
+        '_locks'
+    )
+    
+    def __init__(self, root: Union[str, os.PathLike]) -> None:
+        self.root: str = os.fspath(root)
+        self._index: Dict[str, str] = {}
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        
+        os.makedirs(os.path.join(self.root, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(self.root, 'partial'), exist_ok=True)
+        self._load_index()
+        
+        try:
+            with open(os.path.join(self.root, 'version'), 'r', encoding='utf-8') as fp:
+                self.version: Optional[str] = fp.read().strip() or None
+        except FileNotFoundError:
+            self.version = None
+        
+    def _load_index(self) -> None:
+        try:
+            with open(os.path.join(self.root, 'index'), 'r', encoding='utf-8') as fp:
+                for line in fp:
+                    digest, _, url = line.rstrip('\n').partition(' ')
+                    if url:
+                        self._index[url] = digest
+        except FileNotFoundError:
+            pass
+        
+    def __contains__(self, url: object) -> bool:
+        return self.path_for(url) is not None  # type: ignore
+    
+    def __len__(self) -> int:
+        return len(self._index)
+        
+    def stamp(self, manifest_id: str) -> bool:
+        """
+        Used to record which game data version the store's URLs belong to.
+        
+        If the store was stamped with a different version, the URL index is dropped so
+        every URL is downloaded again. Stored files are kept, so assets whose content
+        did not change are not written twice. Unfinished downloads are discarded, they
+        may belong to the old version.
+        
+        Parameters
+        ----------
+        manifest_id: :class:`str`
+            The :attr:`Version.manifest_id` of the current game data.
+            
+        Returns
+        -------
+        :class:`bool`
+            Whether the index was dropped.
+        """
+        if manifest_id == self.version:
+            return False
+        
+        stale = self.version is not None
+        if stale:
+            log.info('Asset store %s moved from version %s to %s, dropping its index', self.root, self.version, manifest_id)
+            self._index.clear()
+            open(os.path.join(self.root, 'index'), 'w').close()
+            
+            partial = os.path.join(self.root, 'partial')
+            for name in os.listdir(partial):
+                try:
+                    os.remove(os.path.join(partial, name))
+                except FileNotFoundError:
+                    pass
+            
+        with open(os.path.join(self.root, 'version'), 'w', encoding='utf-8') as fp:
+            fp.write(manifest_id)
+            
+        self.version = manifest_id
+        return stale
+        
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+    
+    def _partial_path(self, url: str) -> str:
+        return os.path.join(self.root, 'partial', hashlib.sha1(url.encode()).hexdigest())
+    
+    def _read_validator(self, partial: str) -> Optional[str]:
+        # The ETag or Last-Modified of the response a partial file was started from.
+        try:
+            with open(f'{partial}.validator', 'r', encoding='utf-8') as fp:
+                return fp.read() or None
+        except FileNotFoundError:
+            return None
+        
+    def _write_validator(self, partial: str, validator: Optional[str]) -> None:
+        if validator is None:
+            try:
+                os.remove(f'{partial}.validator')
+            except FileNotFoundError:
+                pass
+            return
+        
+        with open(f'{partial}.validator', 'w', encoding='utf-8') as fp:
+            fp.write(validator)
+    
+    def _lock_for(self, url: str) -> asyncio.Lock:
+        # Guards the partial file of a URL, which every download of it shares.
+        lock = self._locks.get(url)
+        if lock is None:
+            lock = self._locks[url] = asyncio.Lock()
+        return lock
+    
+    def digest_for(self, url: str) -> Optional[str]:
+        """
+        Used to get the SHA-256 digest of a stored asset.
+        
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL the asset was downloaded from.
+            
+        Returns
+        -------
+        Optional[:class:`str`]
+            The hex digest, or ``None`` if the asset is not stored.
+        """
+        return self._index.get(url)
+    
+    def path_for(self, url: str) -> Optional[str]:
+        """
+        Used to get the local path of a stored asset.
+        
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL the asset was downloaded from.
+            
+        Returns
+        -------
+        Optional[:class:`str`]
+            The path to the file, or ``None`` if the asset is not stored.
+        """
+        digest = self._index.get(url)
+        if digest is None:
+            return None
+        
+        path = self._object_path(digest)
+        return path if os.path.exists(path) else None
+    
+    def _temporary_path(self) -> str:
+        fd, path = tempfile.mkstemp(dir=os.path.join(self.root, 'partial'), suffix='.tmp')
+        os.close(fd)
+        return path
+    
+    def _iter_file(self, path: str, start: int, end: Optional[int], chunk_size: int) -> Iterator[bytes]:
+        remaining = None if end is None else end - start + 1
+        with open(path, 'rb') as fp:
+            fp.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = fp.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+    
+    def _commit(self, url: str, partial: str, digest: str) -> str:
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            # Same content is already stored, possibly under another URL.
+            os.remove(partial)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(partial, path)
+            
+        self._write_validator(partial, None)
+        
+        if self._index.get(url) != digest:
+            self._index[url] = digest
+            with open(os.path.join(self.root, 'index'), 'a', encoding='utf-8') as fp:
+                fp.write(f'{digest} {url}\n')
+            
+        return path
+    
+
+async def _stream_asset(
+    http: HTTPClient,
+    url: str,
+    *,
+    chunk_size: int,
+    start: int,
+    end: Optional[int],
+    cache: Optional[AssetStore],
+) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    if cache is not None:
+        path = cache.path_for(url)
+        if path is not None:
+            chunks = cache._iter_file(path, start, end, chunk_size)
+            while chunk := await loop.run_in_executor(None, next, chunks, b''):
+                yield chunk
+            return
+    
+    async with http.cdn_response(url, start=start, end=end) as response:
+        if response.status == 206:
+            skip, remaining = 0, None
+        else:
+            # The server ignored the range, cut it out of the full body ourselves.
+            skip, remaining = start, None if end is None else end - start + 1
+        
+        # Only whole files are written to the cache.
+        whole = cache is not None and response.status == 200 and not start and end is None
+        partial = await loop.run_in_executor(None, cache._temporary_path) if whole else None  # type: ignore
+        digest = hashlib.sha256()
+        
+        fp = await loop.run_in_executor(None, open, partial, 'wb') if partial else None
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                if fp:
+                    await loop.run_in_executor(None, _write_chunk, fp, digest, chunk)
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+                    chunk, skip = chunk[skip:], 0
+                if remaining is not None:
+                    chunk = chunk[:remaining]
+                    remaining -= len(chunk)
+                if chunk:
+                    yield chunk
+                if remaining == 0:
+                    break
+        except BaseException:
+            if fp:
+                fp.close()
+                os.remove(partial)  # type: ignore
+            raise
+        
+        if fp:
+            await loop.run_in_executor(None, fp.close)
+            await loop.run_in_executor(None, cache._commit, url, partial, digest.hexdigest())  # type: ignore
+    
+
+class AssetDownloader:
+    """
+    Downloads media into an :class:`AssetStore` using the client's HTTP session.
+    
+    Bodies are streamed to disk in chunks, so memory use does not grow with the
+    size of the files. Assets that are already stored are skipped, and downloads
+    that were interrupted are resumed with a ranged request. All disk access
+    happens in the loop's default executor.
+    
+    Parameters
+    ----------
+    http: :class:`HTTPClient`
+        The HTTP client to download with.
+    store: :class:`AssetStore`
+        The store to download into.
+    concurrency: :class:`int`
+        The maximum number of downloads running at once. Defaults to ``8``. Each download
+        holds a slot of the HTTP client's :class:`RequestScheduler` until its response
+        headers arrive, but not while its body is read.
+    chunk_size: :class:`int`
+        The number of bytes read from the network at a time. Defaults to ``65536``.
+    """
+    __slots__: Tuple[str, ...] = (
+        'http',
+        'store',
+        'concurrency',
+        'chunk_size'
+    )
+    
+    def __init__(self, http: HTTPClient, store: AssetStore, *, concurrency: int = 8, chunk_size: int = 65536) -> None:
+        self.http: HTTPClient = http
+        self.store: AssetStore = store
+        self.concurrency: int = concurrency
+        self.chunk_size: int = chunk_size
+        
+    async def download(self, assets: Iterable[Asset]) -> Dict[str, str]:
+        """|coro|
+        
+        Used to download a set of assets.
+        
+        Parameters
+        ----------
+        assets: Iterable[Union[:class:`Icon`, :class:`AgentMedia`, :class:`str`]]
+            The assets to download. Both the ``wave`` and ``wwise`` files of an
+            :class:`AgentMedia` are downloaded.
+            
+        Raises
+        ------
+        AssetDownloadError
+            Some of the assets could not be downloaded. The rest were.
+            
+        Returns
+        -------
+        Dict[:class:`str`, :class:`str`]
+            A mapping of each URL to the local path of its file.
+        """
+        urls: List[str] = list(dict.fromkeys(url for asset in assets for url in _asset_urls(asset)))
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def _bounded(url: str) -> str:
+            async with semaphore:
+                return await self.fetch(url)
+        
+        # One failed asset does not abandon the others half written.
+        results = await asyncio.gather(*map(_bounded, urls), return_exceptions=True)
+        paths: Dict[str, str] = {}
+        errors: Dict[str, BaseException] = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                log.warning('Could not download %s', url, exc_info=result)
+                errors[url] = result
+            else:
+                paths[url] = result
+                
+        if errors:
+            raise AssetDownloadError(paths, errors)
+        
+        return paths
+        
+    async def fetch(self, url: str) -> str:
+        """|coro|
+        
+        Used to download a single URL into the store, unless it is already there.
+        
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL to download.
+            
+        Returns
+        -------
+        :class:`str`
+            The local path of the file.
+        """
+        path = self.store.path_for(url)
+        if path is not None:
+            return path
+        
+        async with self.store._lock_for(url):
+            # Another download of the same URL may have finished while this one waited.
+            path = self.store.path_for(url)
+            if path is not None:
+                return path
+            
+            return await self._fetch(url)
+        
+    async def _fetch(self, url: str) -> str:
+        store = self.store
+        partial = store._partial_path(url)
+        loop = asyncio.get_running_loop()
+        
+        # A partial file is only resumed if the server can tell whether it still has the
+        # same file, otherwise new bytes could be appended to an old prefix.
+        offset = 0
+        digest = hashlib.sha256()
+        validator = await loop.run_in_executor(None, store._read_validator, partial)
+        if validator is not None and os.path.exists(partial):
+            digest, offset = await loop.run_in_executor(None, _hash_file, partial)
+        
+        try:
+            async with self.http.cdn_response(url, start=offset, if_range=validator) as response:
+                if response.status != 206:
+                    # The server sent the whole file, because it changed or was not
+                    # being resumed. Start over.
+                    digest, offset = hashlib.sha256(), 0
+                    await loop.run_in_executor(None, store._write_validator, partial, _validator(response))
+                
+                log.debug('Downloading %s from byte %s', url, offset)
+                fp = await loop.run_in_executor(None, open, partial, 'ab' if offset else 'wb')
+                try:
+                    async for chunk in response.content.iter_chunked(self.chunk_size):
+                        await loop.run_in_executor(None, _write_chunk, fp, digest, chunk)
+                finally:
+                    await loop.run_in_executor(None, fp.close)
+        except HTTPException as exc:
+            # 416 means the partial file already holds the whole body.
+            if not offset or exc.response.status != 416:
+                raise
+        
+        return await loop.run_in_executor(None, store._commit, url, partial, digest.hexdigest())
@@ -25,8 +25,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional, Tuple, List
 
-from .abc import Hashable
+from .abc import Hashable, Localizable, _in_default_locale
 from .media import Icon
+from .utils import cached_slot_property, _materialize, _uuid_key
 
 if TYPE_CHECKING:
     from .types.buddy import (
@@ -42,7 +43,7 @@ __all__: Tuple[str, ...] = (
 )   
     
     
-class BuddyLevel(Hashable):
+class BuddyLevel(Hashable, Localizable):
     """
     Represents a buddy level to a :class:`Buddy`.
     
@@ -63,19 +64,30 @@ class BuddyLevel(Hashable):
         'uuid', 
         'charm_level',
         'display_name', 
-        'display_icon', 
-        'asset_path'
+        'asset_path',
+        '_data',
+        '_locales',
+        '_cs_display_icon'
     )
     
     def __init__(self, *, data: BuddyLevelPayload, state: ConnectionState) -> None:
+        self._data: BuddyLevelPayload = data
         self.uuid: str = data['uuid']
+        self._key = _uuid_key(self.uuid)
         self.charm_level: int = data['charmLevel']
-        self.display_name: str = data['displayName']
-        self.display_icon: Optional[Icon] = Icon._from_url(icon) if (icon := data['displayIcon']) else None
+        self.display_name: str = _in_default_locale(data['displayName'])
         self.asset_path: str = data['assetPath']
+        self._load_locales(data)
+        
+        if not state.lazy:
+            _materialize(self)
+        
+    @cached_slot_property('_cs_display_icon')
+    def display_icon(self) -> Optional[Icon]:
+        return Icon._from_url(icon) if (icon := self._data['displayIcon']) else None
 
 
-class Buddy(Hashable):
+class Buddy(Hashable, Localizable):
     """
     Represents a weapon buddy.
     
@@ -101,17 +113,34 @@ class Buddy(Hashable):
         'display_name', 
         'is_hidden_if_not_owned', 
         'theme_uuid',
-        'display_icon',
         'asset_path',
-        'levels'
+        '_data',
+        '_state',
+        '_locales',
+        '_cs_display_icon',
+        '_cs_levels'
     )
 
     def __init__(self, *, data: BuddyPayload, state: ConnectionState) -> None:
+        self._data: BuddyPayload = data
+        self._state: ConnectionState = state
         self.uuid: str = data['uuid']
-        self.display_name: str = data['displayName']
+        self._key = _uuid_key(self.uuid)
+        self.display_name: str = _in_default_locale(data['displayName'])
         self.is_hidden_if_not_owned: bool = data['isHiddenIfNotOwned']
         self.theme_uuid: str = data['themeUuid']
-        self.display_icon: Optional[Icon] = Icon._from_url(icon) if (icon := data['displayIcon']) else None
         self.asset_path: str = data['assetPath']
-        self.levels: List[BuddyLevel] = [BuddyLevel(data=level, state=state) for level in data['levels']]
+        self._load_locales(data)
+        
+        if not state.lazy:
+            _materialize(self)
+        
+    @cached_slot_property('_cs_display_icon')
+    def display_icon(self) -> Optional[Icon]:
+        return Icon._from_url(icon) if (icon := self._data['displayIcon']) else None
+    
+    @cached_slot_property('_cs_levels')
+    def levels(self) -> List[BuddyLevel]:
+        # Levels are routed through the state so they share the buddy level cache.
+        return [self._state._store_buddy_level(self._nested(level)) for level in self._data['levels']]
         
\ No newline at end of file
@@ -0,0 +1,310 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .abc import _DEFAULT_LOCALE, _answers_for
+from .enums import Language, RequestPriority
+from .errors import NotFound
+from .scheduler import _current_priority, _priority
+from .utils import MISSING, _uuid_key
+
+if TYPE_CHECKING:
+    from .client import ValorantClient
+
+T = TypeVar('T')
+
+log = logging.getLogger('valorant.bulk')
+
+__all__: Tuple[str, ...] = (
+    'BulkFetchResult',
+    'PrefetchSummary',
+)
+
+
+class BulkFetchResult(Generic[T]):
+    """
+    The result of fetching many objects by uuid.
+
+    .. container:: operations
+
+        .. describe:: iter(x)
+
+            Iterates over the found objects.
+
+        .. describe:: len(x)
+
+            Returns the number of found objects.
+
+    Attributes
+    ----------
+    items: List[T]
+        The objects that were found, in the order their uuids were given.
+    missing: List[:class:`str`]
+        The uuids that did not match any object, in the order they were given.
+    """
+    __slots__: Tuple[str, ...] = (
+        'items',
+        'missing'
+    )
+
+    def __init__(self, items: List[T], missing: List[str]) -> None:
+        self.items: List[T] = items
+        self.missing: List[str] = missing
+
+    def __repr__(self) -> str:
+        return f'<BulkFetchResult items={len(self.items)} missing={len(self.missing)}>'
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class PrefetchSummary:
+    """
+    The outcome of :meth:`ValorantClient.prefetch`.
+
+    Every mapping is keyed by ``(kind, language)``, where ``kind`` is the collection name,
+    such as ``'agents'``, and ``language`` is ``None`` for the default language.
+
+    Attributes
+    ----------
+    timings: Dict[Tuple[:class:`str`, Optional[:class:`Language`]], :class:`float`]
+        How long each request took, in seconds.
+    counts: Dict[Tuple[:class:`str`, Optional[:class:`Language`]], :class:`int`]
+        How many objects each successful request returned.
+    errors: Dict[Tuple[:class:`str`, Optional[:class:`Language`]], :class:`Exception`]
+        The error each failed request raised.
+    elapsed: :class:`float`
+        How long the whole prefetch took, in seconds.
+    """
+    __slots__: Tuple[str, ...] = (
+        'timings',
+        'counts',
+        'errors',
+        'elapsed'
+    )
+
+    def __init__(self) -> None:
+        self.timings: Dict[Tuple[str, Optional[Language]], float] = {}
+        self.counts: Dict[Tuple[str, Optional[Language]], int] = {}
+        self.errors: Dict[Tuple[str, Optional[Language]], Exception] = {}
+        self.elapsed: float = 0.0
+
+    def __repr__(self) -> str:
+        return f'<PrefetchSummary requests={len(self.timings)} errors={len(self.errors)} elapsed={self.elapsed:.3f}>'
+
+    @property
+    def slowest(self) -> Optional[Tuple[str, Optional[Language]]]:
+        """Optional[Tuple[:class:`str`, Optional[:class:`Language`]]]: The request that took the longest, if any were made."""
+        return max(self.timings, key=self.timings.__getitem__, default=None)
+
+
+def _in_language(obj: Any, language: Optional[Language]) -> bool:
+    # Whether a cached model can answer a fetch in ``language``, see Localizable.
+    if language is Language.all:
+        return _answers_for(obj, None)
+
+    return _answers_for(obj, language.value if language else _DEFAULT_LOCALE)
+
+
+async def _fetch_many(
+    uuids: Iterable[str],
+    *,
+    get: Callable[[str], Optional[T]],
+    fetch_one: Callable[[str], Awaitable[T]],
+    fetch_all: Callable[[], Awaitable[Any]],
+    is_unknown: Callable[[str], bool],
+    threshold: int,
+    language: Optional[Language],
+) -> BulkFetchResult[T]:
+    # Serve what we can from the cache, then either fetch the misses one by one
+    # in parallel or, when there are too many of them, load the whole collection.
+    # A model cached in another language than ``language`` is a miss.
+    ordered = list(dict.fromkeys(uuids))
+    found = {uuid: obj for uuid in ordered if (obj := get(uuid)) is not None and _in_language(obj, language)}
+    misses = [uuid for uuid in ordered if uuid not in found and not is_unknown(uuid)]
+
+    if misses:
+        log.debug('Bulk fetch: %s cached, %s to fetch', len(found), len(misses))
+        if len(misses) > threshold:
+            # Looked up in what was returned, the cache may be staged by a refresh.
+            objects = {obj._key: obj for obj in await fetch_all()}  # type: ignore
+            for uuid in misses:
+                obj = objects.get(_uuid_key(uuid))
+                if obj is not None:
+                    found[uuid] = obj
+        else:
+            async def _fetch(uuid: str) -> None:
+                try:
+                    found[uuid] = await fetch_one(uuid)
+                except NotFound:
+                    pass
+
+            await asyncio.gather(*map(_fetch, misses))
+
+    items = [found[uuid] for uuid in ordered if uuid in found]
+    missing = [uuid for uuid in ordered if uuid not in found]
+    return BulkFetchResult(items, missing)
+
+
+_PLURALS: Dict[str, str] = {
+    'agent': 'agents',
+    'buddy': 'buddies',
+    'buddy_level': 'buddy_levels',
+    'ceremony': 'ceremonies',
+}
+
+
+class _FetchBatcher:
+    # Collects single item fetches of the same kind and language that arrive
+    # within ``window`` seconds and answers all of them with one list request.
+    # Cached models are answered without a request, and batches of fewer than
+    # ``min_size`` uuids are fetched one by one, which is cheaper than a whole
+    # collection. The requests are made with the highest priority of the fetches
+    # they answer.
+    __slots__: Tuple[str, ...] = (
+        'client',
+        'window',
+        'min_size',
+        '_pending',
+        '_priorities'
+    )
+
+    def __init__(self, client: ValorantClient, window: float, *, min_size: int = 4) -> None:
+        self.client: ValorantClient = client
+        self.window: float = window
+        self.min_size: int = min_size
+        self._pending: Dict[Tuple[str, Optional[Language]], Dict[str, List[asyncio.Future]]] = {}
+        self._priorities: Dict[Tuple[str, Optional[Language]], RequestPriority] = {}
+
+    def _cached(self, kind: str, uuid: str, language: Optional[Language]) -> Any:
+        obj = getattr(self.client._connection, f'_get_{kind}')(uuid)
+        return obj if obj is not None and _in_language(obj, language) else None
+
+    def submit(self, kind: str, uuid: str, language: Optional[Language]) -> asyncio.Future:
+        future = self.client.loop.create_future()
+        obj = self._cached(kind, uuid, language)
+        if obj is not None:
+            future.set_result(obj)
+            return future
+
+        key = (kind, language)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = {}
+            self.client.loop.call_later(self.window, self._schedule_flush, key)
+
+        priority = _priority()
+        current = self._priorities.get(key)
+        if current is None or priority.value < current.value:
+            self._priorities[key] = priority
+
+        batch.setdefault(uuid, []).append(future)
+        return future
+
+    def _schedule_flush(self, key: Tuple[str, Optional[Language]]) -> None:
+        asyncio.ensure_future(self._flush(key))
+
+    async def _flush(self, key: Tuple[str, Optional[Language]]) -> None:
+        batch = self._pending.pop(key)
+        _current_priority.set(self._priorities.pop(key, None))
+        try:
+            await self._answer(key, batch)
+        except Exception as exc:
+            # Nothing may be left waiting forever.
+            for futures in batch.values():
+                _fail(futures, exc)
+
+    async def _answer(self, key: Tuple[str, Optional[Language]], batch: Dict[str, List[asyncio.Future]]) -> None:
+        kind, language = key
+        client = self.client
+
+        # Fetched by someone else while the batch was collecting.
+        for uuid in list(batch):
+            obj = self._cached(kind, uuid, language)
+            if obj is not None:
+                _resolve(batch.pop(uuid), obj)
+
+        if not batch:
+            return
+
+        if len(batch) < self.min_size:
+            log.debug('Fetching %s %s one by one', len(batch), kind)
+            await asyncio.gather(*(self._fetch_one(kind, uuid, language, futures) for uuid, futures in batch.items()))
+            return
+
+        log.debug('Flushing batch of %s %s fetches', len(batch), kind)
+        fetch_all = getattr(client, f'fetch_{_PLURALS[kind]}')
+        try:
+            objects = await fetch_all(language=MISSING if language is None else language)
+        except Exception as exc:
+            for futures in batch.values():
+                _fail(futures, exc)
+            return
+
+        # Looked up in what was returned, the cache may be staged by a refresh.
+        found = {obj._key: obj for obj in objects}
+        for uuid, futures in batch.items():
+            obj = found.get(_uuid_key(uuid))
+            if obj is None and client._connection._is_unknown(kind, uuid):
+                _fail(futures, NotFound(None, None, message=f'No {kind.replace("_", " ")} with the uuid {uuid!r} exists.'))
+                continue
+
+            if obj is None:
+                # Not in the collection, let a direct request produce the real error.
+                asyncio.ensure_future(self._fetch_one(kind, uuid, language, futures))
+                continue
+
+            _resolve(futures, obj)
+
+    async def _fetch_one(self, kind: str, uuid: str, language: Optional[Language], futures: List[asyncio.Future]) -> None:
+        client = self.client
+        try:
+            data = await getattr(client.http, f'get_{kind}')(uuid, language=MISSING if language is None else language)
+            obj = getattr(client._connection, f'_store_{kind}')(data)
+        except Exception as exc:
+            if isinstance(exc, NotFound):
+                client._connection._mark_not_found(kind, uuid)
+
+            _fail(futures, exc)
+        else:
+            _resolve(futures, obj)
+
+
+def _resolve(futures: List[asyncio.Future], obj: Any) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_result(obj)
+
+
+def _fail(futures: List[asyncio.Future], exc: BaseException) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(exc)
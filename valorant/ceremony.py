@@ -25,7 +25,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Tuple
 
-from .abc import Hashable
+from .abc import Hashable, Localizable, _in_default_locale
+from .utils import _uuid_key
 
 if TYPE_CHECKING:
     from types.ceremony import Ceremony as CeremonyPayload
@@ -35,7 +36,7 @@ __all__: Tuple[str, ...] = (
     'Ceremony',
 )
  
-class Ceremony(Hashable):
+class Ceremony(Hashable, Localizable):
     """
     Represents a Ceremony.
     
@@ -51,10 +52,13 @@ class Ceremony(Hashable):
     __slots__: Tuple[str, ...] = (
         'uuid', 
         'display_name',
-        'asset_path'
+        'asset_path',
+        '_locales'
     )
     
     def __init__(self, *, data: CeremonyPayload, state: ConnectionState) -> None:
         self.uuid: str = data['uuid']
-        self.display_name: str = data['displayName']
-        self.asset_path: str = data['assetPath']
\ No newline at end of file
+        self._key = _uuid_key(self.uuid)
+        self.display_name: str = _in_default_locale(data['displayName'])
+        self.asset_path: str = data['assetPath']
+        self._load_locales(data)
\ No newline at end of file
@@ -27,21 +27,40 @@ import sys
 import logging
 import traceback
 import asyncio
-from typing import TYPE_CHECKING, Optional, List, Dict, Callable, Tuple, Coroutine, Any, Awaitable
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, List, Dict, Callable, Tuple, Coroutine, Any, Awaitable, Type, Union, Iterable, Iterator, Mapping, Sequence
 
 
+from .assets import AssetDownloader, AssetStore
+from .bulk import BulkFetchResult, PrefetchSummary, _FetchBatcher, _PLURALS, _fetch_many
+from .enums import DecodeStrategy, Language, OverflowPolicy, RequestPriority
+from .errors import NotFound
+from .events import EventQueue, _Waiters, _waiter_key
+from . import profiling
 from .http import HTTPClient
-from .utils import MISSING
+from .profiling import SampledProfile
+from .scheduler import RequestScheduler, _current_priority, _default_priority
+from .utils import MISSING, _mis_if_not
 from .state import ConnectionState
+from .version import Version
+from .watchdog import LoopWatchdog
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
     from asyncio import AbstractEventLoop
+    from os import PathLike
     
-    from .agent import Agent
-    from .enums import Language
+    from .agent import Agent, AgentMedia
     from .buddy import Buddy, BuddyLevel
     from .ceremony import Ceremony
+    from .events import EventQueueMetrics
+    from .media import Icon
+    from .retry import RetryPolicy
+    from .runtime import ValorantRuntime
+    from .table import CatalogueTable
 
 log = logging.getLogger('valorant.client')
 
@@ -50,6 +69,80 @@ class ValorantClient:
     """
     The main Valorant Client.
     
+    Parameters
+    ----------
+    token: :class:`str`
+        The token used to authorize requests.
+    session: Optional[:class:`aiohttp.ClientSession`]
+        The session to use for requests. One is created if not given.
+    loop: Optional[:class:`asyncio.AbstractEventLoop`]
+        The event loop to use.
+    runtime: Optional[:class:`ValorantRuntime`]
+        A runtime to share the connection pool, rate limits and catalogue cache with other
+        clients. When given, ``session``, ``api_bases``, ``media_bases``, ``lazy``, ``negative_cache_ttl``,
+        ``known_uuid_filter`` and ``decode_chunk_size`` are taken from the runtime instead.
+    api_bases: Optional[Sequence[:class:`str`]]
+        Base URLs to send API requests to instead of ``https://valorant-api.com/v1``, such as
+        the origin, a caching mirror or a regional proxy. Each request goes to the healthy one
+        with the lowest latency and moves to the next one when it fails. See :class:`MirrorPool`.
+    media_bases: Optional[Sequence[:class:`str`]]
+        Base URLs to download media from instead of ``https://media.valorant-api.com``,
+        chosen the same way as ``api_bases``.
+    retry_policy: Optional[:class:`RetryPolicy`]
+        How failed requests, including rate limited ones, are retried. Defaults to the
+        runtime's policy when ``runtime`` is given, and to a :class:`RetryPolicy` with a budget
+        of its own otherwise. Pass the same policy to many clients to share its :class:`RetryBudget`.
+    route_retry_policies: Optional[Mapping[:class:`str`, :class:`RetryPolicy`]]
+        Policies for routes whose path starts with a given prefix, such as ``'/buddies'``.
+        The longest matching prefix wins.
+    request_concurrency: :class:`int`
+        The most requests running at once, media requests included until their headers
+        arrive. Requests past this wait for a slot and are started in order of their priority,
+        see :meth:`priority`. Defaults to ``16``, which also caps the ``concurrency`` of
+        :meth:`prefetch`. Raise it for more parallel requests than that. Ignored when
+        ``runtime`` is given, the runtime's scheduler is used instead.
+    priority_aging: :class:`float`
+        How quickly waiting requests gain on higher priorities, so background work is
+        not starved. See :class:`RequestScheduler`. Defaults to ``1.0``.
+    lazy: :class:`bool`
+        Whether models should decode their heavy attributes (icons, abilities, voice lines,
+        buddy levels) on first access instead of when they are created. This makes bulk
+        fetching considerably faster when only a few attributes are read. Lazy models keep
+        their raw payload until every heavy attribute has been decoded. Defaults to ``False``.
+    event_queue_size: Optional[:class:`int`]
+        If given, event handlers are run by a fixed pool of worker tasks fed by a queue of
+        this size, instead of a new task per event. See :class:`EventQueue`.
+    event_workers: :class:`int`
+        The number of worker tasks used with ``event_queue_size``. Defaults to ``4``.
+    event_overflow: :class:`OverflowPolicy`
+        What to do with events while the queue is full. Defaults to :attr:`OverflowPolicy.block`,
+        which makes HTTP requests wait for room in the queue.
+    batch_window: Optional[:class:`float`]
+        If given, single item fetches such as :meth:`fetch_buddy_level` made within this
+        many seconds of each other, for the same type and language, are answered with one
+        request for the whole collection. Models already in the cache are returned without
+        a request. Disabled by default.
+    batch_min_size: :class:`int`
+        Batches of fewer uuids than this are fetched one by one instead of as a whole
+        collection. Defaults to ``4``.
+    negative_cache_ttl: Optional[:class:`float`]
+        If given, a :class:`NotFound` for a uuid is remembered for this many seconds and
+        raised again without a request. Disabled by default.
+    known_uuid_filter: :class:`bool`
+        Whether fetching a whole collection, such as with :meth:`fetch_agents`, should make
+        later fetches of uuids missing from it raise :class:`NotFound` without a request.
+        Defaults to ``False``.
+    decode_strategy: :class:`DecodeStrategy`
+        Where response bodies are decoded and how models are built from them. With anything
+        but :attr:`DecodeStrategy.inline`, collections are built ``decode_chunk_size`` models
+        at a time, yielding to the event loop in between, so large fetches do not stall
+        other tasks. Defaults to :attr:`DecodeStrategy.inline`.
+    decode_chunk_size: :class:`int`
+        How many models to build between yields. Defaults to ``256``.
+    decode_executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor to decode in with :attr:`DecodeStrategy.thread` or :attr:`DecodeStrategy.process`.
+        A single worker executor of the matching kind is created if not given.
+    
     Attributes
     ----------
     loop: :class:`asyncio.AbstractEventLoop`
@@ -62,12 +155,133 @@ class ValorantClient:
         *,
         session: Optional[ClientSession] = MISSING,
         loop: Optional[AbstractEventLoop] = MISSING,
+        runtime: Optional[ValorantRuntime] = None,
+        api_bases: Optional[Sequence[str]] = None,
+        media_bases: Optional[Sequence[str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        route_retry_policies: Optional[Mapping[str, RetryPolicy]] = None,
+        request_concurrency: int = 16,
+        priority_aging: float = 1.0,
+        lazy: bool = False,
+        event_queue_size: Optional[int] = None,
+        event_workers: int = 4,
+        event_overflow: OverflowPolicy = OverflowPolicy.block,
+        batch_window: Optional[float] = None,
+        batch_min_size: int = 4,
+        negative_cache_ttl: Optional[float] = None,
+        known_uuid_filter: bool = False,
+        decode_strategy: DecodeStrategy = DecodeStrategy.inline,
+        decode_chunk_size: int = 256,
+        decode_executor: Optional[Executor] = None,
     ) -> None:
         self.loop = loop = loop or asyncio.get_event_loop()
-        self.http: HTTPClient = HTTPClient(token, loop, self.dispatch, session=session)
-        self._connection: ConnectionState = ConnectionState(dispatch=self.dispatch) 
+        self.http: HTTPClient = HTTPClient(
+            token,
+            loop,
+            self.dispatch,
+            session=session,
+            runtime=runtime,
+            api_bases=api_bases,
+            media_bases=media_bases,
+            retry_policy=retry_policy,
+            route_retry_policies=route_retry_policies,
+            scheduler=RequestScheduler(request_concurrency, aging=priority_aging),
+        )
+        if runtime is not None:
+            self._connection: ConnectionState = runtime._attach(self.http)
+        else:
+            self._connection = ConnectionState(
+                dispatch=self.dispatch,
+                http=self.http,
+                lazy=lazy,
+                negative_cache_ttl=negative_cache_ttl,
+                known_uuid_filter=known_uuid_filter,
+                store_chunk_size=None if decode_strategy is DecodeStrategy.inline else decode_chunk_size,
+            )
+        
+        self._listeners: Dict[str, _Waiters] = {}
+        self._event_listeners: Dict[str, List[Callable[..., Coroutine[Any, Any, Any]]]] = {}
+        
+        # The handlers to run for each event, computed on first dispatch and
+        # dropped whenever a handler is registered or removed.
+        self._handlers: Dict[str, Tuple[Callable[..., Coroutine[Any, Any, Any]], ...]] = {}
+        
+        self._event_queue: Optional[EventQueue] = None
+        if event_queue_size is not None:
+            self._event_queue = EventQueue(self._run_event, maxsize=event_queue_size, workers=event_workers, overflow=event_overflow)
+            if event_overflow is OverflowPolicy.block:
+                self.http.wait_for_dispatch = self._event_queue.wait_for_capacity
+        
+        self._ready: asyncio.Event = asyncio.Event()
+        self._watchdog: Optional[LoopWatchdog] = None
+        
+        self._decode_executor: Optional[Executor] = None
+        if decode_strategy is DecodeStrategy.thread or decode_strategy is DecodeStrategy.process:
+            if decode_executor is None:
+                if decode_strategy is DecodeStrategy.thread:
+                    decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='valorant-decode')
+                else:
+                    decode_executor = ProcessPoolExecutor(max_workers=1)
+                    
+                self._decode_executor = decode_executor
+                
+            self.http.decode_executor = decode_executor
+        
+        self._batcher: Optional[_FetchBatcher] = None
+        if batch_window is not None:
+            self._batcher = _FetchBatcher(self, batch_window, min_size=batch_min_size)
+    
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """:class:`RequestScheduler`: The scheduler the client's requests wait in, shared when the client has a runtime."""
+        return self.http.scheduler
+    
+    @contextmanager
+    def priority(self, priority: RequestPriority) -> Iterator[None]:
+        """
+        Used to set the priority of every request made in the block.
+        
+        Tasks started in the block inherit the priority. Without one, requests run at
+        :attr:`RequestPriority.normal`, except for :meth:`refresh` and :meth:`download_media`
+        which run at :attr:`RequestPriority.background`.
+        
+        .. code-block:: python3
+
+            @bot.command()
+            async def agent(ctx, name):
+                with client.priority(valorant.RequestPriority.interactive):
+                    agents = await client.fetch_agents()
         
-        self._listeners: Dict[str, List[Tuple[asyncio.Future, Callable[..., bool]]]] = {}
+        Parameters
+        ----------
+        priority: :class:`RequestPriority`
+            The priority to make requests with.
+        """
+        token = _current_priority.set(priority)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+    
+    @property
+    def event_metrics(self) -> Optional[EventQueueMetrics]:
+        """Optional[:class:`EventQueueMetrics`]: The event queue's counters, if the client uses an event queue."""
+        return self._event_queue and self._event_queue.metrics
+    
+    async def close(self) -> None:
+        """|coro|
+        
+        Used to stop the client's background workers.
+        """
+        if self._event_queue is not None:
+            self._event_queue.close()
+            
+        if self._decode_executor is not None:
+            self._decode_executor.shutdown(wait=False)
+            self._decode_executor = None
+            
+        if self._watchdog is not None:
+            self._watchdog.stop()
         
     # Listeners
     def event(self, coro: Coroutine[Any, Any, Any]) -> Coroutine[Any, Any, Any]:
@@ -88,19 +302,94 @@ class ValorantClient:
             raise TypeError('event registered must be a coroutine function')
 
         setattr(self, coro.__name__, coro)
+        self._handlers.clear()
         log.debug('%s has successfully been registered as an event', coro.__name__)
         return coro
     
+    def add_listener(self, func: Callable[..., Coroutine[Any, Any, Any]], name: str = MISSING) -> None:
+        """
+        Used to register a coroutine to be called when an event is received.
+        
+        Unlike :meth:`event`, any number of listeners can be registered for the same event.
+        
+        Parameters
+        ----------
+        func: Callable[..., Coroutine[Any, Any, Any]]
+            The coroutine function to register.
+        name: :class:`str`
+            The name of the event to listen to, for example ``on_request``. Defaults to ``func.__name__``.
+        """
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError('listeners must be coroutine functions')
+        
+        name = func.__name__ if name is MISSING else name
+        event = name[3:] if name.startswith('on_') else name
+        
+        self._event_listeners.setdefault(event, []).append(func)
+        self._handlers.pop(event, None)
+        log.debug('%s has successfully been registered as a listener for %s', func.__name__, event)
+        
+    def remove_listener(self, func: Callable[..., Coroutine[Any, Any, Any]], name: str = MISSING) -> None:
+        """
+        Used to remove a listener registered with :meth:`add_listener` or :meth:`listen`.
+        
+        Parameters
+        ----------
+        func: Callable[..., Coroutine[Any, Any, Any]]
+            The coroutine function to remove.
+        name: :class:`str`
+            The name of the event it was registered for. Defaults to ``func.__name__``.
+        """
+        name = func.__name__ if name is MISSING else name
+        event = name[3:] if name.startswith('on_') else name
+        
+        listeners = self._event_listeners.get(event)
+        if listeners is None:
+            return
+        
+        try:
+            listeners.remove(func)
+        except ValueError:
+            return
+        
+        if not listeners:
+            del self._event_listeners[event]
+        self._handlers.pop(event, None)
+        
+    def listen(self, name: str = MISSING) -> Callable[[Callable[..., Coroutine[Any, Any, Any]]], Callable[..., Coroutine[Any, Any, Any]]]:
+        """
+        A decorator that registers a coroutine as a listener, see :meth:`add_listener`.
+        
+        .. code-block:: python3
+
+            @client.listen('on_request')
+            async def log_request(method, url, bucket, kwargs):
+                print(method, url)
+        
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event to listen to. Defaults to the name of the coroutine.
+        """
+        def decorator(func: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Coroutine[Any, Any, Any]]:
+            self.add_listener(func, name)
+            return func
+        
+        return decorator
+    
     def wait_for(
         self,
         event: str,
         *,
         check: Optional[Callable[..., bool]] = MISSING,
         timeout: Optional[float] = MISSING,
+        key: Any = MISSING,
     ) -> Awaitable[asyncio.Future[Any]]:
         """
         Used to wait for a specific event to be called.
         
+        Waiters are removed as soon as they resolve, time out or are cancelled.
+        
         Parameters
         ----------
         event: :class:`str`
@@ -109,6 +398,10 @@ class ValorantClient:
             A predicate to check if the the future should resolve.
         timeout: Optional[:class:`float`]
             A max amount of time to wait.
+        key: Any
+            Only resolve for events whose first argument matches this key, for example
+            the uuid of a model. Models match by their uuid. Keyed waiters are found with
+            a hash lookup, so ``check`` only runs for matching events.
         
         Returns
         -------
@@ -127,13 +420,22 @@ class ValorantClient:
 
         ev = event.lower()
         try:
-            listeners = self._listeners[ev]
+            waiters = self._listeners[ev]
         except KeyError:
-            listeners = []
-            self._listeners[ev] = listeners
+            waiters = _Waiters()
+            self._listeners[ev] = waiters
 
-        listeners.append((future, check)) # type: ignore
+        waiter_key = None if key is MISSING else _waiter_key(key)
+        waiters.add(future, check, waiter_key) # type: ignore
+        future.add_done_callback(lambda f: self._remove_waiter(ev, f, waiter_key))
         return asyncio.wait_for(future, timeout)
+    
+    def _remove_waiter(self, event: str, future: asyncio.Future, key: Any) -> None:
+        waiters = self._listeners.get(event)
+        if waiters is not None:
+            waiters.discard(future, key)
+            if not waiters:
+                del self._listeners[event]
             
     async def on_error(self, event_method: str, *args: Any, **kwargs: Any) -> None:
         """|coro|
@@ -158,10 +460,25 @@ class ValorantClient:
             except asyncio.CancelledError:
                 pass
     
-    def _schedule_event(self, coro: Callable[..., Coroutine[Any, Any, Any]], event_name: str, *args: Any, **kwargs: Any) -> asyncio.Task:
+    def _schedule_event(self, coro: Callable[..., Coroutine[Any, Any, Any]], event_name: str, *args: Any, **kwargs: Any) -> Optional[asyncio.Task]:
+        if self._event_queue is not None:
+            self._event_queue.put((coro, event_name, args, kwargs))
+            return None
+        
         wrapped = self._run_event(coro, event_name, *args, **kwargs)
         return asyncio.create_task(wrapped, name=f'valorantpy: {event_name}')
     
+    def _build_handlers(self, event: str) -> Tuple[Callable[..., Coroutine[Any, Any, Any]], ...]:
+        handlers = []
+        
+        method = getattr(self, f'on_{event}', None)
+        if method is not None:
+            handlers.append(method)
+        handlers.extend(self._event_listeners.get(event, ()))
+        
+        self._handlers[event] = result = tuple(handlers)
+        return result
+    
     def dispatch(self, event: str, *args, **kwargs) -> None:
         """
         Used to dispatch all events and listeners to their respective handlers.
@@ -177,44 +494,184 @@ class ValorantClient:
         **kwargs: Any
             The keyword arguments to pass to the event.
         """
-        log.debug('Dispatching event %s', event)
-        method = f'on_{event}'
-        
+        try:
+            handlers = self._handlers[event]
+        except KeyError:
+            handlers = self._build_handlers(event)
+            
         listeners = self._listeners.get(event)
+        if not handlers and not listeners:
+            # Nobody is listening, this is the common case for events such as 'request'.
+            return
+        
+        started = time.perf_counter_ns() if profiling._enabled else 0
+        log.debug('Dispatching event %s', event)
         if listeners:
-            removed = []
-            for i, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    removed.append(i)
-                    continue
+            listeners.resolve(args)
+            if not listeners:
+                del self._listeners[event]
 
-                try:
-                    result = condition(*args)
-                except Exception as exc:
-                    future.set_exception(exc)
-                    removed.append(i)
-                else:
-                    if result:
-                        if len(args) == 0:
-                            future.set_result(None)
-                        elif len(args) == 1:
-                            future.set_result(args[0])
-                        else:
-                            future.set_result(args)
-                        removed.append(i)
+        if handlers:
+            method = f'on_{event}'
+            for coro in handlers:
+                self._schedule_event(coro, method, *args, **kwargs)
+                
+        if started:
+            profiling._record('client.dispatch', time.perf_counter_ns() - started)
+    
+    @property
+    def watchdog(self) -> Optional[LoopWatchdog]:
+        """Optional[:class:`LoopWatchdog`]: The loop watchdog, if :meth:`start_watchdog` was called."""
+        return self._watchdog
+    
+    def start_watchdog(self, *, threshold: float = 0.25, interval: float = 0.05) -> LoopWatchdog:
+        """
+        Used to start watching the event loop for stalls.
+        
+        Whenever the loop runs a callback ``threshold`` seconds or more late, ``loop_stall``
+        is dispatched with a :class:`LoopStall` that holds the stack of the code that was
+        blocking it. Every delay is also recorded in :attr:`LoopWatchdog.lag`. Must be
+        called from the running event loop. The watchdog stops with :meth:`close`.
+        
+        .. code-block:: python3
 
-            if len(removed) == len(listeners):
-                self._listeners.pop(event)
-            else:
-                for idx in reversed(removed):
-                    del listeners[idx]
+            @client.event
+            async def on_loop_stall(stall):
+                print(f'Blocked for {stall.duration:.3f}s in {stall.frame}')
+        
+        Parameters
+        ----------
+        threshold: :class:`float`
+            How late, in seconds, a callback has to run to count as a stall. Defaults to ``0.25``.
+        interval: :class:`float`
+            The time between heartbeats, in seconds. Defaults to ``0.05``.
+            
+        Returns
+        -------
+        :class:`LoopWatchdog`
+            The running watchdog.
+        """
+        if self._watchdog is not None:
+            self._watchdog.stop()
+            
+        self._watchdog = LoopWatchdog(self.dispatch, interval=interval, threshold=threshold)
+        self._watchdog.start()
+        return self._watchdog
+    
+    @contextmanager
+    def profile(self, *, interval: float = 0.005) -> Iterator[SampledProfile]:
+        """
+        Used to take a sampled profile of the library while the block runs.
+        
+        A background thread samples the stack of the thread that entered the block,
+        normally the one running the event loop, every ``interval`` seconds. Samples
+        that do not include this library are dropped. The result can be written in
+        the collapsed stack format and turned into a flamegraph.
+        
+        .. code-block:: python3
 
+            with client.profile() as profile:
+                await client.prefetch()
+            profile.write('valorant.folded')
+        
+        Parameters
+        ----------
+        interval: :class:`float`
+            The time between samples, in seconds. Defaults to ``0.005``.
+            
+        Yields
+        ------
+        :class:`SampledProfile`
+            The profile, complete once the block exits.
+        """
+        profile = SampledProfile(threading.get_ident(), interval)
+        profile._start()
         try:
-            coro = getattr(self, method)
-        except AttributeError:
-            pass
-        else:
-            self._schedule_event(coro, method, *args, **kwargs)
+            yield profile
+        finally:
+            profile._finish()
+    
+    # Cache
+    def get_table(self, model: Type[Union[Agent, Buddy, BuddyLevel, Ceremony]]) -> CatalogueTable:
+        """
+        Used to build a column oriented snapshot of every cached object of a model.
+        
+        Requires ``numpy``. The table can be filtered and sorted with array operations
+        and exported with :meth:`CatalogueTable.to_arrow`, :meth:`CatalogueTable.to_pandas`
+        or :meth:`CatalogueTable.to_parquet`.
+        
+        .. code-block:: python3
+
+            await client.fetch_buddies()
+            table = client.get_table(valorant.BuddyLevel)
+            top = table.filter(table['charm_level'] > 1).sort('display_name')
+            frame = top.to_pandas()
+        
+        Parameters
+        ----------
+        model: Type[Union[:class:`Agent`, :class:`Buddy`, :class:`BuddyLevel`, :class:`Ceremony`]]
+            The model to build the table for.
+            
+        Returns
+        -------
+        :class:`CatalogueTable`
+            The table. It does not change when the cache is updated afterwards.
+        """
+        return self._connection._table_for(model)
+    
+    # Media
+    async def download_media(
+        self,
+        assets: Iterable[Union[Icon, AgentMedia, str]],
+        store: Union[AssetStore, str, PathLike],
+        *,
+        concurrency: int = 8,
+    ) -> Dict[str, str]:
+        """|coro|
+        
+        Used to download icons and voice lines into a local, content addressed :class:`AssetStore`.
+        
+        Files already in the store are skipped and interrupted downloads are resumed,
+        so calling this again after a failure only fetches what is missing.
+        Once :meth:`refresh` has seen a version, the store is stamped with it and
+        its index is dropped when the game data has changed since the last download.
+        
+        .. code-block:: python3
+
+            agents = await client.fetch_agents()
+            icons = [agent.display_icon for agent in agents if agent.display_icon]
+            paths = await client.download_media(icons, 'media/')
+        
+        Parameters
+        ----------
+        assets: Iterable[Union[:class:`Icon`, :class:`AgentMedia`, :class:`str`]]
+            The assets, or raw media URLs, to download.
+        store: Union[:class:`AssetStore`, :class:`str`, :class:`os.PathLike`]
+            The store to download into, or the directory to open one in.
+        concurrency: :class:`int`
+            The maximum number of downloads running at once. Defaults to ``8``.
+            
+        Raises
+        ------
+        AssetDownloadError
+            Some of the assets could not be downloaded. The rest were.
+            
+        Returns
+        -------
+        Dict[:class:`str`, :class:`str`]
+            A mapping of each URL to the local path of its file.
+        """
+        loop = asyncio.get_running_loop()
+        if not isinstance(store, AssetStore):
+            store = await loop.run_in_executor(None, AssetStore, store)
+            
+        version = self._connection.version
+        if version is not None:
+            await loop.run_in_executor(None, store.stamp, version.manifest_id)
+            
+        downloader = AssetDownloader(self.http, store, concurrency=concurrency)
+        with _default_priority(RequestPriority.background):
+            return await downloader.download(assets)
     
     # Methods
     async def fetch_agents(self, *, language: Optional[Language] = MISSING, is_playable_character: Optional[bool] = MISSING) -> List[Agent]:
@@ -235,7 +692,11 @@ class ValorantClient:
             A list of agents.
         """
         agents_data = await self.http.get_agents(language=language, is_playable_character=is_playable_character)    
-        return list(map(self._connection._store_agent, agents_data))
+        agents = await self._connection._store_many(self._connection._store_agent, agents_data)
+        if is_playable_character is MISSING:
+            self._connection._mark_complete('agent', agents)
+        
+        return agents
 
     async def fetch_agent(self, uuid: str, *, language: Optional[Language] = MISSING) -> Agent:
         """|coro|
@@ -249,7 +710,16 @@ class ValorantClient:
         language: Optional[:class:`Language`]
             The language you wish to fetch the agent in.
         """
-        agent_data = await self.http.get_agent(uuid, language=language)
+        self._connection._check_known('agent', uuid)
+        if self._batcher is not None:
+            return await self._batcher.submit('agent', uuid, _mis_if_not(language))
+        
+        try:
+            agent_data = await self.http.get_agent(uuid, language=language)
+        except NotFound:
+            self._connection._mark_not_found('agent', uuid)
+            raise
+        
         return self._connection._store_agent(agent_data)
     
     async def fetch_buddies(self, *, language: Optional[Language] = MISSING) -> List[Buddy]:
@@ -268,7 +738,9 @@ class ValorantClient:
             A list of buddies.
         """
         buddies_data = await self.http.get_buddies(language=language)
-        return list(map(self._connection._store_buddy, buddies_data))
+        buddies = await self._connection._store_many(self._connection._store_buddy, buddies_data)
+        self._connection._mark_complete('buddy', buddies)
+        return buddies
     
     async def fetch_buddy(self, uuid: str, *, language: Optional[Language] = MISSING) -> Buddy:
         """|coro|
@@ -287,7 +759,16 @@ class ValorantClient:
         :class:`Buddy`
             The buddy that was fetched,
         """
-        buddy_data = await self.http.get_buddy(uuid, language=language)
+        self._connection._check_known('buddy', uuid)
+        if self._batcher is not None:
+            return await self._batcher.submit('buddy', uuid, _mis_if_not(language))
+        
+        try:
+            buddy_data = await self.http.get_buddy(uuid, language=language)
+        except NotFound:
+            self._connection._mark_not_found('buddy', uuid)
+            raise
+        
         return self._connection._store_buddy(buddy_data)
     
     async def fetch_buddy_levels(self, *, language: Optional[Language] = MISSING) -> List[BuddyLevel]:
@@ -306,7 +787,9 @@ class ValorantClient:
             A list of buddy levels.
         """
         buddy_levels_data = await self.http.get_buddy_levels(language=language)
-        return list(map(self._connection._store_buddy_level, buddy_levels_data))
+        buddy_levels = await self._connection._store_many(self._connection._store_buddy_level, buddy_levels_data)
+        self._connection._mark_complete('buddy_level', buddy_levels)
+        return buddy_levels
     
     async def fetch_buddy_level(self, uuid: str, *, language: Optional[Language] = MISSING) -> BuddyLevel:
         """|coro|
@@ -325,7 +808,16 @@ class ValorantClient:
         :class:`BuddyLevel`
             The requested buddy level.
         """
-        buddy_level_data = await self.http.get_buddy_level(uuid, language=language)
+        self._connection._check_known('buddy_level', uuid)
+        if self._batcher is not None:
+            return await self._batcher.submit('buddy_level', uuid, _mis_if_not(language))
+        
+        try:
+            buddy_level_data = await self.http.get_buddy_level(uuid, language=language)
+        except NotFound:
+            self._connection._mark_not_found('buddy_level', uuid)
+            raise
+        
         return self._connection._store_buddy_level(buddy_level_data)
     
     async def fetch_ceremonies(self, *, language: Optional[Language] = MISSING) -> List[Ceremony]:
@@ -344,7 +836,9 @@ class ValorantClient:
             A list of ceremonies.
         """
         ceremonies_data = await self.http.get_ceremonies(language=language)
-        return list(map(self._connection._store_ceremony, ceremonies_data))
+        ceremonies = await self._connection._store_many(self._connection._store_ceremony, ceremonies_data)
+        self._connection._mark_complete('ceremony', ceremonies)
+        return ceremonies
         
     async def fetch_ceremony(self, uuid: str, *, language: Optional[Language] = MISSING) -> Ceremony:
         """|coro|
@@ -363,7 +857,358 @@ class ValorantClient:
         :class:`Ceremony`
             The requested ceremony.
         """
-        ceremony_data = await self.http.get_ceremony(uuid, language=language)
+        self._connection._check_known('ceremony', uuid)
+        if self._batcher is not None:
+            return await self._batcher.submit('ceremony', uuid, _mis_if_not(language))
+        
+        try:
+            ceremony_data = await self.http.get_ceremony(uuid, language=language)
+        except NotFound:
+            self._connection._mark_not_found('ceremony', uuid)
+            raise
+        
         return self._connection._store_ceremony(ceremony_data)
+
+    # Prefetch
+    
+    def is_ready(self) -> bool:
+        """:class:`bool`: Whether :meth:`prefetch` has completed at least once."""
+        return self._ready.is_set()
     
-    
\ No newline at end of file
+    async def wait_until_ready(self) -> None:
+        """|coro|
+        
+        Used to wait until :meth:`prefetch` has completed at least once.
+        """
+        await self._ready.wait()
+    
+    async def prefetch(
+        self,
+        *,
+        kinds: Iterable[str] = ('agents', 'buddies', 'ceremonies'),
+        languages: Iterable[Optional[Language]] = (None,),
+        concurrency: int = 8,
+    ) -> PrefetchSummary:
+        """|coro|
+        
+        Used to load whole collections into the cache at once.
+        
+        Different collections are fetched concurrently, one request each. The cache keeps
+        one model per uuid, so when more than one language is given every collection is
+        fetched once with :attr:`Language.all` instead, and its models know their text in
+        every language, see :meth:`Agent.display_name_for`. Each finished request dispatches
+        ``prefetch_progress`` with the kind, the language, the number of finished requests
+        and the total. ``ready`` is dispatched and :meth:`wait_until_ready` returns once all
+        of them are done, even if some failed. A failed request is recorded in the summary
+        and does not stop the others.
+        
+        .. code-block:: python3
+
+            summary = await client.prefetch(languages=[None, valorant.Language.jaJP])
+            print(summary.elapsed, summary.slowest, summary.errors)
+            
+            agent = (await client.fetch_agents())[0]
+            print(agent.display_name, agent.display_name_for(valorant.Language.jaJP))
+        
+        Parameters
+        ----------
+        kinds: Iterable[:class:`str`]
+            The collections to fetch, any of ``'agents'``, ``'buddies'``, ``'buddy_levels'``
+            and ``'ceremonies'``. Buddy levels come with their buddies, so they are not
+            fetched separately by default.
+        languages: Iterable[Optional[:class:`Language`]]
+            The languages to fetch each collection in. ``None`` means the default language.
+            More than one is fetched as :attr:`Language.all`.
+        concurrency: :class:`int`
+            The most requests to have in flight at once. Defaults to ``8``.
+            
+        Returns
+        -------
+        :class:`PrefetchSummary`
+            How long each request took and what it returned.
+        """
+        kinds = list(kinds)
+        languages = list(dict.fromkeys(map(_mis_if_not, languages)))
+        if len(languages) > 1:
+            # Fetched one at a time they would replace each other in the cache,
+            # leaving whichever finished last. One request holds them all.
+            log.debug('Prefetching %s languages as Language.all', len(languages))
+            languages = [Language.all]
+            
+        jobs = [(kind, language) for language in languages for kind in kinds]
+        for kind, _ in jobs:
+            if kind not in _PLURALS.values():
+                raise ValueError(f'Unknown collection {kind!r}')
+        
+        summary = PrefetchSummary()
+        semaphore = asyncio.Semaphore(concurrency)
+        total = len(jobs)
+        finished = 0
+        
+        async def _prefetch(kind: str, language: Optional[Language]) -> None:
+            nonlocal finished
+            
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    objects = await getattr(self, f'fetch_{kind}')(language=language)
+                except Exception as exc:
+                    log.warning('Prefetching %s (%s) failed', kind, language, exc_info=exc)
+                    summary.errors[(kind, language)] = exc
+                else:
+                    summary.counts[(kind, language)] = len(objects)
+                finally:
+                    summary.timings[(kind, language)] = time.perf_counter() - started
+                    
+            finished += 1
+            self.dispatch('prefetch_progress', kind, language, finished, total)
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(_prefetch(kind, language) for kind, language in jobs))
+        summary.elapsed = time.perf_counter() - started
+        
+        log.info('Prefetched %s collections in %.3fs', total, summary.elapsed)
+        self._ready.set()
+        self.dispatch('ready')
+        return summary
+    
+    # Version
+    
+    @property
+    def version(self) -> Optional[Version]:
+        """Optional[:class:`Version`]: The version of the game data in the cache, set by :meth:`refresh`."""
+        return self._connection.version
+    
+    async def fetch_version(self) -> Version:
+        """|coro|
+        
+        Used to fetch the version of the game data the API is serving.
+        
+        Returns
+        -------
+        :class:`Version`
+            The current version.
+        """
+        version_data = await self.http.get_version()
+        return Version(data=version_data)
+    
+    async def refresh(self, *, language: Optional[Language] = MISSING) -> bool:
+        """|coro|
+        
+        Used to bring the cache up to date with the API.
+        
+        Only the small version endpoint is requested when the game data has not changed
+        since the last refresh. Otherwise every collection that was loaded before is fetched
+        again and replaces the cache once all of them have loaded. Until then the old data
+        is served, and it is kept if any fetch fails, so the next refresh tries again. Call this on a timer instead of refetching
+        collections directly.
+        
+        .. code-block:: python3
+
+            await client.fetch_agents()
+            while True:
+                await asyncio.sleep(600)
+                if await client.refresh():
+                    print('Game data updated to', client.version)
+        
+        Parameters
+        ----------
+        language: Optional[:class:`Language`]
+            The language to fetch the collections in. By default each collection is fetched
+            again in every language its cached models were fetched in, and each model keeps
+            its language.
+            
+        Returns
+        -------
+        :class:`bool`
+            Whether the version changed, or was seen for the first time, and the cache was reloaded.
+        """
+        state = self._connection
+        async with state._refresh_lock:
+            with _default_priority(RequestPriority.background):
+                version = await self.fetch_version()
+                previous = state.version
+                if previous is not None and previous == version:
+                    log.debug('Game data is still at %s, nothing to refresh', version.version)
+                    return False
+                
+                jobs = state._loaded_kinds()
+                if language is not MISSING:
+                    jobs = list(dict.fromkeys((kind, language) for kind, _ in jobs))
+                    
+                names = ', '.join(f'{kind} ({language.value if language else "default"})' for kind, language in jobs)
+                log.info('Game data changed from %s to %s, reloading %s', previous and previous.version, version.version, names or 'nothing')
+                
+                # The old cache is served until every collection has loaded, and kept if one fails.
+                state._begin_reload()
+                results = await asyncio.gather(
+                    *(getattr(self, f'fetch_{_PLURALS[kind]}')(language=language) for kind, language in jobs),
+                    return_exceptions=True,
+                )
+                errors = [result for result in results if isinstance(result, BaseException)]
+                if errors:
+                    state._abort_reload()
+                    raise errors[0]
+                
+                state._commit_reload(version)
+            
+        self.dispatch('version_update', previous, version)
+        return True
+    
+    # Bulk
+
+    async def fetch_agents_by_uuids(
+        self,
+        uuids: Iterable[str],
+        *,
+        language: Optional[Language] = MISSING,
+        threshold: int = 10,
+    ) -> BulkFetchResult[Agent]:
+        """|coro|
+        
+        Used to fetch many agents by their uuids.
+        
+        Cached agents are returned without a request. If at most ``threshold`` are left
+        they are fetched individually and concurrently, otherwise every agent is fetched
+        with a single request.
+        
+        Parameters
+        ----------
+        uuids: Iterable[:class:`str`]
+            The UUIDs of the agents you wish to fetch.
+        language: Optional[:class:`Language`]
+            The language you wish to fetch the agents in.
+        threshold: :class:`int`
+            The most agents to fetch individually. Defaults to ``10``.
+            
+        Returns
+        -------
+        :class:`BulkFetchResult`
+            The agents that were found, in the order given, and the uuids that were not.
+        """
+        return await _fetch_many(
+            uuids,
+            get=self._connection._get_agent,
+            fetch_one=lambda uuid: self.fetch_agent(uuid, language=language),
+            fetch_all=lambda: self.fetch_agents(language=language),
+            is_unknown=lambda uuid: self._connection._is_unknown('agent', uuid),
+            threshold=threshold,
+            language=_mis_if_not(language),
+        )
+
+    async def fetch_buddies_by_uuids(
+        self,
+        uuids: Iterable[str],
+        *,
+        language: Optional[Language] = MISSING,
+        threshold: int = 10,
+    ) -> BulkFetchResult[Buddy]:
+        """|coro|
+        
+        Used to fetch many buddies by their uuids.
+        
+        Cached buddies are returned without a request. If at most ``threshold`` are left
+        they are fetched individually and concurrently, otherwise every buddy is fetched
+        with a single request.
+        
+        Parameters
+        ----------
+        uuids: Iterable[:class:`str`]
+            The UUIDs of the buddies you wish to fetch.
+        language: Optional[:class:`Language`]
+            The language you wish to fetch the buddies in.
+        threshold: :class:`int`
+            The most buddies to fetch individually. Defaults to ``10``.
+            
+        Returns
+        -------
+        :class:`BulkFetchResult`
+            The buddies that were found, in the order given, and the uuids that were not.
+        """
+        return await _fetch_many(
+            uuids,
+            get=self._connection._get_buddy,
+            fetch_one=lambda uuid: self.fetch_buddy(uuid, language=language),
+            fetch_all=lambda: self.fetch_buddies(language=language),
+            is_unknown=lambda uuid: self._connection._is_unknown('buddy', uuid),
+            threshold=threshold,
+            language=_mis_if_not(language),
+        )
+
+    async def fetch_buddy_levels_by_uuids(
+        self,
+        uuids: Iterable[str],
+        *,
+        language: Optional[Language] = MISSING,
+        threshold: int = 10,
+    ) -> BulkFetchResult[BuddyLevel]:
+        """|coro|
+        
+        Used to fetch many buddy levels by their uuids.
+        
+        Cached buddy levels are returned without a request. If at most ``threshold`` are left
+        they are fetched individually and concurrently, otherwise every buddy level is fetched
+        with a single request.
+        
+        Parameters
+        ----------
+        uuids: Iterable[:class:`str`]
+            The UUIDs of the buddy levels you wish to fetch.
+        language: Optional[:class:`Language`]
+            The language you wish to fetch the buddy levels in.
+        threshold: :class:`int`
+            The most buddy levels to fetch individually. Defaults to ``10``.
+            
+        Returns
+        -------
+        :class:`BulkFetchResult`
+            The buddy levels that were found, in the order given, and the uuids that were not.
+        """
+        return await _fetch_many(
+            uuids,
+            get=self._connection._get_buddy_level,
+            fetch_one=lambda uuid: self.fetch_buddy_level(uuid, language=language),
+            fetch_all=lambda: self.fetch_buddy_levels(language=language),
+            is_unknown=lambda uuid: self._connection._is_unknown('buddy_level', uuid),
+            threshold=threshold,
+            language=_mis_if_not(language),
+        )
+
+    async def fetch_ceremonies_by_uuids(
+        self,
+        uuids: Iterable[str],
+        *,
+        language: Optional[Language] = MISSING,
+        threshold: int = 10,
+    ) -> BulkFetchResult[Ceremony]:
+        """|coro|
+        
+        Used to fetch many ceremonies by their uuids.
+        
+        Cached ceremonies are returned without a request. If at most ``threshold`` are left
+        they are fetched individually and concurrently, otherwise every ceremony is fetched
+        with a single request.
+        
+        Parameters
+        ----------
+        uuids: Iterable[:class:`str`]
+            The UUIDs of the ceremonies you wish to fetch.
+        language: Optional[:class:`Language`]
+            The language you wish to fetch the ceremonies in.
+        threshold: :class:`int`
+            The most ceremonies to fetch individually. Defaults to ``10``.
+            
+        Returns
+        -------
+        :class:`BulkFetchResult`
+            The ceremonies that were found, in the order given, and the uuids that were not.
+        """
+        return await _fetch_many(
+            uuids,
+            get=self._connection._get_ceremony,
+            fetch_one=lambda uuid: self.fetch_ceremony(uuid, language=language),
+            fetch_all=lambda: self.fetch_ceremonies(language=language),
+            is_unknown=lambda uuid: self._connection._is_unknown('ceremony', uuid),
+            threshold=threshold,
+            language=_mis_if_not(language),
+        )
@@ -30,12 +30,16 @@ from enum import Enum
 
 __all__: Tuple[str, ...] = (
     'Language',
+    'OverflowPolicy',
+    'DecodeStrategy',
+    'RequestPriority',
 )
 
 
 class Language(Enum):
     arAE = 'ar-AE'
     deDE = 'de-DE'
+    enUS = 'en-US'
     enES = 'en-ES'
     esMX = 'es-MX'
     frFR = 'fr-FR'
@@ -51,5 +55,34 @@ class Language(Enum):
     viVN = 'vi-VN'
     zhCN = 'zh-CN'
     zhTW = 'zh-TW'
-    
-    
\ No newline at end of file
+    # Every language at once, see Localizable.
+    all = 'all'
+
+
+class OverflowPolicy(Enum):
+    """What a bounded event queue does with a new event when it is full."""
+    block = 'block'
+    drop_oldest = 'drop_oldest'
+    drop_newest = 'drop_newest'
+
+
+class DecodeStrategy(Enum):
+    """Where response bodies are decoded and how models are built from them."""
+    # Decode and build everything on the event loop in one go.
+    inline = 'inline'
+    # Decode on the event loop, build models in chunks that yield to the loop.
+    chunked = 'chunked'
+    # Decode in a worker thread, build models in chunks.
+    thread = 'thread'
+    # Decode in a worker process, build models in chunks.
+    process = 'process'
+
+
+class RequestPriority(Enum):
+    """How urgently a request should run when requests are waiting for a slot. Lower values go first."""
+    # Answers a user who is waiting on it, such as a command.
+    interactive = 0
+    # Anything not marked otherwise.
+    normal = 1
+    # Bulk work nobody is waiting on, such as refreshes and media downloads.
+    background = 2
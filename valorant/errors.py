@@ -38,7 +38,8 @@ __all__: Tuple[str, ...] = (
     'NotFound',
     'UnsupportedMediaType',
     'InternalServerError',
-    'ServiceUnavailable'
+    'ServiceUnavailable',
+    'AssetDownloadError'
 )
 
 # Exception Hierarchy:
@@ -51,6 +52,7 @@ __all__: Tuple[str, ...] = (
 #     |-- UnsupportedMediaType
 #     |-- InternalServerError
 #     `-- ServiceUnavailable
+# `-- AssetDownloadError
 
 class ValorantError(Exception):
     """
@@ -75,8 +77,9 @@ class HTTPException(ValorantError):
     
     Attributes
     ----------
-    response: :class:`aiohttp.ClientResponse`
-        The response from the API.
+    response: Optional[:class:`aiohttp.ClientResponse`]
+        The response from the API. This is ``None`` when the error was raised
+        locally, for example a :class:`NotFound` served from the negative cache.
     data: Optional[Union[:class:`dict`, :class:`str`]]
         The response data, if any.
     """
@@ -88,12 +91,12 @@ class HTTPException(ValorantError):
     
     def __init__(
         self, 
-        response: ClientResponse,
+        response: Optional[ClientResponse],
         data: Optional[Union[Dict[str, Any], str]],
         *,
         message: Optional[str] = None
     ) -> None:
-        self.response: ClientResponse = response
+        self.response: Optional[ClientResponse] = response
         self.data: Optional[Union[Dict[str, Any], str]] = data
         self.message: Optional[str] = message
 
@@ -176,3 +179,26 @@ class ServiceUnavailable(HTTPException):
     """
     pass
 
+
+class AssetDownloadError(ValorantError):
+    """
+    Raised when some assets passed to :meth:`AssetDownloader.download` could not be downloaded.
+    
+    Every other asset is still downloaded before this is raised.
+    
+    Attributes
+    ----------
+    paths: Dict[:class:`str`, :class:`str`]
+        A mapping of each URL that was downloaded to the local path of its file.
+    errors: Dict[:class:`str`, :class:`Exception`]
+        A mapping of each URL that could not be downloaded to the exception raised for it.
+    """
+    __slots__: Tuple[str, ...] = (
+        'paths',
+        'errors'
+    )
+    
+    def __init__(self, paths: Dict[str, str], errors: Dict[str, BaseException]) -> None:
+        self.paths: Dict[str, str] = paths
+        self.errors: Dict[str, BaseException] = errors
+        super().__init__(f'{len(errors)} of {len(paths) + len(errors)} assets could not be downloaded')
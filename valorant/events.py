@@ -0,0 +1,355 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .enums import OverflowPolicy
+from .utils import _uuid_key
+
+log = logging.getLogger('valorant.events')
+
+__all__: Tuple[str, ...] = (
+    'EventQueueMetrics',
+    'EventQueue',
+)
+
+# coro, event name, args, kwargs
+_Event = Tuple[Callable[..., Awaitable[Any]], str, Tuple[Any, ...], Dict[str, Any]]
+
+# Set in event queue workers. Only workers make room in a queue, so code they run
+# must never wait for room, or every worker could end up waiting on the others.
+_on_worker: ContextVar[bool] = ContextVar('_on_worker', default=False)
+
+
+def _waiter_key(value: Any) -> Hashable:
+    # Models are matched by their integer key and uuid strings are parsed
+    # the same way, so waiting on a uuid matches the model it belongs to.
+    key = getattr(value, '_key', None)
+    if key is not None:
+        return key
+    
+    if isinstance(value, str):
+        return _uuid_key(value)
+    
+    return value
+
+
+class _Waiters:
+    # The futures waiting on one event. Waiters without a key are checked on
+    # every dispatch, keyed waiters only when the first argument matches.
+    __slots__: Tuple[str, ...] = (
+        'unkeyed',
+        'keyed'
+    )
+    
+    def __init__(self) -> None:
+        self.unkeyed: Dict[asyncio.Future, Callable[..., bool]] = {}
+        self.keyed: Dict[Hashable, Dict[asyncio.Future, Callable[..., bool]]] = {}
+        
+    def __bool__(self) -> bool:
+        return bool(self.unkeyed or self.keyed)
+        
+    def add(self, future: asyncio.Future, check: Callable[..., bool], key: Optional[Hashable]) -> None:
+        if key is None:
+            self.unkeyed[future] = check
+        else:
+            self.keyed.setdefault(key, {})[future] = check
+            
+    def discard(self, future: asyncio.Future, key: Optional[Hashable]) -> None:
+        if key is None:
+            self.unkeyed.pop(future, None)
+            return
+        
+        bucket = self.keyed.get(key)
+        if bucket is not None:
+            bucket.pop(future, None)
+            if not bucket:
+                del self.keyed[key]
+        
+    def resolve(self, args: Tuple[Any, ...]) -> None:
+        if self.keyed and args:
+            key = _waiter_key(args[0])
+            bucket = self.keyed.get(key)
+            if bucket:
+                self._resolve(bucket, args)
+                if not bucket:
+                    del self.keyed[key]
+                    
+        if self.unkeyed:
+            self._resolve(self.unkeyed, args)
+        
+    @staticmethod
+    def _resolve(bucket: Dict[asyncio.Future, Callable[..., bool]], args: Tuple[Any, ...]) -> None:
+        for future, check in list(bucket.items()):
+            if future.done():
+                del bucket[future]
+                continue
+            
+            try:
+                result = check(*args)
+            except Exception as exc:
+                future.set_exception(exc)
+                del bucket[future]
+            else:
+                if result:
+                    if len(args) == 0:
+                        future.set_result(None)
+                    elif len(args) == 1:
+                        future.set_result(args[0])
+                    else:
+                        future.set_result(args)
+                    del bucket[future]
+
+
+class EventQueueMetrics:
+    """
+    Counters describing the state of an :class:`EventQueue`.
+    
+    Attributes
+    ----------
+    depth: :class:`int`
+        The number of events waiting to be handled.
+    max_depth: :class:`int`
+        The highest depth seen.
+    enqueued: :class:`int`
+        The number of events accepted into the queue.
+    processed: :class:`int`
+        The number of events handled.
+    dropped: :class:`int`
+        The number of events discarded because the queue was full.
+    total_latency: :class:`float`
+        The total time, in seconds, spent running handlers.
+    max_latency: :class:`float`
+        The longest time, in seconds, a single handler took.
+    """
+    __slots__: Tuple[str, ...] = (
+        'depth',
+        'max_depth',
+        'enqueued',
+        'processed',
+        'dropped',
+        'total_latency',
+        'max_latency'
+    )
+    
+    def __init__(self) -> None:
+        self.depth: int = 0
+        self.max_depth: int = 0
+        self.enqueued: int = 0
+        self.processed: int = 0
+        self.dropped: int = 0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+        
+    def __repr__(self) -> str:
+        return (
+            f'<EventQueueMetrics depth={self.depth} processed={self.processed} '
+            f'dropped={self.dropped} average_latency={self.average_latency:.6f}>'
+        )
+        
+    @property
+    def average_latency(self) -> float:
+        """:class:`float`: The average time, in seconds, a handler took."""
+        return self.total_latency / self.processed if self.processed else 0.0
+    
+
+class EventQueue:
+    """
+    Runs event handlers on a fixed number of worker tasks fed by a bounded queue.
+    
+    This keeps memory and the number of tasks flat no matter how many events are
+    dispatched. What happens to an event that arrives while the queue is full depends
+    on ``overflow``:
+    
+    - :attr:`OverflowPolicy.drop_oldest` discards the oldest queued event.
+    - :attr:`OverflowPolicy.drop_newest` discards the new event.
+    - :attr:`OverflowPolicy.block` makes producers that can wait, such as HTTP requests,
+      wait for room with :meth:`wait_for_capacity`. Events dispatched from synchronous
+      code while the queue is full are discarded.
+    
+    Parameters
+    ----------
+    run: Callable[..., Awaitable[Any]]
+        Called as ``run(coro, event_name, *args, **kwargs)`` to handle an event.
+    maxsize: :class:`int`
+        The maximum number of queued events.
+    workers: :class:`int`
+        The number of worker tasks.
+    overflow: :class:`OverflowPolicy`
+        What to do when the queue is full.
+        
+    Attributes
+    ----------
+    metrics: :class:`EventQueueMetrics`
+        The queue's counters.
+    """
+    __slots__: Tuple[str, ...] = (
+        'run',
+        'maxsize',
+        'workers',
+        'overflow',
+        'metrics',
+        '_queue',
+        '_space',
+        '_tasks',
+        '_generation',
+        '_closed'
+    )
+    
+    def __init__(
+        self,
+        run: Callable[..., Awaitable[Any]],
+        *,
+        maxsize: int,
+        workers: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        if maxsize < 1 or workers < 1:
+            raise ValueError('maxsize and workers must be at least 1')
+        
+        self.run: Callable[..., Awaitable[Any]] = run
+        self.maxsize: int = maxsize
+        self.workers: int = workers
+        self.overflow: OverflowPolicy = overflow
+        self.metrics: EventQueueMetrics = EventQueueMetrics()
+        self._queue: asyncio.Queue[_Event] = asyncio.Queue(maxsize)
+        self._space: asyncio.Event = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._generation: int = 0
+        self._closed: bool = False
+        
+    def _start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(self._generation), name=f'valorantpy: event worker {i}')
+            for i in range(self.workers)
+        ]
+        
+    def put(self, event: _Event) -> bool:
+        """
+        Used to queue an event for handling.
+        
+        Events put after :meth:`close` are dropped.
+        
+        Returns
+        -------
+        :class:`bool`
+            Whether the event was queued.
+        """
+        metrics = self.metrics
+        if self._closed:
+            metrics.dropped += 1
+            log.debug('Event queue is closed, dropping %s', event[1])
+            return False
+        
+        if not self._tasks:
+            self._start()
+            
+        queue = self._queue
+        if queue.full():
+            if self.overflow is OverflowPolicy.drop_oldest:
+                queue.get_nowait()
+                queue.task_done()
+            else:
+                metrics.dropped += 1
+                log.debug('Event queue is full, dropping %s', event[1])
+                return False
+            
+            metrics.dropped += 1
+            
+        queue.put_nowait(event)
+        metrics.enqueued += 1
+        metrics.depth = depth = queue.qsize()
+        if depth > metrics.max_depth:
+            metrics.max_depth = depth
+            
+        return True
+    
+    async def wait_for_capacity(self) -> None:
+        """|coro|
+        
+        Waits until the queue has room for another event. Returns immediately unless the
+        overflow policy is :attr:`OverflowPolicy.block`, or when called from an event handler
+        run by a worker, since only the workers make room.
+        """
+        if self.overflow is not OverflowPolicy.block or _on_worker.get():
+            return
+        
+        queue = self._queue
+        while queue.full() and not self._closed:
+            self._space.clear()
+            await self._space.wait()
+            
+    async def _worker(self, generation: int) -> None:
+        queue = self._queue
+        metrics = self.metrics
+        perf_counter = time.perf_counter
+        
+        _on_worker.set(True)
+        
+        # Handlers swallow cancellation, so a worker cancelled while running one
+        # would keep going. Workers stop once the queue has been closed instead.
+        while generation == self._generation:
+            coro, name, args, kwargs = await queue.get()
+            metrics.depth = queue.qsize()
+            self._space.set()
+            
+            start = perf_counter()
+            try:
+                await self.run(coro, name, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                metrics.processed += 1
+                metrics.total_latency += elapsed
+                if elapsed > metrics.max_latency:
+                    metrics.max_latency = elapsed
+                queue.task_done()
+                
+    async def join(self) -> None:
+        """|coro|
+        
+        Waits until every queued event has been handled.
+        """
+        await self._queue.join()
+        
+    def close(self) -> None:
+        """Stops the worker tasks. Queued events are discarded, and so is every event put afterwards."""
+        self._closed = True
+        self._generation += 1
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        
+        queue = self._queue
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+            
+        self.metrics.depth = 0
+        # Nothing will make room any more, let blocked producers go.
+        self._space.set()
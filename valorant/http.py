@@ -24,10 +24,12 @@ SOFTWARE.
 from __future__ import annotations
 
 import sys
+import time
 import logging
 import asyncio
 import aiohttp
 import weakref
+from contextlib import asynccontextmanager
 from urllib.parse import quote as _uriquote
 
 from typing import (
@@ -41,24 +43,37 @@ from typing import (
     Coroutine,
     Type,
     Dict,
+    Sequence,
+    Mapping,
     Callable, 
-    List
+    List,
+    AsyncIterator
 )
 from types import TracebackType
 
-from . import __version__
+from . import __version__, profiling
 from .utils import _to_json, MISSING, _mis_if_not, json_or_text
 from .errors import *
+from .abc import _LOCALE_KEY
 from .enums import Language
+from .media import Icon
+from .mirrors import Mirror, MirrorPool
+from .retry import RetryPolicy
+from .scheduler import RequestScheduler
 
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    
     from aiohttp import ClientSession
     
+    from .runtime import ValorantRuntime
+    from .scheduler import _Slot
     from .types import (
         agent,
         buddy,
-        ceremony
+        ceremony,
+        version
     )
 
     T = TypeVar('T')
@@ -81,17 +96,23 @@ class Route:
     __slots__: Tuple[str, ...] = (
         'method',
         'path',
-        'url'
+        'url',
+        '_formatted_path'
     )
     
     def __init__(self, method: str, path: str, **parameters: Any) -> None:
         self.method: str = method
         self.path: str = path
         
-        url = self.BASE + self.path
+        formatted_path = self.path
         if parameters:
-            url = url.format_map({k: _uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()})
-        self.url: str = url
+            formatted_path = formatted_path.format_map({k: _uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()})
+        self._formatted_path: str = formatted_path
+        self.url: str = self.BASE + formatted_path
+        
+    def url_for(self, base: str) -> str:
+        # The same route on another base URL, such as a mirror.
+        return base + self._formatted_path
         
     @property
     def bucket(self) -> str:
@@ -120,15 +141,35 @@ class MaybeUnlock:
             self.lock.release()
             
             
+def _retry_after(response: aiohttp.ClientResponse, data: Any) -> Optional[float]:
+    # How long the API asked us to wait, from the body or the Retry-After header.
+    if isinstance(data, dict) and data.get('retry_after') is not None:
+        return float(data['retry_after'])
+    
+    header = response.headers.get('Retry-After')
+    try:
+        return float(header) if header is not None else None
+    except ValueError:
+        return None
+    
+            
 class HTTPClient:
     __slots__: Tuple[str, ...] = (
         '__session',
+        '__weakref__',
         '_locks',
         '_global_over',
         'loop',
         'token',
         'user_agent',
-        'dispatch'
+        'dispatch',
+        'wait_for_dispatch',
+        'decode_executor',
+        'api_mirrors',
+        'media_mirrors',
+        'retry_policy',
+        'route_retry_policies',
+        'scheduler'
     )
     
     def __init__(
@@ -138,14 +179,50 @@ class HTTPClient:
         dispatch: Callable[..., None],
         *,
         session: Optional[ClientSession] = MISSING, 
+        runtime: Optional[ValorantRuntime] = None,
+        api_bases: Optional[Sequence[str]] = None,
+        media_bases: Optional[Sequence[str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        route_retry_policies: Optional[Mapping[str, RetryPolicy]] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ) -> None:
-        self.__session: ClientSession = _mis_if_not(session) or aiohttp.ClientSession() # type: ignore
-        self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
-        self._global_over: asyncio.Event = asyncio.Event()
-        self._global_over.set()
+        if runtime is not None:
+            self.__session: ClientSession = runtime.session
+            self._locks: weakref.WeakValueDictionary = runtime._locks
+            self._global_over: asyncio.Event = runtime._global_over
+            self.scheduler: RequestScheduler = runtime.scheduler
+        else:
+            self.__session = _mis_if_not(session) or aiohttp.ClientSession() # type: ignore
+            self._locks = weakref.WeakValueDictionary()
+            self._global_over = asyncio.Event()
+            self._global_over.set()
+            self.scheduler = scheduler or RequestScheduler()
         self.loop: asyncio.AbstractEventLoop = loop
         self.dispatch: Callable[..., None] = dispatch
         
+        # Set by the client when its event queue applies backpressure to requests.
+        self.wait_for_dispatch: Optional[Callable[[], Coroutine[Any, Any, None]]] = None
+        
+        # Set by the client to decode response bodies off the event loop.
+        self.decode_executor: Optional[Executor] = None
+        
+        # When given, requests are spread over these instead of Route.BASE and Icon.BASE.
+        # Clients of a runtime share its pools, so they agree on which mirrors are healthy.
+        if runtime is not None:
+            self.api_mirrors: Optional[MirrorPool] = runtime.api_mirrors
+            self.media_mirrors: Optional[MirrorPool] = runtime.media_mirrors
+        else:
+            self.api_mirrors = MirrorPool(api_bases) if api_bases else None
+            self.media_mirrors = MirrorPool(media_bases) if media_bases else None
+        
+        # The policy for routes whose path starts with a key of route_retry_policies,
+        # the longest key wins, and retry_policy for every other route. Clients of a
+        # runtime share its policy, and with it its budget, unless given their own.
+        if retry_policy is None:
+            retry_policy = runtime.retry_policy if runtime is not None else RetryPolicy()
+        self.retry_policy: RetryPolicy = retry_policy
+        self.route_retry_policies: Dict[str, RetryPolicy] = dict(route_retry_policies or {})
+        
         self.token: str = token
         
         user_agent = 'valorantpy/{} (https://github.com/NextChai/valorantpy) (Python/{}; aiohttp/{})'
@@ -156,6 +233,20 @@ class HTTPClient:
         self,
         route: Route,
         **kwargs: Any
+    ) -> Any:
+        if not profiling._enabled:
+            return await self._request(route, **kwargs)
+        
+        started = time.perf_counter_ns()
+        try:
+            return await self._request(route, **kwargs)
+        finally:
+            profiling._record('http.request', time.perf_counter_ns() - started)
+        
+    async def _request(
+        self,
+        route: Route,
+        **kwargs: Any
     ) -> Any:
         method = route.method
         bucket = route.bucket
@@ -184,105 +275,257 @@ class HTTPClient:
             # wait until the global lock is complete
             await self._global_over.wait()
             
+        # Event handlers may need a slot to make room, so this is waited for before taking one.
+        if self.wait_for_dispatch is not None:
+            await self.wait_for_dispatch()
+            
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
         await lock.acquire()
         
+        policy = self._retry_policy_for(route)
+        if policy.budget is not None:
+            policy.budget.deposit()
+            
+        mirrors = self.api_mirrors
         with MaybeUnlock(lock) as maybe_lock:
-            for tries in range(5):
-                try:
-                    self.dispatch('request', method, url, bucket, kwargs)
-                    async with self.__session.request(method, url, **kwargs) as response:
-                        log.debug('%s %s with %s has returned %s', method, url, kwargs.get('data'), response.status)
+            # The slot is taken once the route's lock is ours, so requests queued behind one
+            # route do not hold slots. Slots go out in order of priority.
+            async with self.scheduler.slot() as slot:
+                for tries in range(policy.attempts):
+                    mirror = None
+                    if mirrors is not None:
+                        mirror = mirrors.candidates()[0]
+                        url = route.url_for(mirror.base)
+                    
+                    try:
+                        self.dispatch('request', method, url, bucket, kwargs)
+                        started = time.perf_counter()
+                        async with self.__session.request(method, url, **kwargs) as response:
+                            log.debug('%s %s with %s has returned %s', method, url, kwargs.get('data'), response.status)
+                            if mirror is not None:
+                                if response.status >= 500:
+                                    mirrors._failure(mirror)  # type: ignore
+                                else:
+                                    mirrors._success(mirror, time.perf_counter() - started)  # type: ignore
                         
-                        data = await json_or_text(response)
+                            data = await json_or_text(response, executor=self.decode_executor)
                         
-                        if 300 > response.status >= 200:
-                            log.debug('%s %s has received %s', method, url, data)
-                            return data['data'] # type: ignore
+                            if 300 > response.status >= 200:
+                                log.debug('%s %s has received %s', method, url, data)
+                                return data['data'] # type: ignore
                         
-                        # we are being rate limited
-                        if response.status == 429:
-                            if not response.headers.get('Via') or isinstance(data, str):
-                                # Banned by Cloudflare more than likely.
-                                raise HTTPException(response, data)
+                            # we are being rate limited
+                            if response.status == 429:
+                                if not response.headers.get('Via') or isinstance(data, str):
+                                    # Banned by Cloudflare more than likely.
+                                    raise HTTPException(response, data)
+                                
+                                # Retries of a rate limit come out of the same budget as any other.
+                                if not policy._allow(tries):
+                                    raise HTTPException(response, data)
 
-                            fmt = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
-                            log.debug(f'Got rate limited! %s', data)
-                            
-                            continue
+                                retry_after = _retry_after(response, data)
+                                if retry_after is None:
+                                    retry_after = policy.backoff(tries)
+                                    
+                                fmt = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
+                                log.warning(fmt, retry_after, bucket)
+                                await slot.sleep(retry_after)
+                                continue
 
-                        # we've received a 500, 502, or 504, unconditional retry
-                        if response.status in {500, 502, 504}:
-                            await asyncio.sleep(1 + tries * 2)
-                            continue
+                            # transient server errors, retried as the policy allows
+                            if policy.is_retryable_status(response.status) and policy._allow(tries):
+                                # No need to wait when another mirror can take it.
+                                if mirrors is None or not mirrors.candidates()[0].healthy:
+                                    await slot.sleep(policy.backoff(tries))
+                                continue
 
-                        # the usual error cases
-                        if response.status == 403:
-                            raise Forbidden(response, data)
-                        elif response.status == 404:
-                            raise NotFound(response, data)
-                        elif response.status >= 500:
-                            raise InternalServerError(response, data)
-                        else:
-                            raise HTTPException(response, data)
+                            # the usual error cases
+                            if response.status == 403:
+                                raise Forbidden(response, data)
+                            elif response.status == 404:
+                                raise NotFound(response, data)
+                            elif response.status >= 500:
+                                raise InternalServerError(response, data)
+                            else:
+                                raise HTTPException(response, data)
                 
-                # This is handling exceptions from the request
-                except OSError as e:
-                    # Connection reset by peer
-                    if tries < 4 and e.errno in (54, 10054):
-                        await asyncio.sleep(1 + tries * 2)
-                        continue
-                    raise
+                    # This is handling exceptions from the request
+                    except (OSError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                        # Another healthy mirror is worth trying whatever went wrong with this one.
+                        failover = False
+                        if mirror is not None:
+                            mirrors._failure(mirror)  # type: ignore
+                            failover = mirrors.candidates()[0].healthy  # type: ignore
+                        
+                        if (failover or policy.is_retryable_error(e)) and policy._allow(tries):
+                            if not failover:
+                                await slot.sleep(policy.backoff(tries))
+                            continue
+                        raise
                 
-            if response is not None:
-                # We've run out of retries, raise.
-                if response.status >= 500:
-                    raise InternalServerError(response, data)
+                if response is not None:
+                    # We've run out of retries, raise.
+                    if response.status >= 500:
+                        raise InternalServerError(response, data)
 
-                raise HTTPException(response, data)
+                    raise HTTPException(response, data)
+            
+                raise RuntimeError('Unreachable code in HTTP handling')
+        
+    def _retry_policy_for(self, route: Route) -> RetryPolicy:
+        policies = self.route_retry_policies
+        if policies:
+            path = route.path
+            matches = [prefix for prefix in policies if path.startswith(prefix)]
+            if matches:
+                return policies[max(matches, key=len)]
             
-            raise RuntimeError('Unreachable code in HTTP handling')
+        return self.retry_policy
         
-    def _payload_maker(self, **kwargs) -> Dict[Any, Any]:
+    @asynccontextmanager
+    async def cdn_response(
+        self,
+        url: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        if_range: Optional[str] = None
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        # Used for media, which is served from the CDN and not wrapped in the usual
+        # JSON envelope. The body is left unread so callers can stream it. With if_range
+        # the range is only honoured if the file still matches that validator.
+        headers: Dict[str, str] = {'User-Agent': self.user_agent}
+        if start or end is not None:
+            headers['Range'] = f'bytes={start}-{"" if end is None else end}'
+            if if_range is not None:
+                headers['If-Range'] = if_range
+            
+        mirrors = self.media_mirrors
+        if mirrors is not None and url.startswith(Icon.BASE):
+            path = url[len(Icon.BASE):]
+            targets: List[Tuple[Optional[Mirror], str]] = [(mirror, f'{mirror.base}/{path}') for mirror in mirrors.candidates()]
+        else:
+            targets = [(None, url)]
+            
+        # The slot is only held until the headers arrive. Bodies are read at the caller's
+        # pace, which must not keep API requests waiting for a slot.
+        async with self.scheduler.slot() as slot:
+            async with self._cdn_response(targets, headers, start, end, slot) as response:
+                yield response
+                
+    @asynccontextmanager
+    async def _cdn_response(
+        self,
+        targets: List[Tuple[Optional[Mirror], str]],
+        headers: Dict[str, str],
+        start: int,
+        end: Optional[int],
+        slot: _Slot,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        mirrors = self.media_mirrors
+        yielded = False
+        for index, (mirror, target) in enumerate(targets):
+            last = index == len(targets) - 1
+            try:
+                started = time.perf_counter()
+                async with self.__session.get(target, headers=headers) as response:
+                    log.debug('GET %s (range %s-%s) has returned %s', target, start, end, response.status)
+                    if mirror is not None:
+                        if response.status >= 500:
+                            mirrors._failure(mirror)  # type: ignore
+                            if not last:
+                                continue
+                        else:
+                            mirrors._success(mirror, time.perf_counter() - started)  # type: ignore
+                    
+                    if response.status in (200, 206):
+                        slot.release()
+                        yielded = True
+                        yield response
+                        return
+                    
+                    data = await response.read()
+                    if response.status == 403:
+                        raise Forbidden(response, data)
+                    elif response.status == 404:
+                        raise NotFound(response, data)
+                    elif response.status >= 500:
+                        raise InternalServerError(response, data)
+                    
+                    raise HTTPException(response, data)
+            except (OSError, aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                # Errors from the caller's block, or with nowhere left to go, are not ours to handle.
+                if yielded or mirror is None or last:
+                    raise
+                
+                mirrors._failure(mirror)  # type: ignore
+        
+    def _payload_maker(self, **kwargs) -> Dict[str, str]:
+        # Builds the query string, the API expects camelCase names,
+        # lowercase booleans and languages by their locale code.
         payload = {}
         
         for key, value in kwargs.items():
-            if value is not MISSING:
-                payload[key] = value
+            if value is MISSING or value is None:
+                continue
+            
+            if isinstance(value, Language):
+                value = value.value
+            elif isinstance(value, bool):
+                value = 'true' if value else 'false'
+                
+            first, *rest = key.split('_')
+            payload[first + ''.join(part.title() for part in rest)] = value
                 
         return payload
     
+    async def _localized(self, route: Route, language: Optional[Language], **kwargs: Any) -> Any:
+        # Tags what a single language request returns with its locale, see Localizable.
+        # Shallow copies are tagged, the decoded payloads may be shared with event handlers.
+        data = await self.request(route, **kwargs)
+        if language and language is not Language.all:
+            locale = language.value
+            if isinstance(data, list):
+                return [{**item, _LOCALE_KEY: locale} for item in data]
+            return {**data, _LOCALE_KEY: locale}
+                
+        return data
+    
     def get_agents(self, *, language: Optional[Language] = MISSING, is_playable_character: Optional[bool] = MISSING) -> Response[List[agent.Agent]]:
         payload = self._payload_maker(language=language, is_playable_character=is_playable_character)
-        return self.request(Route('GET', '/agents'), json=payload)
+        return self._localized(Route('GET', '/agents'), language, params=payload)
     
     def get_agent(self, uuid: str, *, language: Optional[Language] = MISSING) -> Response[agent.Agent]:
         payload = self._payload_maker(language=language)
-        return self.request(Route('GET', f'/agents/{uuid}'), json=payload)
+        return self._localized(Route('GET', f'/agents/{uuid}'), language, params=payload)
     
     def get_buddies(self, *, language: Optional[Language] = MISSING) -> Response[List[buddy.Buddy]]:
         payload = self._payload_maker(language=language)
-        return self.request(Route('GET', '/buddies'), json=payload)
+        return self._localized(Route('GET', '/buddies'), language, params=payload)
     
     def get_buddy(self, uuid: str, *, language: Optional[Language] = MISSING) -> Response[buddy.Buddy]:
         payload = self._payload_maker(language=language)
-        return self.request(Route('GET', f'/buddies/{uuid}'), json=payload)
+        return self._localized(Route('GET', f'/buddies/{uuid}'), language, params=payload)
     
     def get_buddy_levels(self, *, language: Optional[Language] = MISSING) -> Response[List[buddy.BuddyLevel]]:
         payload = self._payload_maker(language=language)
-        return self.request(Route('GET', '/buddies/levels'), json=payload)
+        return self._localized(Route('GET', '/buddies/levels'), language, params=payload)
     
     def get_buddy_level(self, uuid: str, *, language: Optional[Language] = MISSING) -> Response[buddy.BuddyLevel]:
         payload = self._payload_maker(language=language)  
-        return self.request(Route('GET', f'/buddies/levels/{uuid}'), json=payload)
+        return self._localized(Route('GET', f'/buddies/levels/{uuid}'), language, params=payload)
     
     def get_ceremonies(self, *, language: Optional[Language] = MISSING) -> Response[List[ceremony.Ceremony]]:
         payload = self._payload_maker(language=language)
-        return self.request(Route('GET', '/ceremonies'), json=payload)
+        return self._localized(Route('GET', '/ceremonies'), language, params=payload)
     
     def get_ceremony(self, uuid: str, *, language: Optional[Language] = MISSING) -> Response[ceremony.Ceremony]:
         payload = self._payload_maker(language=language)
-        return self.request(Route('GET', f'/ceremonies/{uuid}'), json=payload)
+        return self._localized(Route('GET', f'/ceremonies/{uuid}'), language, params=payload)
+    
+    def get_version(self) -> Response[version.Version]:
+        return self.request(Route('GET', '/version'))
     
     
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import os
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+from .assets import _hash_file
+
+try:
+    import PIL  # noqa: F401
+except ModuleNotFoundError:
+    HAS_PIL = False
+else:
+    HAS_PIL = True
+
+if TYPE_CHECKING:
+    from .assets import AssetDownloader
+    from .media import Icon
+
+log = logging.getLogger('valorant.imaging')
+
+__all__: Tuple[str, ...] = (
+    'ImageSpec',
+    'ImagePipeline',
+)
+
+
+_PIL_FORMATS: Dict[str, str] = {'jpg': 'JPEG'}
+
+
+class ImageSpec(NamedTuple):
+    """
+    Describes a derivative of an image.
+    
+    The image is scaled down to fit inside ``width`` x ``height``, keeping its aspect ratio.
+    
+    Attributes
+    ----------
+    width: :class:`int`
+        The maximum width of the derivative.
+    height: :class:`int`
+        The maximum height of the derivative.
+    format: :class:`str`
+        The format to encode the derivative in. Defaults to ``webp``.
+    quality: :class:`int`
+        The encoder quality, for lossy formats. Defaults to ``80``.
+    """
+    width: int
+    height: int
+    format: str = 'webp'
+    quality: int = 80
+    
+    @property
+    def _suffix(self) -> str:
+        return f'{self.width}x{self.height}-q{self.quality}.{self.format.lower()}'
+
+
+def _render(source: str, target: str, spec: ImageSpec) -> str:
+    # Runs in a worker process. Paths are passed instead of bytes so
+    # image data never has to be pickled across the process boundary.
+    from PIL import Image
+    
+    # Pillow only knows JPEG by that name.
+    fmt = spec.format.lower()
+    fmt = _PIL_FORMATS.get(fmt, fmt.upper())
+    
+    with Image.open(source) as image:
+        image.thumbnail((spec.width, spec.height))
+        if fmt == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        
+        partial = f'{target}.{os.getpid()}.tmp'
+        image.save(partial, format=fmt, quality=spec.quality)
+        
+    os.replace(partial, target)
+    return target
+
+
+class ImagePipeline:
+    """
+    Produces resized and re-encoded derivatives of images in a process pool.
+    
+    Derivatives are cached on disk by the SHA-256 of the source and the :class:`ImageSpec`,
+    so each one is only ever rendered once. All work happens in worker processes or
+    threads and never blocks the event loop. Requires ``Pillow``.
+    
+    .. code-block:: python3
+
+        store = valorant.AssetStore('media/')
+        downloader = valorant.AssetDownloader(client.http, store)
+        
+        async with valorant.ImagePipeline('derivatives/') as pipeline:
+            icons = [agent.full_portrait for agent in agents if agent.full_portrait]
+            paths = await pipeline.render_icons(icons, [valorant.ImageSpec(128, 128)], downloader=downloader)
+    
+    Parameters
+    ----------
+    directory: Union[:class:`str`, :class:`os.PathLike`]
+        Where derivatives are written.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor to render in. A :class:`concurrent.futures.ProcessPoolExecutor` with one
+        worker per core is created, and owned by the pipeline, if not given.
+    max_workers: Optional[:class:`int`]
+        The number of workers of the created executor. Ignored if ``executor`` is given.
+    """
+    __slots__: Tuple[str, ...] = (
+        'directory',
+        'executor',
+        '_owns_executor',
+        '_pending'
+    )
+    
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        *,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if not HAS_PIL:
+            raise RuntimeError('Pillow is required to use the image pipeline')
+        
+        self.directory: str = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        
+        self._owns_executor: bool = executor is None
+        self.executor: Executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+        self._pending: Dict[str, asyncio.Future[str]] = {}
+        
+    async def __aenter__(self) -> ImagePipeline:
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+        
+    def close(self) -> None:
+        """Shuts down the executor, if the pipeline created it."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            
+    def _target_path(self, digest: str, spec: ImageSpec) -> str:
+        return os.path.join(self.directory, digest[:2], f'{digest}-{spec._suffix}')
+        
+    async def render(self, source: Union[str, os.PathLike], spec: ImageSpec, *, digest: Optional[str] = None) -> str:
+        """|coro|
+        
+        Used to render a single derivative of an image file.
+        
+        Parameters
+        ----------
+        source: Union[:class:`str`, :class:`os.PathLike`]
+            The path of the source image.
+        spec: :class:`ImageSpec`
+            The derivative to render.
+        digest: Optional[:class:`str`]
+            The SHA-256 hex digest of the source, if already known. It's computed
+            in a thread if not given.
+            
+        Returns
+        -------
+        :class:`str`
+            The path of the derivative.
+        """
+        loop = asyncio.get_running_loop()
+        source = os.fspath(source)
+        if digest is None:
+            hashed, _ = await loop.run_in_executor(None, _hash_file, source)
+            digest = hashed.hexdigest()
+            
+        target = self._target_path(digest, spec)
+        if os.path.exists(target):
+            return target
+        
+        # Concurrent requests for the same derivative share one render.
+        try:
+            return await asyncio.shield(self._pending[target])
+        except KeyError:
+            pass
+        
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        future = asyncio.ensure_future(loop.run_in_executor(self.executor, _render, source, target, spec))
+        self._pending[target] = future
+        future.add_done_callback(lambda _: self._pending.pop(target, None))
+        
+        log.debug('Rendering %s from %s', target, source)
+        return await asyncio.shield(future)
+    
+    async def render_icons(
+        self,
+        icons: Iterable[Icon],
+        specs: Iterable[ImageSpec],
+        *,
+        downloader: AssetDownloader,
+    ) -> Dict[str, List[str]]:
+        """|coro|
+        
+        Used to download icons and render every derivative of each of them.
+        
+        Parameters
+        ----------
+        icons: Iterable[:class:`Icon`]
+            The icons to render.
+        specs: Iterable[:class:`ImageSpec`]
+            The derivatives to render for every icon.
+        downloader: :class:`AssetDownloader`
+            Used to fetch the source images into its store, or find them there.
+            
+        Returns
+        -------
+        Dict[:class:`str`, List[:class:`str`]]
+            A mapping of each icon's URL to the paths of its derivatives, in the order of ``specs``.
+        """
+        # Keyed by URL since icons of the same item share a uuid.
+        urls = list(dict.fromkeys(icon.url for icon in icons))
+        specs = list(specs)
+        
+        sources = await downloader.download(urls)
+        store = downloader.store
+        
+        async def _render_all(url: str) -> List[str]:
+            digest = store.digest_for(url)
+            return list(await asyncio.gather(*(self.render(sources[url], spec, digest=digest) for spec in specs)))
+        
+        results = await asyncio.gather(*map(_render_all, urls))
+        return dict(zip(urls, results))
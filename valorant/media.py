@@ -23,23 +23,35 @@ SOFTWARE.
 """
 from __future__ import annotations
 
-import re
-from functools import cached_property
-from typing import Final, Tuple, TypeVar, Type, Literal
+import sys
+import time
+from typing import ClassVar, Dict, Final, Tuple, TypeVar, Type
 
+from . import profiling
 from .abc import Hashable
+from .utils import cached_slot_property, _uuid_key
 
 __all__: Tuple[str, ...] = (
     'Icon',
 )
 
 I = TypeVar('I', bound='Icon')
+
+
+def _is_uuid(value: str) -> bool:
+    return (
+        len(value) == 36
+        and value[8] == value[13] == value[18] == value[23] == '-'
+        and value.replace('-', '').isalnum()
+    )
     
 
 class Icon(Hashable):
     """
     Represents an icon for an item.
     
+    Icons are interned by URL, so parsing the same URL twice returns the same instance.
+    
     .. container:: operations
 
         .. describe:: x == y
@@ -62,8 +74,13 @@ class Icon(Hashable):
     
     Attributes
     ----------
+    type: :class:`str`
+        The type of item the icon belongs to, for example ``agents``.
     uuid: :class:`str`
         The uuid of the icon.
+    path: :class:`str`
+        The path between the uuid and the filename, for example ``abilities/ability1``.
+        Empty if there is none.
     filename: :class:`str`
         The filename of the icon.
     format: :class:`str`
@@ -73,37 +90,74 @@ class Icon(Hashable):
         'uuid',
         'filename', 
         'format',
-        'type'
+        'type',
+        'path',
+        '_cs_url'
     )
     
     BASE: Final[str] = 'https://media.valorant-api.com/'
+    
+    _pool: ClassVar[Dict[str, Icon]] = {}
 
-    def __init__(self, *, type: str, uuid: str, filename: str, format: str) -> None:
+    def __init__(self, *, type: str, uuid: str, filename: str, format: str, path: str = '') -> None:
         self.uuid: str = uuid
+        self._key = _uuid_key(uuid)
         self.filename: str = filename
         self.format: str = format
         self.type: str = type
+        self.path: str = path
         
     def __str__(self) -> str:
         return self.url
     
     @classmethod
     def _from_url(cls: Type[I], url: str) -> I:
-        icon_regex = re.compile(r'https://media.valorant-api.com/'       # base
-                        r'(?P<path>[\w]{1,}\/){1,}'                      # URL Path: EX: /agents
-                        r'(?P<uuid>[\w]{8}-([\w]{4}-){3}[\w]{12})'       # Uuid of item
-                        r'/((?:[\w]{1,}/){1,})?'                         # Path, if there: EX: 
-                        r'(?P<filename>[\w]{1,})'                        # Filename: EX: displayicon
-                        r'\.(?P<format>[\w]{1,})')                       # File format: EX: .png
+        try:
+            return cls._pool[url]  # type: ignore
+        except KeyError:
+            pass
+        
+        if not profiling._enabled:
+            return cls._parse(url)
+        
+        started = time.perf_counter_ns()
+        try:
+            return cls._parse(url)
+        finally:
+            profiling._record('icon.parse', time.perf_counter_ns() - started)
+        
+    @classmethod
+    def _parse(cls: Type[I], url: str) -> I:
+        # Icon URLs look like BASE/<type>/<uuid>/[<path>/]<filename>.<format>
+        # where <type> and <path> may contain more than one segment.
+        if not url.startswith(cls.BASE):
+            raise ValueError(f'Invalid URL: {url}')
+        
+        segments = url[len(cls.BASE):].split('/')
+        for index, segment in enumerate(segments):
+            if _is_uuid(segment):
+                break
+        else:
+            raise ValueError(f'Invalid URL: {url}')
         
-        match = icon_regex.match(url)
-        if not match:
+        filename, _, format = segments[-1].rpartition('.')
+        if not index or index == len(segments) - 1 or not filename or not format:
             raise ValueError(f'Invalid URL: {url}')
         
-        path, uuid, _, _, filename, format = match.groups()
-        return cls(type=path, uuid=uuid, filename=filename, format=format)
+        intern = sys.intern
+        icon = cls(
+            type=intern('/'.join(segments[:index])),
+            uuid=segments[index],
+            filename=intern(filename),
+            format=intern(format),
+            path=intern('/'.join(segments[index + 1:-1])),
+        )
+        icon._cs_url = url
+        cls._pool[url] = icon
+        return icon
     
-    @cached_property
+    @cached_slot_property('_cs_url')
     def url(self) -> str:
-        return f'{self.BASE}/{self.uuid}/{self.filename}.{self.format}'
-    
\ No newline at end of file
+        """:class:`str`: The complete URL of the icon."""
+        path = f'{self.path}/' if self.path else ''
+        return f'{self.BASE}{self.type}/{self.uuid}/{path}{self.filename}.{self.format}'
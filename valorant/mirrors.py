@@ -0,0 +1,145 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import time
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+log = logging.getLogger('valorant.mirrors')
+
+__all__: Tuple[str, ...] = (
+    'Mirror',
+    'MirrorPool',
+)
+
+
+class Mirror:
+    """
+    A base URL that serves the API or its media, and how well it has been doing.
+    
+    Attributes
+    ----------
+    base: :class:`str`
+        The base URL.
+    latency: Optional[:class:`float`]
+        The moving average time to a response, in seconds, or ``None`` before the first one.
+    failures: :class:`int`
+        How many requests in a row have failed.
+    """
+    __slots__: Tuple[str, ...] = (
+        'base',
+        'latency',
+        'failures',
+        '_retry_at'
+    )
+    
+    def __init__(self, base: str) -> None:
+        self.base: str = base.rstrip('/')
+        self.latency: Optional[float] = None
+        self.failures: int = 0
+        self._retry_at: float = 0.0
+        
+    def __repr__(self) -> str:
+        return f'<Mirror base={self.base!r} latency={self.latency} healthy={self.healthy}>'
+    
+    @property
+    def healthy(self) -> bool:
+        """:class:`bool`: Whether the mirror is used, it is skipped for a while after failing."""
+        return self._retry_at <= time.monotonic()
+
+
+class MirrorPool:
+    """
+    An ordered set of mirrors that requests are spread over by health and latency.
+    
+    Requests go to the healthy mirror with the lowest moving average latency. Mirrors
+    without a measurement yet are tried first, in the order given, so every mirror is
+    measured. A mirror that fails is skipped for ``cooldown`` seconds, doubling with
+    each failure in a row up to ``max_cooldown``. When every mirror is failing, the one
+    that will recover first is used.
+    
+    Parameters
+    ----------
+    bases: Sequence[:class:`str`]
+        The base URLs, in order of preference.
+    alpha: :class:`float`
+        The weight of a new latency sample in the moving average. Defaults to ``0.3``.
+    cooldown: :class:`float`
+        How long a mirror is skipped after its first failure, in seconds. Defaults to ``5.0``.
+    max_cooldown: :class:`float`
+        The longest a mirror is skipped for, in seconds. Defaults to ``300.0``.
+    
+    Attributes
+    ----------
+    mirrors: List[:class:`Mirror`]
+        The mirrors, in the order given.
+    """
+    __slots__: Tuple[str, ...] = (
+        'mirrors',
+        'alpha',
+        'cooldown',
+        'max_cooldown'
+    )
+    
+    def __init__(self, bases: Sequence[str], *, alpha: float = 0.3, cooldown: float = 5.0, max_cooldown: float = 300.0) -> None:
+        if not bases:
+            raise ValueError('At least one base URL is required')
+        
+        self.mirrors: List[Mirror] = [Mirror(base) for base in bases]
+        self.alpha: float = alpha
+        self.cooldown: float = cooldown
+        self.max_cooldown: float = max_cooldown
+        
+    def __repr__(self) -> str:
+        return f'<MirrorPool mirrors={self.mirrors!r}>'
+        
+    def candidates(self) -> List[Mirror]:
+        """
+        Used to get the mirrors in the order they should be tried.
+        
+        Returns
+        -------
+        List[:class:`Mirror`]
+            Healthy mirrors by latency, then failing mirrors by when they recover.
+        """
+        now = time.monotonic()
+        healthy = [mirror for mirror in self.mirrors if mirror._retry_at <= now]
+        healthy.sort(key=lambda mirror: mirror.latency or 0.0)
+        failing = sorted((mirror for mirror in self.mirrors if mirror._retry_at > now), key=lambda mirror: mirror._retry_at)
+        return healthy + failing
+    
+    def _success(self, mirror: Mirror, latency: float) -> None:
+        mirror.failures = 0
+        mirror._retry_at = 0.0
+        if mirror.latency is None:
+            mirror.latency = latency
+        else:
+            mirror.latency += self.alpha * (latency - mirror.latency)
+            
+    def _failure(self, mirror: Mirror) -> None:
+        mirror.failures += 1
+        cooldown = min(self.cooldown * 2 ** (mirror.failures - 1), self.max_cooldown)
+        mirror._retry_at = time.monotonic() + cooldown
+        log.warning('Mirror %s failed %s time(s) in a row, skipping it for %.1fs', mirror.base, mirror.failures, cooldown)
@@ -0,0 +1,344 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+log = logging.getLogger('valorant.profiling')
+
+__all__: Tuple[str, ...] = (
+    'Histogram',
+    'SampledProfile',
+    'enable_timers',
+    'disable_timers',
+    'timers',
+    'reset_timers',
+    'timed',
+)
+
+# Checked by every hot path hook, keep it a plain module global so a disabled
+# hook costs one global lookup.
+_enabled: bool = False
+_timers: Dict[str, Histogram] = {}
+
+# Each power of two is split into this many buckets, which bounds the
+# error of a reported percentile to about 19%.
+_SUB_BUCKET_BITS: int = 2
+_SUB_BUCKETS: int = 1 << _SUB_BUCKET_BITS
+
+_PACKAGE_DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+
+
+def _bucket_for(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    
+    bits = value.bit_length()
+    return (bits - _SUB_BUCKET_BITS) * _SUB_BUCKETS + ((value >> (bits - _SUB_BUCKET_BITS - 1)) & (_SUB_BUCKETS - 1))
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index
+    
+    shift, sub = divmod(index, _SUB_BUCKETS)
+    shift += _SUB_BUCKET_BITS - 1
+    return ((_SUB_BUCKETS + sub + 1) << shift >> _SUB_BUCKET_BITS) - 1
+
+
+class Histogram:
+    """
+    An aggregated, log bucketed histogram of durations in nanoseconds.
+    
+    Recording is a couple of integer operations and memory does not grow with the
+    number of samples. Percentiles are approximate, within about 19% of the real value.
+    
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the timer.
+    count: :class:`int`
+        How many durations were recorded.
+    total: :class:`int`
+        The sum of every recorded duration.
+    min: :class:`int`
+        The shortest recorded duration.
+    max: :class:`int`
+        The longest recorded duration.
+    """
+    __slots__: Tuple[str, ...] = (
+        'name',
+        'count',
+        'total',
+        'min',
+        'max',
+        '_buckets'
+    )
+    
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.count: int = 0
+        self.total: int = 0
+        self.min: int = 0
+        self.max: int = 0
+        self._buckets: Dict[int, int] = {}
+        
+    def __repr__(self) -> str:
+        return f'<Histogram name={self.name!r} count={self.count} p50={self.percentile(50)} p99={self.percentile(99)}>'
+    
+    def record(self, duration: int) -> None:
+        """
+        Used to record a duration.
+        
+        Parameters
+        ----------
+        duration: :class:`int`
+            The duration, in nanoseconds.
+        """
+        if not self.count or duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+            
+        self.count += 1
+        self.total += duration
+        
+        index = _bucket_for(duration)
+        buckets = self._buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        
+    @property
+    def mean(self) -> float:
+        """:class:`float`: The mean duration in nanoseconds, ``0.0`` if nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+        
+    def percentile(self, percent: float) -> int:
+        """
+        Used to get an approximate percentile of the recorded durations.
+        
+        Parameters
+        ----------
+        percent: :class:`float`
+            The percentile, from ``0`` to ``100``.
+            
+        Returns
+        -------
+        :class:`int`
+            The duration in nanoseconds, ``0`` if nothing was recorded.
+        """
+        if not self.count:
+            return 0
+        
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(_bucket_upper_bound(index), self.max)
+            
+        return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict[:class:`str`, Any]: A summary of the histogram, durations in nanoseconds."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+        }
+
+
+def _record(name: str, duration: int) -> None:
+    try:
+        histogram = _timers[name]
+    except KeyError:
+        histogram = _timers[name] = Histogram(name)
+        
+    histogram.record(duration)
+
+
+def enable_timers() -> None:
+    """
+    Used to turn on the timers built into the library's hot paths.
+    
+    The timers are shared by every client in the process. They are:
+    
+    - ``http.request``: a whole API request, including retries.
+    - ``http.decode``: decoding a response body.
+    - ``icon.parse``: parsing an icon URL that was not seen before.
+    - ``state.store_<kind>``: building and caching a model, e.g. ``state.store_agent``.
+    - ``client.dispatch``: dispatching an event that has handlers or waiters.
+    """
+    global _enabled
+    _enabled = True
+    
+
+def disable_timers() -> None:
+    """Used to turn off the hot path timers. Recorded histograms are kept."""
+    global _enabled
+    _enabled = False
+    
+    
+def timers() -> Dict[str, Histogram]:
+    """
+    Used to get the recorded histograms.
+    
+    Returns
+    -------
+    Dict[:class:`str`, :class:`Histogram`]
+        A mapping of timer name to its histogram.
+    """
+    return dict(_timers)
+
+
+def reset_timers() -> None:
+    """Used to drop every recorded histogram."""
+    _timers.clear()
+    
+    
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """
+    Used to time a block of code into the histogram ``name``.
+    
+    The block is always timed, whether or not the hot path timers are enabled.
+    
+    .. code-block:: python3
+
+        with valorant.timed('bot.refresh'):
+            await client.refresh()
+        
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of the histogram to record into.
+    """
+    started = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter_ns() - started)
+
+
+class SampledProfile:
+    """
+    A sampled profile of one thread, made by :meth:`ValorantClient.profile`.
+    
+    Only samples with at least one frame from this library are kept. Stacks are
+    stored collapsed, one ``frame;frame;frame`` string per unique stack, which is
+    the input format of ``flamegraph.pl`` and speedscope.
+    
+    Attributes
+    ----------
+    interval: :class:`float`
+        The time between samples, in seconds.
+    samples: :class:`collections.Counter`
+        How many times each collapsed stack was seen.
+    total: :class:`int`
+        How many samples were taken, including the ones that were not kept.
+    """
+    __slots__: Tuple[str, ...] = (
+        'interval',
+        'samples',
+        'total',
+        '_thread_id',
+        '_stop',
+        '_thread'
+    )
+    
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.interval: float = interval
+        self.samples: Counter[str] = Counter()
+        self.total: int = 0
+        self._thread_id: int = thread_id
+        self._stop: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+    def __repr__(self) -> str:
+        return f'<SampledProfile stacks={len(self.samples)} kept={sum(self.samples.values())} total={self.total}>'
+        
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='valorant-profiler', daemon=True)
+        self._thread.start()
+        
+    def _finish(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            
+            self.total += 1
+            stack: List[str] = []
+            ours = False
+            while frame is not None:
+                code = frame.f_code
+                filename = code.co_filename
+                if not ours and filename.startswith(_PACKAGE_DIRECTORY):
+                    ours = True
+                stack.append(f'{code.co_name} ({os.path.basename(filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+                
+            if ours:
+                stack.reverse()
+                self.samples[';'.join(stack)] += 1
+                
+    def to_collapsed(self) -> str:
+        """
+        Used to render the profile in the collapsed stack format.
+        
+        Returns
+        -------
+        :class:`str`
+            One ``stack count`` line per unique stack.
+        """
+        return '\n'.join(f'{stack} {count}' for stack, count in self.samples.most_common())
+    
+    def write(self, path: str) -> None:
+        """
+        Used to write the profile to a file in the collapsed stack format.
+        
+        Parameters
+        ----------
+        path: :class:`str`
+            Where to write the profile.
+        """
+        with open(path, 'w', encoding='utf-8') as fp:
+            fp.write(self.to_collapsed())
+            fp.write('\n')
@@ -0,0 +1,240 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import time
+import errno
+import random
+import asyncio
+import logging
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+import aiohttp
+
+from .utils import MISSING
+
+log = logging.getLogger('valorant.retry')
+
+__all__: Tuple[str, ...] = (
+    'RetryBudget',
+    'RetryPolicy',
+)
+
+# Connection reset by peer on macOS/BSD, Linux and Windows.
+_RESET_ERRNOS: FrozenSet[int] = frozenset({54, 104, 10054, errno.ECONNRESET})
+
+
+class RetryBudget:
+    """
+    A token bucket that caps retries to a fraction of all requests.
+    
+    Every request adds ``ratio`` tokens and every retry takes one, so no more than
+    about ``ratio`` retries are made per request over time. ``min_per_second`` tokens
+    are added every second as well, so a client with little traffic can still retry.
+    Share one budget between clients to cap retries across all of them.
+    
+    Parameters
+    ----------
+    ratio: :class:`float`
+        Retries allowed per request. Defaults to ``0.2``.
+    min_per_second: :class:`float`
+        Retries allowed per second regardless of traffic. Defaults to ``1.0``.
+    capacity: :class:`float`
+        The most tokens the bucket holds, which bounds a burst of retries. Defaults to ``10.0``.
+    """
+    __slots__: Tuple[str, ...] = (
+        'ratio',
+        'min_per_second',
+        'capacity',
+        '_tokens',
+        '_updated'
+    )
+    
+    def __init__(self, ratio: float = 0.2, *, min_per_second: float = 1.0, capacity: float = 10.0) -> None:
+        self.ratio: float = ratio
+        self.min_per_second: float = min_per_second
+        self.capacity: float = capacity
+        self._tokens: float = capacity
+        self._updated: float = time.monotonic()
+        
+    def __repr__(self) -> str:
+        return f'<RetryBudget ratio={self.ratio} tokens={self.tokens:.2f}>'
+        
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+        
+    @property
+    def tokens(self) -> float:
+        """:class:`float`: How many retries the budget allows right now."""
+        self._refill()
+        return self._tokens
+        
+    def deposit(self) -> None:
+        """Used to record a request, which adds ``ratio`` tokens."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+        
+    def withdraw(self) -> bool:
+        """
+        Used to take a token for a retry.
+        
+        Returns
+        -------
+        :class:`bool`
+            Whether the retry is allowed.
+        """
+        self._refill()
+        if self._tokens < 1.0:
+            return False
+        
+        self._tokens -= 1.0
+        return True
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait before each retry.
+    
+    Waits use exponential backoff with full jitter: a random time between zero and
+    ``min(cap, base * 2 ** retry)`` seconds. Connection errors, timeouts, resets by
+    peer and the statuses in ``statuses`` are retried, everything else fails at once.
+    Rate limited requests are retried after the wait the API asks for, or the backoff
+    if it names none, and count against :attr:`attempts` and the budget like any other.
+    
+    Parameters
+    ----------
+    attempts: :class:`int`
+        The most times a request is sent, including the first. Defaults to ``5``.
+    base: :class:`float`
+        The backoff of the first retry, before jitter, in seconds. Defaults to ``1.0``.
+    cap: :class:`float`
+        The longest backoff, before jitter, in seconds. Defaults to ``30.0``.
+    statuses: Iterable[:class:`int`]
+        The response statuses that are retried. Defaults to ``500``, ``502``, ``503`` and ``504``.
+    budget: Optional[:class:`RetryBudget`]
+        The budget retries are taken from. A new :class:`RetryBudget` is used if not given,
+        pass ``None`` to retry without a budget.
+        
+    Attributes
+    ----------
+    attempts: :class:`int`
+        The most times a request is sent.
+    base: :class:`float`
+        The backoff of the first retry, in seconds.
+    cap: :class:`float`
+        The longest backoff, in seconds.
+    statuses: FrozenSet[:class:`int`]
+        The response statuses that are retried.
+    budget: Optional[:class:`RetryBudget`]
+        The budget retries are taken from, if any.
+    """
+    __slots__: Tuple[str, ...] = (
+        'attempts',
+        'base',
+        'cap',
+        'statuses',
+        'budget'
+    )
+    
+    def __init__(
+        self,
+        *,
+        attempts: int = 5,
+        base: float = 1.0,
+        cap: float = 30.0,
+        statuses: Iterable[int] = (500, 502, 503, 504),
+        budget: Optional[RetryBudget] = MISSING,
+    ) -> None:
+        self.attempts: int = attempts
+        self.base: float = base
+        self.cap: float = cap
+        self.statuses: FrozenSet[int] = frozenset(statuses)
+        self.budget: Optional[RetryBudget] = RetryBudget() if budget is MISSING else budget
+        
+    def __repr__(self) -> str:
+        return f'<RetryPolicy attempts={self.attempts} base={self.base} cap={self.cap} budget={self.budget!r}>'
+    
+    def backoff(self, retry: int) -> float:
+        """
+        Used to get how long to wait before a retry.
+        
+        Parameters
+        ----------
+        retry: :class:`int`
+            How many retries were made before this one.
+            
+        Returns
+        -------
+        :class:`float`
+            The time to wait, in seconds.
+        """
+        return random.uniform(0.0, min(self.cap, self.base * 2 ** retry))
+    
+    def is_retryable_error(self, error: BaseException) -> bool:
+        """
+        Used to check whether a request that raised ``error`` should be retried.
+        
+        Parameters
+        ----------
+        error: :class:`BaseException`
+            The error the request raised.
+            
+        Returns
+        -------
+        :class:`bool`
+            Whether the error is transient.
+        """
+        if isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+            return True
+        
+        return isinstance(error, OSError) and error.errno in _RESET_ERRNOS
+    
+    def is_retryable_status(self, status: int) -> bool:
+        """
+        Used to check whether a response with ``status`` should be retried.
+        
+        Parameters
+        ----------
+        status: :class:`int`
+            The status of the response.
+            
+        Returns
+        -------
+        :class:`bool`
+            Whether the status is in :attr:`statuses`.
+        """
+        return status in self.statuses
+    
+    def _allow(self, attempt: int) -> bool:
+        # attempt is zero based, so attempt + 1 requests have been sent.
+        if attempt + 1 >= self.attempts:
+            return False
+        
+        if self.budget is not None and not self.budget.withdraw():
+            log.warning('Retry budget exhausted, not retrying')
+            return False
+        
+        return True
@@ -0,0 +1,196 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
+
+import aiohttp
+
+from .http import HTTPClient
+from .mirrors import MirrorPool
+from .retry import RetryPolicy
+from .scheduler import RequestScheduler
+from .state import ConnectionState
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+log = logging.getLogger('valorant.runtime')
+
+__all__: Tuple[str, ...] = (
+    'ValorantRuntime',
+)
+
+
+def _ignore_dispatch(event: str, *args: Any, **kwargs: Any) -> None:
+    pass
+
+
+class ValorantRuntime:
+    """
+    Resources that many :class:`ValorantClient` instances can share.
+    
+    Clients created with the same runtime use one connection pool, one set of
+    rate limit locks, one :class:`RequestScheduler`, one set of mirror pools
+    and one catalogue cache, no
+    matter which token or event handlers each of them has. A model fetched by
+    one client is returned from the cache to every other client. Media is
+    streamed through the runtime's own HTTP client, never through a tenant's.
+    All clients of a runtime must run on the same event loop.
+    
+    .. code-block:: python3
+
+        runtime = valorant.ValorantRuntime()
+        clients = {tenant: valorant.ValorantClient(token, runtime=runtime) for tenant, token in tokens.items()}
+        ...
+        await runtime.close()
+    
+    Parameters
+    ----------
+    session: Optional[:class:`aiohttp.ClientSession`]
+        The session to share. One is created, with a connection pool of
+        ``connection_limit`` connections, if not given.
+    connection_limit: :class:`int`
+        The size of the created session's connection pool. Defaults to ``100``.
+    request_concurrency: :class:`int`
+        The most requests running at once across every client. Defaults to ``16``.
+    priority_aging: :class:`float`
+        How quickly waiting requests gain on higher priorities. See :class:`RequestScheduler`.
+    api_bases: Optional[Sequence[:class:`str`]]
+        Base URLs every client sends API requests to. See :class:`ValorantClient`.
+    media_bases: Optional[Sequence[:class:`str`]]
+        Base URLs media is downloaded from. See :class:`ValorantClient`.
+    retry_policy: Optional[:class:`RetryPolicy`]
+        The retry policy of every client that is not given its own. A :class:`RetryPolicy`
+        is created if not given, so the clients share one :class:`RetryBudget`.
+    lazy: :class:`bool`
+        Whether cached models decode heavy attributes on first access. See :class:`ValorantClient`.
+    negative_cache_ttl: Optional[:class:`float`]
+        How long a :class:`NotFound` is remembered. See :class:`ValorantClient`.
+    known_uuid_filter: :class:`bool`
+        Whether full collections reject unknown uuids. See :class:`ValorantClient`.
+    store_chunk_size: Optional[:class:`int`]
+        If given, collections are built this many models at a time, yielding to the event
+        loop in between.
+    
+    Attributes
+    ----------
+    session: :class:`aiohttp.ClientSession`
+        The shared session.
+    state: :class:`ConnectionState`
+        The shared catalogue cache.
+    http: :class:`HTTPClient`
+        The HTTP client cached models stream media with. It sends no token.
+    scheduler: :class:`RequestScheduler`
+        The shared request scheduler.
+    api_mirrors: Optional[:class:`MirrorPool`]
+        The shared pool of ``api_bases``, if given.
+    media_mirrors: Optional[:class:`MirrorPool`]
+        The shared pool of ``media_bases``, if given.
+    retry_policy: :class:`RetryPolicy`
+        The shared default retry policy.
+    """
+    __slots__: Tuple[str, ...] = (
+        'session',
+        'state',
+        'http',
+        'scheduler',
+        'api_mirrors',
+        'media_mirrors',
+        'retry_policy',
+        '_locks',
+        '_global_over',
+        '_clients',
+        '_owns_session'
+    )
+    
+    def __init__(
+        self,
+        *,
+        session: Optional[ClientSession] = None,
+        connection_limit: int = 100,
+        request_concurrency: int = 16,
+        priority_aging: float = 1.0,
+        api_bases: Optional[Sequence[str]] = None,
+        media_bases: Optional[Sequence[str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        lazy: bool = False,
+        negative_cache_ttl: Optional[float] = None,
+        known_uuid_filter: bool = False,
+        store_chunk_size: Optional[int] = None,
+    ) -> None:
+        self._owns_session: bool = session is None
+        self.session: ClientSession = session or aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=connection_limit))
+        
+        # Rate limits are applied by the API per address, not per token,
+        # so the locks are shared by every attached client.
+        self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._global_over: asyncio.Event = asyncio.Event()
+        self._global_over.set()
+        self.scheduler: RequestScheduler = RequestScheduler(request_concurrency, aging=priority_aging)
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        
+        # Mirror health is a property of the mirror, not of whoever found out about it.
+        self.api_mirrors: Optional[MirrorPool] = MirrorPool(api_bases) if api_bases else None
+        self.media_mirrors: Optional[MirrorPool] = MirrorPool(media_bases) if media_bases else None
+        
+        # Models keep a reference to the state and stream media through its HTTP client.
+        # It belongs to the runtime, not to any one client, so no client's token, event
+        # handlers or settings reach another client's models, and it outlives them all.
+        self.http: HTTPClient = HTTPClient('', asyncio.get_event_loop(), _ignore_dispatch, runtime=self)
+        self.state: ConnectionState = ConnectionState(
+            dispatch=_ignore_dispatch,
+            http=self.http,
+            lazy=lazy,
+            negative_cache_ttl=negative_cache_ttl,
+            known_uuid_filter=known_uuid_filter,
+            store_chunk_size=store_chunk_size,
+        )
+        self._clients: weakref.WeakSet[HTTPClient] = weakref.WeakSet()
+        
+    def __repr__(self) -> str:
+        return f'<ValorantRuntime clients={len(self._clients)} closed={self.session.closed}>'
+    
+    @property
+    def clients(self) -> int:
+        """:class:`int`: How many clients are attached to the runtime."""
+        return len(self._clients)
+        
+    def _attach(self, http: HTTPClient) -> ConnectionState:
+        self._clients.add(http)
+        log.debug('Attached a client to the runtime, %s attached', len(self._clients))
+        return self.state
+    
+    async def close(self) -> None:
+        """|coro|
+        
+        Used to close the shared session, if the runtime created it.
+        
+        Attached clients can not make requests afterwards.
+        """
+        if self._owns_session and not self.session.closed:
+            await self.session.close()
@@ -0,0 +1,262 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import time
+import heapq
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .enums import RequestPriority
+from .profiling import Histogram
+
+log = logging.getLogger('valorant.scheduler')
+
+__all__: Tuple[str, ...] = (
+    'RequestScheduler',
+)
+
+# The priority of requests made by the current task, set with ValorantClient.priority.
+# Tasks inherit it from the task that created them.
+_current_priority: ContextVar[Optional[RequestPriority]] = ContextVar('valorant_request_priority', default=None)
+
+
+def _priority() -> RequestPriority:
+    return _current_priority.get() or RequestPriority.normal
+
+
+@contextmanager
+def _default_priority(priority: RequestPriority) -> Iterator[None]:
+    # Used by the library's own bulk work, a priority the caller set wins.
+    if _current_priority.get() is not None:
+        yield
+        return
+    
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class RequestScheduler:
+    """
+    Limits how many requests run at once and decides which waiting request goes next.
+    
+    Waiting requests are served by priority, so queued :attr:`RequestPriority.background`
+    work yields to :attr:`RequestPriority.interactive` requests. To keep lower priorities
+    from starving, a request is ranked as if it arrived ``aging`` seconds later for every
+    level below interactive: a background request that has waited ``2 * aging`` seconds
+    goes before an interactive request that has only just arrived. A request only takes
+    a slot once it holds its route's rate limit lock, and gives it back while it waits
+    to retry, so requests queued behind one route do not keep others out. ``reserved`` slots
+    are only ever given to interactive requests, so they can start at once even while
+    bulk work fills every other slot.
+    
+    Parameters
+    ----------
+    concurrency: :class:`int`
+        The most requests running at once. Defaults to ``16``. Media requests, including
+        those of :class:`AssetDownloader`, take a slot until their response headers arrive,
+        reading the body does not hold one.
+    aging: :class:`float`
+        The head start, in seconds, a request gets over the priority level below it. Defaults to ``1.0``.
+    reserved: :class:`int`
+        How many slots are kept for interactive requests. Defaults to ``1``.
+        
+    Attributes
+    ----------
+    concurrency: :class:`int`
+        The most requests running at once.
+    aging: :class:`float`
+        The head start a request gets over the priority level below it.
+    reserved: :class:`int`
+        How many slots are kept for interactive requests.
+    waits: Dict[:class:`RequestPriority`, :class:`Histogram`]
+        How long requests of each priority waited for a slot, in nanoseconds.
+    """
+    __slots__: Tuple[str, ...] = (
+        'concurrency',
+        'aging',
+        'reserved',
+        'waits',
+        '_active',
+        '_interactive',
+        '_queued',
+        '_counter'
+    )
+    
+    def __init__(self, concurrency: int = 16, *, aging: float = 1.0, reserved: int = 1) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        
+        self.concurrency: int = concurrency
+        self.aging: float = aging
+        self.reserved: int = max(0, min(reserved, concurrency - 1))
+        self.waits: Dict[RequestPriority, Histogram] = {
+            priority: Histogram(f'scheduler.wait_{priority.name}') for priority in RequestPriority
+        }
+        self._active: int = 0
+        
+        # Heaps of (rank, order, future). Interactive requests are kept apart
+        # so the reserved slots can go to them without searching the other heap.
+        self._interactive: List[Tuple[float, int, asyncio.Future]] = []
+        self._queued: List[Tuple[float, int, asyncio.Future]] = []
+        self._counter: int = 0
+        
+    def __repr__(self) -> str:
+        return f'<RequestScheduler concurrency={self.concurrency} active={self._active} queued={self.queued}>'
+    
+    @property
+    def active(self) -> int:
+        """:class:`int`: How many requests hold a slot."""
+        return self._active
+    
+    @property
+    def queued(self) -> int:
+        """:class:`int`: How many requests are waiting for a slot."""
+        return sum(not future.done() for _, _, future in self._interactive) + sum(not future.done() for _, _, future in self._queued)
+    
+    def _next(self) -> Optional[asyncio.Future]:
+        interactive, queued = self._interactive, self._queued
+        while interactive and interactive[0][2].done():
+            heapq.heappop(interactive)
+        while queued and queued[0][2].done():
+            heapq.heappop(queued)
+            
+        free = self.concurrency - self._active
+        if interactive and (not queued or free <= self.reserved or interactive[0] < queued[0]):
+            return heapq.heappop(interactive)[2]
+        if queued and free > self.reserved:
+            return heapq.heappop(queued)[2]
+        return None
+    
+    def _wake(self) -> None:
+        while self._active < self.concurrency:
+            future = self._next()
+            if future is None:
+                return
+            
+            self._active += 1
+            future.set_result(None)
+    
+    async def acquire(self, priority: Optional[RequestPriority] = None) -> None:
+        """|coro|
+        
+        Used to wait for a slot. Every call must be followed by a call to :meth:`release`.
+        
+        Parameters
+        ----------
+        priority: Optional[:class:`RequestPriority`]
+            The priority to wait with. Defaults to the one set with :meth:`ValorantClient.priority`,
+            or :attr:`RequestPriority.normal`.
+        """
+        if priority is None:
+            priority = _priority()
+            
+        interactive = priority is RequestPriority.interactive
+        free = self.concurrency - self._active
+        if free > 0 and (interactive or free > self.reserved) and not self._interactive and not self._queued:
+            self._active += 1
+            self.waits[priority].record(0)
+            return
+        
+        started = time.perf_counter_ns()
+        now = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self._counter += 1
+        if interactive:
+            heapq.heappush(self._interactive, (now, self._counter, future))
+        else:
+            heapq.heappush(self._queued, (now + priority.value * self.aging, self._counter, future))
+        
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Given a slot just as we were cancelled, hand it on.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        
+        self.waits[priority].record(time.perf_counter_ns() - started)
+        
+    def release(self) -> None:
+        """Used to give a slot back, letting the next waiting request start."""
+        self._active -= 1
+        self._wake()
+        
+    def slot(self, priority: Optional[RequestPriority] = None) -> _Slot:
+        """
+        Used to hold a slot while an ``async with`` block runs.
+        
+        .. code-block:: python3
+
+            async with scheduler.slot(valorant.RequestPriority.background):
+                ...
+        
+        Parameters
+        ----------
+        priority: Optional[:class:`RequestPriority`]
+            The priority to wait with, see :meth:`acquire`.
+        """
+        return _Slot(self, priority or _priority())
+
+
+class _Slot:
+    # A slot held by an async with block, which can be handed back while the block sleeps.
+    __slots__: Tuple[str, ...] = (
+        'scheduler',
+        'priority',
+        'held'
+    )
+    
+    def __init__(self, scheduler: RequestScheduler, priority: RequestPriority) -> None:
+        self.scheduler: RequestScheduler = scheduler
+        self.priority: RequestPriority = priority
+        self.held: bool = False
+        
+    async def __aenter__(self) -> _Slot:
+        await self.scheduler.acquire(self.priority)
+        self.held = True
+        return self
+    
+    async def __aexit__(self, *args: Any) -> None:
+        self.release()
+            
+    def release(self) -> None:
+        # Hands the slot back early, the block exiting does nothing more afterwards.
+        if self.held:
+            self.held = False
+            self.scheduler.release()
+            
+    async def sleep(self, delay: float) -> None:
+        # Other requests can run while this one waits to retry.
+        self.release()
+        await asyncio.sleep(delay)
+        await self.scheduler.acquire(self.priority)
+        self.held = True
@@ -23,11 +23,18 @@ SOFTWARE.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, Tuple, TypeVar, TypedDict, Union, Type
+import time
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, List, Sequence, Optional, Set, Tuple, TypeVar, TypedDict, Union, Type
 
+from . import profiling
 from .agent import Agent
 from .buddy import Buddy, BuddyLevel
 from .ceremony import Ceremony
+from .abc import _DEFAULT_LOCALE, _LOCALE_KEY, _answers_for, _locale_of
+from .enums import Language
+from .errors import NotFound
+from .utils import _uuid_key
 
 if TYPE_CHECKING:
     from .http import HTTPClient
@@ -36,11 +43,23 @@ if TYPE_CHECKING:
     from .types.agent import Agent as AgentPayload
     from .types.buddy import Buddy as BuddyPayload, BuddyLevel as BuddyLevelPayload
     from .types.ceremony import Ceremony as CeremonyPayload
+    from .table import CatalogueTable
+    from .version import Version
     
     
 CSO = TypeVar('CSO', bound='Union[HTTPClient, ValorantClient]')
 T = TypeVar('T')
 
+_CACHE_NAMES: Tuple[str, ...] = ('_agents', '_buddies', '_buddy_levels', '_ceremonies')
+_KIND_CACHES: Dict[str, str] = {'agent': '_agents', 'buddy': '_buddies', 'buddy_level': '_buddy_levels', 'ceremony': '_ceremonies'}
+
+
+def _language_for(locale: Optional[str]) -> Optional[Language]:
+    # The language to fetch a model in again, None meaning the API's default.
+    if locale is None:
+        return Language.all
+    return None if locale == _DEFAULT_LOCALE else Language(locale)
+
 
 # Although this is a bit hacky, it will save me from
 # writing hundreds of lines of code, all I will have to do
@@ -54,19 +73,42 @@ def cache_management_for(
 ):
     setattr(instance, var_name, {})
     
+    # Caches are keyed by the integer form of the uuid, see utils._uuid_key.
     def _get_cache(uuid: str) -> Optional[T]:
-        return getattr(instance, var_name).get(uuid)
+        return getattr(instance, var_name).get(_uuid_key(uuid))
 
     def _remove_cache(uuid: str) -> Optional[T]:
-        return getattr(instance, var_name).pop(uuid, None)
+        return getattr(instance, var_name).pop(_uuid_key(uuid), None)
+    
+    timer = f'state.store_{function_name}'
     
     def _store_cache(data) -> T:
+        if not profiling._enabled:
+            return _store(data)
+        
+        started = time.perf_counter_ns()
         try:
-            return getattr(instance, var_name)[data['uuid']]
-        except KeyError:
-            new = type(data=data, state=instance)
-            getattr(instance, var_name)[new.uuid] = new
-            return new
+            return _store(data)
+        finally:
+            profiling._record(timer, time.perf_counter_ns() - started)
+    
+    def _store(data) -> T:
+        # While a refresh is reloading, new models go to the caches it will swap in.
+        staged = instance._staged
+        cache = staged[var_name] if staged is not None else getattr(instance, var_name)
+        cached = cache.get(_uuid_key(data['uuid']))
+        if cached is not None:
+            # The cached model is kept when it can answer for the payload's language, anything
+            # else is replaced, so a model is never in another language than asked for.
+            locale = None if isinstance(data['displayName'], dict) else data.get(_LOCALE_KEY, _DEFAULT_LOCALE)
+            if _answers_for(cached, locale):
+                return cached
+        
+        new = type(data=data, state=instance)
+        cache[new._key] = new  # type: ignore
+        if staged is not None:
+            instance._reloaded[var_name].setdefault(new._key, []).append(new)
+        return new
         
     setattr(instance, f'_get_{function_name}', _get_cache)
     setattr(instance, f'_remove_{function_name}', _remove_cache)
@@ -76,11 +118,51 @@ def cache_management_for(
 class ConnectionState(Generic[CSO]):
     if TYPE_CHECKING:
         _store_agent: Callable[[AgentPayload], Agent]
+        _store_buddy: Callable[[BuddyPayload], Buddy]
         _store_buddy_level: Callable[[BuddyLevelPayload], BuddyLevel]
         _store_ceremony: Callable[[CeremonyPayload], Ceremony]
+        
+        _get_agent: Callable[[str], Optional[Agent]]
+        _get_buddy: Callable[[str], Optional[Buddy]]
+        _get_buddy_level: Callable[[str], Optional[BuddyLevel]]
+        _get_ceremony: Callable[[str], Optional[Ceremony]]
     
-    def __init__(self, dispatch: Callable[..., Any]) -> None:
+    def __init__(
+        self,
+        dispatch: Callable[..., Any],
+        http: HTTPClient,
+        *,
+        lazy: bool = False,
+        negative_cache_ttl: Optional[float] = None,
+        known_uuid_filter: bool = False,
+        store_chunk_size: Optional[int] = None,
+    ) -> None:
         self.dispatch: Callable[..., Any] = dispatch
+        self.http: HTTPClient = http
+        
+        # When lazy, models keep a reference to their payload and only build
+        # heavy sub-objects (icons, abilities, levels, etc.) on first access.
+        self.lazy: bool = lazy
+        
+        # When set, collections are built this many models at a time,
+        # yielding to the event loop in between.
+        self.store_chunk_size: Optional[int] = store_chunk_size
+        
+        # How long a 404 for a (kind, uuid) pair is remembered, and whether a full
+        # collection fetch should be used to reject uuids it did not contain.
+        self.negative_cache_ttl: Optional[float] = negative_cache_ttl
+        self.known_uuid_filter: bool = known_uuid_filter
+        self._not_found: Dict[Tuple[str, Union[int, str]], float] = {}
+        self._known_uuids: Dict[str, Set[Union[int, str]]] = {}
+        
+        # The game data version everything in the caches belongs to, if known.
+        self.version: Optional[Version] = None
+        
+        # The caches a refresh is loading into, readers keep the old ones until it succeeds,
+        # and every model it loaded, in whichever languages they were fetched in.
+        self._staged: Optional[Dict[str, Dict[int, Any]]] = None
+        self._reloaded: Dict[str, Dict[int, List[Any]]] = {}
+        self._refresh_lock: asyncio.Lock = asyncio.Lock()
         self._load_cache()
         
         cache_management_for(self, '_agents', 'agent', Agent)
@@ -89,25 +171,127 @@ class ConnectionState(Generic[CSO]):
         cache_management_for(self, '_ceremonies', 'ceremony', Ceremony)
         
     def _load_cache(self) -> None:
-        self._agents: Dict[str, Agent] = {}
-        self._buddies: Dict[str, Buddy] = {}
-        self._buddy_levels: Dict[str, BuddyLevel] = {}
+        self._agents: Dict[int, Agent] = {}
+        self._buddies: Dict[int, Buddy] = {}
+        self._buddy_levels: Dict[int, BuddyLevel] = {}
+        self._ceremonies: Dict[int, Ceremony] = {}
         
     def _clear_cache(self) -> None:
-        self._agents = {}
-        self._buddies = {}
-        self._buddy_levels = {}
-
-    def _store_buddy(self, data: BuddyPayload) -> Buddy:
+        # Cleared in place, the dictionaries may be shared through a ValorantRuntime.
+        self._agents.clear()
+        self._buddies.clear()
+        self._buddy_levels.clear()
+        self._ceremonies.clear()
+        self._not_found.clear()
+        self._known_uuids.clear()
+        
+    def _begin_reload(self) -> None:
+        self._staged = {name: {} for name in _CACHE_NAMES}
+        self._reloaded = {name: {} for name in _CACHE_NAMES}
+        
+    def _commit_reload(self, version: Version) -> None:
+        staged = self._staged
+        assert staged is not None
+        
+        for name, cache in staged.items():
+            # A model reloaded in several languages stays in the one it was cached in before.
+            reloaded = self._reloaded[name]
+            for key, old in getattr(self, name).items():
+                locale = _locale_of(old)
+                for model in reloaded.get(key, ()):
+                    if _locale_of(model) == locale:
+                        cache[key] = model
+                        break
+                    
+            setattr(self, name, cache)
+            
+        self._staged = None
+        self._reloaded = {}
+        self._not_found.clear()
+        self.version = version
+        
+    def _abort_reload(self) -> None:
+        self._staged = None
+        self._reloaded = {}
+        
+    async def _store_many(self, store: Callable[[Any], T], payloads: Sequence[Any]) -> List[T]:
+        chunk_size = self.store_chunk_size
+        if chunk_size is None or len(payloads) <= chunk_size:
+            return list(map(store, payloads))
+        
+        objects: List[T] = []
+        for start in range(0, len(payloads), chunk_size):
+            objects.extend(map(store, payloads[start:start + chunk_size]))
+            await asyncio.sleep(0)
+            
+        return objects
+        
+    def _loaded_kinds(self) -> List[Tuple[str, Optional[Language]]]:
+        # Every kind that is cached, with each language its models were fetched in.
+        loaded: List[Tuple[str, Optional[Language]]] = []
+        for kind, name in _KIND_CACHES.items():
+            locales = {_locale_of(model) for model in getattr(self, name).values()}
+            languages = sorted(map(_language_for, locales), key=lambda language: '' if language is None else language.value)
+            loaded.extend((kind, language) for language in languages)
+            
+        # Buddy levels come with their buddies.
+        buddies = {language for kind, language in loaded if kind == 'buddy'}
+        return [(kind, language) for kind, language in loaded if kind != 'buddy_level' or language not in buddies]
+        
+    def _mark_not_found(self, kind: str, uuid: str) -> None:
+        ttl = self.negative_cache_ttl
+        if ttl is None:
+            return
+        
+        now = time.monotonic()
+        if len(self._not_found) >= 1024:
+            self._not_found = {key: expires for key, expires in self._not_found.items() if expires > now}
+        
+        self._not_found[(kind, _uuid_key(uuid))] = now + ttl
+        
+    def _mark_complete(self, kind: str, models: Iterable[Any]) -> None:
+        if self.known_uuid_filter:
+            self._known_uuids[kind] = {model._key for model in models}
+        
+    def _is_unknown(self, kind: str, uuid: str) -> bool:
+        # True only when we are sure the API would answer with a 404.
+        if not self._not_found and not self._known_uuids:
+            return False
+        
+        if getattr(self, f'_get_{kind}')(uuid) is not None:
+            return False
+        
+        key = _uuid_key(uuid)
+        known = self._known_uuids.get(kind)
+        if known is not None and key not in known:
+            return True
+        
+        expires = self._not_found.get((kind, key))
+        if expires is not None:
+            if expires > time.monotonic():
+                return True
+            
+            del self._not_found[(kind, key)]
+        
+        return False
+    
+    def _check_known(self, kind: str, uuid: str) -> None:
+        if self._is_unknown(kind, uuid):
+            raise NotFound(None, None, message=f'No {kind.replace("_", " ")} with the uuid {uuid!r} exists.')
+        
+    def _table_for(self, model: Type[Any]) -> CatalogueTable:
+        caches: Dict[type, Dict[int, Any]] = {
+            Agent: self._agents,
+            Buddy: self._buddies,
+            BuddyLevel: self._buddy_levels,
+            Ceremony: self._ceremonies,
+        }
         try:
-            return self._buddies[data['uuid']]
+            cache = caches[model]
         except KeyError:
-            buddy = Buddy(data=data, state=self)
-            self._buddies[buddy.uuid] = buddy
-            
-            if buddy.levels:
-                for level in buddy.levels:
-                    if level.uuid not in self._buddy_levels:
-                        self._buddy_levels[level.uuid] = level
-
-            return buddy
\ No newline at end of file
+            raise TypeError(f'{model.__name__} is not a cached model') from None
+        
+        # Imported here so numpy is only loaded once a table is asked for.
+        from .table import CatalogueTable
+        
+        return CatalogueTable._from_models(model, list(cache.values()), version=self.version)
@@ -0,0 +1,412 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+
+from .agent import Agent
+from .buddy import Buddy, BuddyLevel
+from .ceremony import Ceremony
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    
+    from .version import Version
+    
+    Column = Union['npt.NDArray[Any]', 'StringColumn']
+
+__all__: Tuple[str, ...] = (
+    'StringColumn',
+    'CatalogueTable',
+)
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise RuntimeError('numpy is required to build catalogue tables')
+
+
+class StringColumn:
+    """
+    A dictionary encoded column of strings.
+    
+    The categories are kept sorted, so ordering by code is the same as ordering
+    by value. Missing values are stored with the code ``-1``.
+    
+    .. container:: operations
+
+        .. describe:: x == y
+
+            Returns a boolean array marking the rows equal to the string ``y``.
+            
+        .. describe:: x != y
+        
+            Returns a boolean array marking the rows not equal to the string ``y``.
+            
+        .. describe:: len(x)
+        
+            Returns the number of rows in the column.
+    
+    Attributes
+    ----------
+    codes: :class:`numpy.ndarray`
+        The ``int32`` code of every row.
+    categories: Tuple[:class:`str`, ...]
+        The distinct values of the column.
+    """
+    __slots__: Tuple[str, ...] = (
+        'codes',
+        'categories',
+        '_lookup'
+    )
+    
+    def __init__(self, codes: npt.NDArray[Any], categories: Tuple[str, ...]) -> None:
+        self.codes: npt.NDArray[Any] = codes
+        self.categories: Tuple[str, ...] = categories
+        self._lookup: Dict[str, int] = {value: index for index, value in enumerate(categories)}
+        
+    @classmethod
+    def _encode(cls, values: Sequence[Optional[str]]) -> StringColumn:
+        categories = tuple(sorted({value for value in values if value is not None}))
+        lookup = {value: index for index, value in enumerate(categories)}
+        codes = np.fromiter((-1 if value is None else lookup[value] for value in values), dtype=np.int32, count=len(values))
+        return cls(codes, categories)
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __repr__(self) -> str:
+        return f'<StringColumn rows={len(self.codes)} categories={len(self.categories)}>'
+    
+    def __eq__(self, other: object) -> npt.NDArray[np.bool_]:  # type: ignore
+        return self.codes == self._lookup.get(other, -2)  # type: ignore
+    
+    def __ne__(self, other: object) -> npt.NDArray[np.bool_]:  # type: ignore
+        return self.codes != self._lookup.get(other, -2)  # type: ignore
+    
+    __hash__ = None  # type: ignore
+    
+    def isin(self, values: Iterable[str]) -> npt.NDArray[np.bool_]:
+        """
+        Used to mark the rows whose value is one of ``values``.
+        
+        Parameters
+        ----------
+        values: Iterable[:class:`str`]
+            The values to look for.
+            
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            A boolean array with one entry per row.
+        """
+        wanted = [code for value in values if (code := self._lookup.get(value)) is not None]
+        return np.isin(self.codes, np.asarray(wanted, dtype=np.int32))
+    
+    def to_list(self) -> List[Optional[str]]:
+        """List[Optional[:class:`str`]]: Decodes the column back to Python strings."""
+        categories = self.categories
+        return [categories[code] if code >= 0 else None for code in self.codes.tolist()]
+    
+    def _take(self, indices: npt.NDArray[Any]) -> StringColumn:
+        column = self.__class__.__new__(self.__class__)
+        column.codes = self.codes[indices]
+        column.categories = self.categories
+        column._lookup = self._lookup
+        return column
+
+
+# name, kind, getter
+_Field = Tuple[str, str, Callable[[Any], Any]]
+
+
+def _fields(*spec: Tuple[str, str]) -> Tuple[_Field, ...]:
+    return tuple((name, kind, attrgetter(name)) for name, kind in spec)
+
+
+# Only plain attributes are exported so building a table never
+# materializes the lazy attributes of a model.
+_MODEL_FIELDS: Dict[type, Tuple[_Field, ...]] = {
+    Agent: _fields(
+        ('uuid', 'str'),
+        ('display_name', 'str'),
+        ('developer_name', 'str'),
+        ('asset_path', 'str'),
+        ('is_full_portrait_right_facing', 'bool'),
+        ('is_playable_character', 'bool'),
+        ('is_available_for_test', 'bool'),
+        ('is_base_content', 'bool'),
+    ),
+    Buddy: _fields(
+        ('uuid', 'str'),
+        ('display_name', 'str'),
+        ('is_hidden_if_not_owned', 'bool'),
+        ('theme_uuid', 'str'),
+        ('asset_path', 'str'),
+    ),
+    BuddyLevel: _fields(
+        ('uuid', 'str'),
+        ('charm_level', 'int'),
+        ('display_name', 'str'),
+        ('asset_path', 'str'),
+    ),
+    Ceremony: _fields(
+        ('uuid', 'str'),
+        ('display_name', 'str'),
+        ('asset_path', 'str'),
+    ),
+}
+
+
+class CatalogueTable:
+    """
+    A column oriented snapshot of cached models of one type.
+    
+    Boolean and integer fields are stored as :class:`numpy.ndarray` and strings as
+    :class:`StringColumn`. Tables are immutable, :meth:`filter` and :meth:`sort` return
+    new tables.
+    
+    .. container:: operations
+
+        .. describe:: x[name]
+
+            Returns the column with the given name.
+            
+        .. describe:: len(x)
+        
+            Returns the number of rows in the table.
+    
+    Attributes
+    ----------
+    model: Type
+        The model the rows were built from.
+    version: Optional[:class:`Version`]
+        The version of the game data the rows were built from, if it was known.
+    """
+    __slots__: Tuple[str, ...] = (
+        'model',
+        'version',
+        '_columns',
+        '_length'
+    )
+    
+    def __init__(self, model: Type[Any], columns: Dict[str, Column], *, version: Optional[Version] = None) -> None:
+        _require_numpy()
+        
+        self.model: Type[Any] = model
+        self.version: Optional[Version] = version
+        self._columns: Dict[str, Column] = columns
+        self._length: int = len(next(iter(columns.values()))) if columns else 0
+        
+    @classmethod
+    def _from_models(cls, model: Type[Any], objects: Sequence[Any], *, version: Optional[Version] = None) -> CatalogueTable:
+        _require_numpy()
+        
+        try:
+            fields = _MODEL_FIELDS[model]
+        except KeyError:
+            raise TypeError(f'No table layout for {model.__name__}') from None
+        
+        columns: Dict[str, Column] = {}
+        count = len(objects)
+        for name, kind, getter in fields:
+            values = map(getter, objects)
+            if kind == 'str':
+                columns[name] = StringColumn._encode(list(values))
+            elif kind == 'bool':
+                columns[name] = np.fromiter(values, dtype=np.bool_, count=count)
+            else:
+                columns[name] = np.fromiter(values, dtype=np.int64, count=count)
+        
+        return cls(model, columns, version=version)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __repr__(self) -> str:
+        return f'<CatalogueTable model={self.model.__name__} rows={self._length} columns={len(self._columns)}>'
+    
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+    
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Tuple[:class:`str`, ...]: The names of the columns in the table."""
+        return tuple(self._columns)
+    
+    def take(self, indices: npt.ArrayLike) -> CatalogueTable:
+        """
+        Used to build a new table from the rows at ``indices``, in that order.
+        
+        Parameters
+        ----------
+        indices: :class:`numpy.ndarray`
+            The row positions to keep.
+            
+        Returns
+        -------
+        :class:`CatalogueTable`
+            The new table.
+        """
+        indices = np.asarray(indices)
+        columns: Dict[str, Column] = {}
+        for name, column in self._columns.items():
+            columns[name] = column._take(indices) if isinstance(column, StringColumn) else column[indices]
+            
+        return self.__class__(self.model, columns, version=self.version)
+    
+    def filter(self, mask: npt.ArrayLike) -> CatalogueTable:
+        """
+        Used to keep only the rows where ``mask`` is ``True``.
+        
+        .. code-block:: python3
+
+            table = client.get_table(valorant.Agent)
+            playable = table.filter(table['is_playable_character'] & (table['display_name'] != 'Jett'))
+        
+        Parameters
+        ----------
+        mask: :class:`numpy.ndarray`
+            A boolean array with one entry per row.
+            
+        Returns
+        -------
+        :class:`CatalogueTable`
+            The filtered table.
+        """
+        return self.take(np.flatnonzero(mask))
+    
+    def sort(self, by: Union[str, Sequence[str]], *, reverse: bool = False) -> CatalogueTable:
+        """
+        Used to sort the table by one or more columns.
+        
+        Parameters
+        ----------
+        by: Union[:class:`str`, Sequence[:class:`str`]]
+            The column, or columns in order of priority, to sort by.
+        reverse: :class:`bool`
+            Whether to sort in descending order.
+            
+        Returns
+        -------
+        :class:`CatalogueTable`
+            The sorted table.
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        
+        # np.lexsort treats the last key as the primary one.
+        keys = []
+        for name in reversed(names):
+            column = self._columns[name]
+            keys.append(column.codes if isinstance(column, StringColumn) else column)
+        
+        order = np.lexsort(keys) if keys else np.arange(self._length)
+        if reverse:
+            order = order[::-1]
+            
+        return self.take(order)
+    
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Dict[:class:`str`, List[Any]]: The table as a mapping of column name to a list of Python values."""
+        return {
+            name: column.to_list() if isinstance(column, StringColumn) else column.tolist()
+            for name, column in self._columns.items()
+        }
+    
+    def to_arrow(self) -> Any:
+        """
+        Used to export the table to a :class:`pyarrow.Table`.
+        
+        Integer columns and string codes are handed to Arrow without copying. When
+        :attr:`version` is known it is stored in the schema metadata under
+        ``valorant.manifest_id`` and ``valorant.version``. Requires ``pyarrow``.
+        
+        Returns
+        -------
+        :class:`pyarrow.Table`
+            The exported table.
+        """
+        import pyarrow as pa
+        
+        arrays = []
+        for column in self._columns.values():
+            if isinstance(column, StringColumn):
+                indices = pa.array(column.codes, mask=column.codes < 0)
+                arrays.append(pa.DictionaryArray.from_arrays(indices, pa.array(column.categories, type=pa.string())))
+            else:
+                arrays.append(pa.array(column))
+                
+        metadata = None
+        if self.version is not None:
+            metadata = {'valorant.manifest_id': self.version.manifest_id, 'valorant.version': self.version.version}
+                
+        return pa.Table.from_arrays(arrays, names=list(self._columns), metadata=metadata)
+    
+    def to_parquet(self, where: Any, **kwargs: Any) -> None:
+        """
+        Used to write the table to a Parquet file. Requires ``pyarrow``.
+        
+        Parameters
+        ----------
+        where: Union[:class:`str`, :class:`os.PathLike`, file-like object]
+            Where to write the file.
+        **kwargs: Any
+            Extra keyword arguments passed to :func:`pyarrow.parquet.write_table`.
+        """
+        import pyarrow.parquet as pq
+        
+        pq.write_table(self.to_arrow(), where, **kwargs)
+    
+    def to_pandas(self) -> Any:
+        """
+        Used to export the table to a :class:`pandas.DataFrame`.
+        
+        String columns become categoricals that reuse the table's codes. Requires ``pandas``.
+        
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            The exported data frame.
+        """
+        import pandas as pd
+        
+        data = {}
+        for name, column in self._columns.items():
+            if isinstance(column, StringColumn):
+                data[name] = pd.Categorical.from_codes(column.codes, categories=list(column.categories))
+            else:
+                data[name] = column
+        
+        return pd.DataFrame(data, copy=False)
@@ -23,9 +23,12 @@ SOFTWARE.
 """
 from __future__ import annotations
 
+import re
 import time
 import asyncio
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Tuple, TypeVar, Union
+import logging
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar, Union, overload
 
 try:
     from typing import ParamSpec
@@ -39,12 +42,19 @@ except ModuleNotFoundError:
 else:
     HAS_ORJSON = True
 
+from . import profiling
+
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    
     from aiohttp import ClientResponse
 
 T = TypeVar('T')
+T_co = TypeVar('T_co', covariant=True)
 O = TypeVar('O')
 P = ParamSpec('P')
+
+log = logging.getLogger('valorant.utils')
     
     
 __all__: Tuple[str, ...] = (
@@ -52,6 +62,8 @@ __all__: Tuple[str, ...] = (
     '_from_json',
     'MISSING',
     '_mis_if_not',
+    'CachedSlotProperty',
+    'cached_slot_property',
     'add_logging',
     'json_or_text',
 )
@@ -84,14 +96,121 @@ class _MissingSentinel:
 
 MISSING: Any = _MissingSentinel()
 
+_UUID_PATTERN: re.Pattern[str] = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+
+def _uuid_key(uuid: str) -> Union[int, str]:
+    # The 128 bit integer form of a uuid, used as the internal key for caches,
+    # hashing and equality. Anything that is not a canonical uuid is its own key,
+    # a string never equals an integer so it can not collide with a real uuid.
+    # uuid.UUID() is not strict enough here, it accepts dashes anywhere, braces,
+    # a urn prefix and the underscores int() allows between digits.
+    if isinstance(uuid, str) and _UUID_PATTERN.fullmatch(uuid) is not None:
+        return int(uuid.replace('-', ''), 16)
+    
+    return uuid
+
 
 def _mis_if_not(object: T, fallback: Optional[O] = None) -> Optional[Union[O, T]]:
     return object if object is not MISSING else fallback
 
+class CachedSlotProperty(Generic[T, T_co]):
+    """
+    A :func:`property` that resolves its value once and memoizes it in a slot.
+    
+    Unlike :class:`functools.cached_property` this does not require an instance ``__dict__``,
+    so it can be used on classes that define ``__slots__``. The slot named by ``name`` must be
+    declared on the class.
+    """
+    def __init__(self, name: str, function: Callable[[T], T_co]) -> None:
+        self.name: str = name
+        self.function: Callable[[T], T_co] = function
+        self.__doc__ = getattr(function, '__doc__')
+
+    @overload
+    def __get__(self, instance: None, owner: Type[T]) -> CachedSlotProperty[T, T_co]:
+        ...
+
+    @overload
+    def __get__(self, instance: T, owner: Type[T]) -> T_co:
+        ...
+
+    def __get__(self, instance: Optional[T], owner: Type[T]) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.name)
+        except AttributeError:
+            value = self.function(instance)
+            setattr(instance, self.name, value)
+            _release_if_resolved(instance)
+            return value
+
+
+def cached_slot_property(name: str) -> Callable[[Callable[[T], T_co]], CachedSlotProperty[T, T_co]]:
+    """
+    Used to declare a lazily resolved attribute that is memoized in the slot ``name``.
+    
+    .. code-block:: python3
+
+        class Foo:
+            __slots__ = ('_data', '_cs_bar')
+            
+            @cached_slot_property('_cs_bar')
+            def bar(self) -> Bar:
+                return Bar(self._data['bar'])
+    """
+    def decorator(func: Callable[[T], T_co]) -> CachedSlotProperty[T, T_co]:
+        return CachedSlotProperty(name, func)
+
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _lazy_attributes(cls: type) -> Tuple[CachedSlotProperty[Any, Any], ...]:
+    properties: Dict[str, CachedSlotProperty[Any, Any]] = {}
+    for base in reversed(cls.__mro__):
+        for name, value in vars(base).items():
+            if isinstance(value, CachedSlotProperty) and name not in properties:
+                properties[name] = value
+                
+    return tuple(properties.values())
+
+
+def _release_if_resolved(instance: Any) -> None:
+    # The raw payload is only kept around to resolve lazy attributes, drop
+    # it once the last of them has been resolved.
+    for prop in _lazy_attributes(type(instance)):
+        if not hasattr(instance, prop.name):
+            return
+        
+    try:
+        del instance._data
+    except AttributeError:
+        pass
+
+
+def _materialize(instance: Any) -> None:
+    # Resolve every lazy attribute of the instance right away and drop the
+    # raw payload. Used when the connection state is not running in lazy mode.
+    for prop in _lazy_attributes(type(instance)):
+        if not hasattr(instance, prop.name):
+            setattr(instance, prop.name, prop.function(instance))
+            
+    try:
+        del instance._data
+    except AttributeError:
+        pass
+
+
 def add_logging(func: Callable[P, Union[Awaitable[T], T]]) -> Callable[P, Union[Awaitable[T], T]]:
     """
-    Used to add logging to a coroutine or function.
+    Used to time every call of a coroutine or function.
     
+    Each call is recorded into the histogram named after the function's module and
+    qualified name, see :func:`timers`, and logged to the ``valorant.utils`` logger
+    at the ``DEBUG`` level.
     
     .. code-block:: python3
 
@@ -111,25 +230,45 @@ def add_logging(func: Callable[P, Union[Awaitable[T], T]]) -> Callable[P, Union[
         print(result)
         >>> 3
     """
+    name = f'{func.__module__}.{func.__qualname__}'
+    
+    def _done(started: int) -> None:
+        elapsed = time.perf_counter_ns() - started
+        profiling._record(name, elapsed)
+        log.debug('%s took %.3fms', name, elapsed / 1e6)
+    
+    @wraps(func)
     async def _async_wrapped(*args: P.args, **kwargs: P.kwargs) -> Awaitable[T]:
-        start = time.time()
-        result = await func(*args, **kwargs)  # type: ignore
-        print(f'{func.__name__} took {time.time() - start:.2f} seconds')
-        
-        return result # type: ignore
+        started = time.perf_counter_ns()
+        try:
+            return await func(*args, **kwargs)  # type: ignore
+        finally:
+            _done(started)
     
+    @wraps(func)
     def _sync_wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
-        start = time.time()
-        result = func(*args, **kwargs)
-        print(f'{func.__name__} took {time.time() - start:.2f} seconds')
-        
-        return result # type: ignore
+        started = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)  # type: ignore
+        finally:
+            _done(started)
     
     return _async_wrapped if asyncio.iscoroutinefunction(func) else _sync_wrapped # type: ignore
 
-async def json_or_text(response: ClientResponse) -> Any:
+async def json_or_text(response: ClientResponse, *, executor: Optional[Executor] = None) -> Any:
     # For now, we're going to assume that the response is json
     if response.headers['Content-Type'] == 'application/json; charset=utf-8':
-        return await response.json()
+        started = time.perf_counter_ns() if profiling._enabled else 0
+        if executor is None:
+            data = await response.json()
+        else:
+            # Large bodies take tens of milliseconds to decode, keep that off the loop.
+            body = await response.read()
+            data = await asyncio.get_running_loop().run_in_executor(executor, _from_json, body)
+            
+        if started:
+            profiling._record('http.decode', time.perf_counter_ns() - started)
+            
+        return data
     
     return await response.read()
@@ -0,0 +1,108 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .types.version import Version as VersionPayload
+
+__all__: Tuple[str, ...] = (
+    'Version',
+)
+
+
+class Version:
+    """
+    Represents the version of the game data served by the API.
+    
+    The data only changes when the game is patched, so comparing versions is a
+    cheap way to know whether cached data is still current.
+    
+    .. container:: operations
+
+        .. describe:: x == y
+
+            Checks if two versions refer to the same manifest.
+
+        .. describe:: x != y
+
+            Checks if two versions do not refer to the same manifest.
+
+        .. describe:: hash(x)
+
+            Returns the version's hash.
+    
+    Attributes
+    ----------
+    manifest_id: :class:`str`
+        The ID of the game manifest.
+    branch: :class:`str`
+        The branch the game was built from.
+    version: :class:`str`
+        The game version.
+    build_version: :class:`str`
+        The build number of the game.
+    engine_version: :class:`str`
+        The version of the engine the game was built with.
+    riot_client_version: :class:`str`
+        The version of the Riot client.
+    riot_client_build: Optional[:class:`str`]
+        The build of the Riot client, if given.
+    build_date: :class:`datetime.datetime`
+        When the game was built.
+    """
+    __slots__: Tuple[str, ...] = (
+        'manifest_id',
+        'branch',
+        'version',
+        'build_version',
+        'engine_version',
+        'riot_client_version',
+        'riot_client_build',
+        'build_date'
+    )
+    
+    def __init__(self, *, data: VersionPayload) -> None:
+        self.manifest_id: str = data['manifestId']
+        self.branch: str = data['branch']
+        self.version: str = data['version']
+        self.build_version: str = data['buildVersion']
+        self.engine_version: str = data['engineVersion']
+        self.riot_client_version: str = data['riotClientVersion']
+        self.riot_client_build: Optional[str] = data.get('riotClientBuild')
+        self.build_date: datetime.datetime = datetime.datetime.fromisoformat(data['buildDate'].replace('Z', '+00:00'))
+        
+    def __repr__(self) -> str:
+        return f'<Version version={self.version!r} branch={self.branch!r} manifest_id={self.manifest_id!r}>'
+    
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Version) and other.manifest_id == self.manifest_id
+    
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+    
+    def __hash__(self) -> int:
+        return hash(self.manifest_id)
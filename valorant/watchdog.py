@@ -0,0 +1,197 @@
+"""
+MIT License
+
+Copyright (c) 2022 NextChai
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from __future__ import annotations
+
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from typing import Any, Callable, List, Optional, Tuple
+
+from .profiling import Histogram, _PACKAGE_DIRECTORY
+
+log = logging.getLogger('valorant.watchdog')
+
+__all__: Tuple[str, ...] = (
+    'LoopStall',
+    'LoopWatchdog',
+)
+
+
+class LoopStall:
+    """
+    A report of the event loop being blocked, dispatched as ``loop_stall``.
+    
+    Attributes
+    ----------
+    duration: :class:`float`
+        How much later than scheduled the watchdog's heartbeat ran, in seconds.
+    stack: List[:class:`traceback.FrameSummary`]
+        The stack of the loop's thread while it was blocked, outermost frame first.
+        Empty if the stall ended before it could be captured.
+    """
+    __slots__: Tuple[str, ...] = (
+        'duration',
+        'stack'
+    )
+    
+    def __init__(self, duration: float, stack: List[traceback.FrameSummary]) -> None:
+        self.duration: float = duration
+        self.stack: List[traceback.FrameSummary] = stack
+        
+    def __repr__(self) -> str:
+        return f'<LoopStall duration={self.duration:.3f} frame={self.frame!r}>'
+    
+    @property
+    def frame(self) -> Optional[traceback.FrameSummary]:
+        """Optional[:class:`traceback.FrameSummary`]: The innermost frame of this library in :attr:`stack`, if any."""
+        for frame in reversed(self.stack):
+            if frame.filename.startswith(_PACKAGE_DIRECTORY):
+                return frame
+        return None
+    
+    def format(self) -> str:
+        """:class:`str`: The captured stack, formatted like a traceback."""
+        return ''.join(traceback.format_list(self.stack))
+
+
+class LoopWatchdog:
+    """
+    Measures how late an event loop runs its callbacks and reports stalls.
+    
+    A heartbeat task wakes up every ``interval`` seconds and records how late it
+    woke up. A monitor thread watches the heartbeat and, once it is ``threshold``
+    seconds overdue, captures the stack of the loop's thread, so the report shows
+    what was blocking the loop rather than what ran after it. When the heartbeat
+    resumes, a :class:`LoopStall` is dispatched as ``loop_stall``.
+    
+    Use :meth:`ValorantClient.start_watchdog` to create one.
+    
+    Attributes
+    ----------
+    interval: :class:`float`
+        The time between heartbeats, in seconds.
+    threshold: :class:`float`
+        How late a heartbeat has to be to count as a stall, in seconds.
+    lag: :class:`Histogram`
+        How late every heartbeat was, in nanoseconds.
+    stalls: :class:`int`
+        How many stalls were reported.
+    """
+    __slots__: Tuple[str, ...] = (
+        'interval',
+        'threshold',
+        'lag',
+        'stalls',
+        'dispatch',
+        '_beat',
+        '_captured',
+        '_thread_id',
+        '_task',
+        '_stop',
+        '_thread'
+    )
+    
+    def __init__(self, dispatch: Callable[..., Any], *, interval: float = 0.05, threshold: float = 0.25) -> None:
+        self.interval: float = interval
+        self.threshold: float = threshold
+        self.lag: Histogram = Histogram('loop.lag')
+        self.stalls: int = 0
+        self.dispatch: Callable[..., Any] = dispatch
+        
+        self._beat: float = time.perf_counter()
+        self._captured: Optional[List[traceback.FrameSummary]] = None
+        self._thread_id: int = 0
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stop: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+    def __repr__(self) -> str:
+        return f'<LoopWatchdog threshold={self.threshold} stalls={self.stalls} running={self.is_running()}>'
+        
+    def is_running(self) -> bool:
+        """:class:`bool`: Whether the watchdog is running."""
+        return self._task is not None and not self._task.done()
+        
+    def start(self) -> None:
+        """
+        Used to start watching the running event loop.
+        
+        Raises
+        ------
+        RuntimeError
+            There is no running event loop, or the watchdog is already running.
+        """
+        if self.is_running():
+            raise RuntimeError('The watchdog is already running')
+        
+        loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._captured = None
+        self._stop.clear()
+        
+        self._task = loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._monitor, name='valorant-watchdog', daemon=True)
+        self._thread.start()
+        
+    def stop(self) -> None:
+        """Used to stop the watchdog. Its metrics are kept."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        
+    async def _heartbeat(self) -> None:
+        interval = self.interval
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            lag = max(now - last - interval, 0.0)
+            last = self._beat = now
+            
+            self.lag.record(int(lag * 1e9))
+            captured, self._captured = self._captured, None
+            if lag >= self.threshold:
+                self.stalls += 1
+                stall = LoopStall(lag, captured or [])
+                log.warning('The event loop was blocked for %.3fs, in %s', lag, stall.frame or 'unknown code')
+                self.dispatch('loop_stall', stall)
+                
+    def _monitor(self) -> None:
+        overdue = self.interval + self.threshold
+        while not self._stop.wait(min(self.interval, self.threshold) / 2):
+            if self._captured is not None or time.perf_counter() - self._beat < overdue:
+                continue
+            
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self._captured = traceback.extract_stack(frame)